@@ -23,6 +23,11 @@ from pathlib import Path
 import yaml
 from rich.console import Console
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper
+
 console = Console()
 
 
@@ -110,7 +115,9 @@ def generate_case(
         # Write YAML
         output_file = output_dir / f"{case_name}.yaml"
         with open(output_file, "w") as f:
-            yaml.dump(case_data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                case_data, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False
+            )
 
         return output_file
 
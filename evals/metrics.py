@@ -4,9 +4,14 @@ Provides consistency metrics, cross-model comparison, and statistical analysis.
 """
 
 import math
+import re
 from dataclasses import dataclass
 from typing import Any
 
+_RE_WHATIF = re.compile(r"what if[^?\n.]*[?\n.]", re.IGNORECASE)
+_RE_PUNCT = re.compile(r"[^\w\s]")
+_RE_WHITESPACE = re.compile(r"\s+")
+
 
 @dataclass
 class ConsistencyMetrics:
@@ -119,6 +124,19 @@ def calculate_consistency(
     )
 
 
+def _extract_whatifs(text: str) -> set[str]:
+    """Extract normalized 'what if' questions."""
+    # Normalize: lowercase, remove punctuation, strip whitespace
+    normalized = set()
+    for m in _RE_WHATIF.finditer(text):
+        w = m.group().lower().strip()
+        w = _RE_PUNCT.sub("", w)  # Remove punctuation
+        w = _RE_WHITESPACE.sub(" ", w)  # Normalize whitespace
+        if w:
+            normalized.add(w)
+    return normalized
+
+
 def compare_outputs(
     gremlin_output: str, baseline_output: str, case_name: str = ""
 ) -> CrossModelMetrics:
@@ -135,24 +153,8 @@ def compare_outputs(
     Returns:
         CrossModelMetrics with agreement analysis
     """
-    import re
-
-    # Extract "what if" questions from each output
-    def extract_whatifs(text: str) -> set[str]:
-        """Extract normalized 'what if' questions."""
-        whatifs = re.findall(r"what if[^?\n.]*[?\n.]", text, re.IGNORECASE)
-        # Normalize: lowercase, remove punctuation, strip whitespace
-        normalized = set()
-        for w in whatifs:
-            w = w.lower().strip()
-            w = re.sub(r"[^\w\s]", "", w)  # Remove punctuation
-            w = re.sub(r"\s+", " ", w)  # Normalize whitespace
-            if w:
-                normalized.add(w)
-        return normalized
-
-    gremlin_whatifs = extract_whatifs(gremlin_output)
-    baseline_whatifs = extract_whatifs(baseline_output)
+    gremlin_whatifs = _extract_whatifs(gremlin_output)
+    baseline_whatifs = _extract_whatifs(baseline_output)
 
     # Calculate overlap
     overlap = len(gremlin_whatifs & baseline_whatifs)
@@ -4,28 +4,67 @@
 Supports multiple LLM providers for cross-model evaluation.
 """
 
+import hashlib
 import json
+import os
 import re
 import subprocess
 import sys
+import time
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 from rich.console import Console
 from rich.table import Table
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to stdlib json
+    orjson = None
+
 # Add parent to path to import gremlin modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from gremlin.llm.base import LLMProviderError
-from gremlin.llm.factory import get_provider
+from gremlin import Gremlin, __version__
+from gremlin.core.cache import write_atomic
+from gremlin.llm.base import LLMProvider, LLMProviderError
+from gremlin.llm.factory import get_provider, resolve_model
 
 console = Console()
 
+REPO_ROOT = Path(__file__).parent.parent
+CACHE_DIR = Path(__file__).parent / ".cache"
+# Seconds before a `gremlin review` subprocess (--subprocess) is killed
+GREMLIN_TIMEOUT_SECONDS = 120
+# Seconds between polls of a Message Batches job (run_all --batch)
+BATCH_POLL_SECONDS = 10
+BASELINE_SYSTEM_PROMPT = "You are a code quality analyst focused on identifying risks."
+
+# Pattern/prompt files whose content changes what Gremlin and the agent produce
+_FINGERPRINT_DIRS = (
+    REPO_ROOT / "gremlin",
+    REPO_ROOT / "patterns",
+)
+
+# Severity/risk markers counted by EvalMetrics.from_text, fused into one
+# alternation so the output is scanned once. The markers never overlap each
+# other, so counting by matched group gives the same totals as five findalls.
+_RE_METRICS = re.compile(
+    r"(critical)|((?<!-)high(?!-))|(medium)|((?<!-)low(?!-))|(what if)"
+)
+
 
 class EvalMode(Enum):
     """Evaluation mode."""
@@ -45,6 +84,11 @@ class EvalConfig:
     model: str | None = None  # Model name (None = provider default)
     baseline_provider: str | None = None  # Baseline provider (None = same as provider)
     baseline_model: str | None = None  # Baseline model (None = provider default)
+    # Output cache (evals/.cache) - skip LLM calls for unchanged cases. Off by
+    # default: reused outputs hide the run-to-run variance the evals measure
+    use_cache: bool = False  # Read/write cached outputs
+    refresh_cache: bool = False  # Ignore cached outputs but still write new ones
+    subprocess: bool = False  # Shell out to the `gremlin` CLI instead of the Python API
 
 
 @dataclass
@@ -60,12 +104,16 @@ class EvalMetrics:
     @classmethod
     def from_text(cls, text: str) -> "EvalMetrics":
         """Extract metrics from output text."""
-        t = text.lower()
-        critical = len(re.findall(r"critical", t))
-        high = len(re.findall(r"(?<!-)high(?!-)", t))
-        medium = len(re.findall(r"medium", t))
-        low = len(re.findall(r"(?<!-)low(?!-)", t))
-        what_ifs = len(re.findall(r"what if", t))
+        return cls.from_lower(text.lower())
+
+    @classmethod
+    def from_lower(cls, text_lower: str) -> "EvalMetrics":
+        """Extract metrics from output text that is already lowercased."""
+        # counts[group] for groups 1-5: critical, high, medium, low, what if
+        counts = [0] * 6
+        for m in _RE_METRICS.finditer(text_lower):
+            counts[m.lastindex] += 1
+        critical, high, medium, low, what_ifs = counts[1:]
 
         return cls(
             critical=critical,
@@ -94,6 +142,16 @@ class EvalResult:
         return len(self.passes) / total if total > 0 else 0.0
 
 
+@lru_cache(maxsize=256)
+def _lowered_terms(terms: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    """Pair each term with its lowercase form.
+
+    Cached by term list, so re-loading the same case (or cases that share a
+    keyword list) reuses the prepared matcher input.
+    """
+    return tuple((term, term.lower()) for term in terms)
+
+
 @dataclass
 class ExpectedCriteria:
     """Expected criteria for an eval case."""
@@ -110,6 +168,13 @@ class ExpectedCriteria:
     categories: list[str] = field(default_factory=list)
     keywords: list[str] = field(default_factory=list)
     domains: list[str] = field(default_factory=list)
+    # (original, lowercased) pairs, built once per case instead of per evaluate()
+    keyword_terms: tuple[tuple[str, str], ...] = field(init=False, repr=False)
+    category_terms: tuple[tuple[str, str], ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.keyword_terms = _lowered_terms(tuple(self.keywords))
+        self.category_terms = _lowered_terms(tuple(self.categories))
 
     @classmethod
     def from_dict(cls, d: dict) -> "ExpectedCriteria":
@@ -120,9 +185,10 @@ class ExpectedCriteria:
             max_critical=d.get("max_critical"),
             max_high=d.get("max_high"),
             max_total=d.get("max_total"),
-            categories=d.get("categories", []),
-            keywords=d.get("keywords", []),
-            domains=d.get("domains", []),
+            # `or []` also covers keys present in YAML with an empty (null) value
+            categories=d.get("categories") or [],
+            keywords=d.get("keywords") or [],
+            domains=d.get("domains") or [],
         )
 
 
@@ -143,7 +209,7 @@ class EvalCase:
     @classmethod
     def from_yaml(cls, path: Path) -> "EvalCase":
         with open(path) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeLoader)
 
         inp = data.get("input", {})
         mode_str = data.get("mode", "cli").lower()
@@ -173,18 +239,38 @@ class EvalCase:
         return self.context
 
 
+def _partition_terms(
+    terms: tuple[tuple[str, str], ...], output_lower: str
+) -> tuple[list[str], list[str]]:
+    """Split (original, lowercased) terms into (found, missing) by substring match."""
+    hits: dict[str, bool] = {}
+    found, missing = [], []
+    for term, term_lower in terms:
+        hit = hits.get(term_lower)
+        if hit is None:
+            hit = hits[term_lower] = term_lower in output_lower
+        (found if hit else missing).append(term)
+    return found, missing
+
+
+def dump_result_json(result: dict) -> bytes:
+    """Serialize a result dict as indented JSON, using orjson when installed."""
+    if orjson is not None:
+        # Pass datetimes through to default=str so both encoders agree
+        option = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(result, option=option, default=str)
+    return json.dumps(result, indent=2, default=str).encode()
+
+
 def evaluate(output: str, expected: ExpectedCriteria) -> EvalResult:
     """Evaluate output against expected criteria."""
-    metrics = EvalMetrics.from_text(output)
     output_lower = output.lower()
+    metrics = EvalMetrics.from_lower(output_lower)
 
-    # Check keywords
-    kw_found = [k for k in expected.keywords if k.lower() in output_lower]
-    kw_missing = [k for k in expected.keywords if k.lower() not in output_lower]
-
-    # Check categories
-    cat_found = [c for c in expected.categories if c.lower() in output_lower]
-    cat_missing = [c for c in expected.categories if c.lower() not in output_lower]
+    # Check keywords and categories, searching the output once per distinct term
+    kw_found, kw_missing = _partition_terms(expected.keyword_terms, output_lower)
+    cat_found, cat_missing = _partition_terms(expected.category_terms, output_lower)
+    n_kw, n_cat = len(expected.keywords), len(expected.categories)
 
     # Build pass/fail list
     passes, fails = [], []
@@ -197,10 +283,10 @@ def evaluate(output: str, expected: ExpectedCriteria) -> EvalResult:
          f"High: {metrics.high} >= {expected.min_high}"),
         (metrics.total_risks >= expected.min_total,
          f"Total: {metrics.total_risks} >= {expected.min_total}"),
-        (len(kw_found) >= len(expected.keywords) / 2 if expected.keywords else True,
-         f"Keywords: {len(kw_found)}/{len(expected.keywords)}"),
-        (len(cat_found) >= len(expected.categories) / 2 if expected.categories else True,
-         f"Categories: {len(cat_found)}/{len(expected.categories)}"),
+        (len(kw_found) >= n_kw / 2 if n_kw else True,
+         f"Keywords: {len(kw_found)}/{n_kw}"),
+        (len(cat_found) >= n_cat / 2 if n_cat else True,
+         f"Categories: {len(cat_found)}/{n_cat}"),
     ]
 
     # Maximum threshold checks (negative cases - prevent over-triggering)
@@ -234,10 +320,48 @@ def evaluate(output: str, expected: ExpectedCriteria) -> EvalResult:
     )
 
 
-def run_gremlin(case: EvalCase) -> str:
+@lru_cache(maxsize=None)
+def _get_provider(provider: str, model: str | None) -> LLMProvider:
+    """Return a shared provider so its HTTP client and connection pool are reused."""
+    return get_provider(provider=provider, model=model)
+
+
+@lru_cache(maxsize=None)
+def _get_gremlin(provider: str, model: str | None, threshold: int) -> Gremlin:
+    """Return a shared Gremlin analyzer so patterns and prompts load only once."""
+    return Gremlin(provider=provider, model=model, threshold=threshold)
+
+
+def run_gremlin(case: EvalCase, config: EvalConfig | None = None) -> str:
+    """Run Gremlin and return its markdown output.
+
+    Uses the in-process Python API by default, which avoids starting a new
+    interpreter (and re-importing the package) for every case.
+
+    Args:
+        case: Eval case to run
+        config: Eval configuration; set ``subprocess`` to use the CLI instead
+
+    Returns:
+        Gremlin response text (same content as ``gremlin review --output md``)
+    """
+    config = config or EvalConfig()
+    if config.subprocess:
+        return run_gremlin_subprocess(case)
+
+    try:
+        gremlin = _get_gremlin(config.provider, config.model, case.threshold)
+        result = gremlin.analyze(
+            case.scope, context=case.resolve_context(), depth=case.depth
+        )
+        return result.raw_response
+    except Exception as e:
+        return f"Error: {e}"
+
+
+def run_gremlin_subprocess(case: EvalCase) -> str:
     """Run Gremlin CLI and return output."""
     # Use sys.executable to find gremlin in the same Python environment
-    import sys
     gremlin_path = Path(sys.executable).parent / "gremlin"
     # Use markdown output since json isn't implemented yet
     cmd = [str(gremlin_path), "review", case.scope, "--output", "md",
@@ -249,10 +373,15 @@ def run_gremlin(case: EvalCase) -> str:
         cmd.extend(["--context", case.context])
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-        return result.stdout
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, timeout=GREMLIN_TIMEOUT_SECONDS
+        )
     except (subprocess.TimeoutExpired, Exception) as e:
         return f"Error: {e}"
+    if result.returncode != 0:
+        # Surface the CLI's diagnostics; "Error" outputs are never cached
+        return f"Error: gremlin exited with {result.returncode}: {result.stderr.strip()}"
+    return result.stdout
 
 
 def run_baseline_llm(case: EvalCase, config: EvalConfig) -> str:
@@ -265,9 +394,30 @@ def run_baseline_llm(case: EvalCase, config: EvalConfig) -> str:
     Returns:
         LLM response text
     """
+    prompt = build_baseline_prompt(case)
+
+    try:
+        # Get baseline provider (or use main provider if not specified)
+        provider_name = config.baseline_provider or config.provider
+        model_name = config.baseline_model or config.model
+
+        provider = _get_provider(provider_name, model_name)
+        response = provider.complete(
+            system_prompt=BASELINE_SYSTEM_PROMPT,
+            user_message=prompt,
+        )
+        return response.text
+    except LLMProviderError as e:
+        return f"Error: {e}"
+    except Exception as e:
+        return f"Error: {e}"
+
+
+def build_baseline_prompt(case: EvalCase) -> str:
+    """Build the baseline (no Gremlin patterns) user prompt for a case."""
     context = case.resolve_context() or ""
 
-    prompt = f"""Analyze this scope for risks: {case.scope}
+    return f"""Analyze this scope for risks: {case.scope}
 
 {f"Context: {context}" if context else ""}
 
@@ -279,21 +429,80 @@ For each risk scenario:
 
 Focus on non-obvious risks. Skip generic advice."""
 
+
+def run_baseline_batch(
+    cases: list[EvalCase], config: EvalConfig
+) -> dict[tuple[int, int], str]:
+    """Run every baseline trial for many cases as one Message Batches job.
+
+    Only the Anthropic provider exposes a batches endpoint. For any other
+    provider, or if submission fails, an empty dict is returned and callers
+    fall back to one request per trial.
+
+    Args:
+        cases: Eval cases that need baseline outputs
+        config: Eval configuration with LLM provider settings
+
+    Returns:
+        Dict mapping (index into cases, zero-based trial index) to output text
+    """
+    provider_name = config.baseline_provider or config.provider
+    model_name = config.baseline_model or config.model
+
     try:
-        # Get baseline provider (or use main provider if not specified)
-        provider_name = config.baseline_provider or config.provider
-        model_name = config.baseline_model or config.model
+        provider = _get_provider(provider_name, model_name)
+        batches = provider.client.messages.batches
+    except Exception as e:
+        console.print(f"[yellow]Batch API unavailable, running serially: {e}[/yellow]")
+        return {}
+
+    requests: list[dict] = []
+    targets: dict[str, tuple[int, int]] = {}
+    for case_idx, case in enumerate(cases):
+        prompt = build_baseline_prompt(case)
+        for trial in range(config.trials):
+            if (
+                config.use_cache
+                and not config.refresh_cache
+                and (CACHE_DIR / f"{cache_key('baseline', case, config, trial)}.json").exists()
+            ):
+                continue  # Served from the output cache; no need to pay for it again
+            custom_id = f"case{case_idx}-trial{trial}"
+            targets[custom_id] = (case_idx, trial)
+            requests.append({
+                "custom_id": custom_id,
+                "params": {
+                    "model": provider.config.model,
+                    "max_tokens": provider.config.max_tokens,
+                    "temperature": provider.config.temperature,
+                    "system": BASELINE_SYSTEM_PROMPT,
+                    "messages": [{"role": "user", "content": prompt}],
+                },
+            })
+
+    if not requests:
+        return {}
 
-        provider = get_provider(provider=provider_name, model=model_name)
-        response = provider.complete(
-            system_prompt="You are a code quality analyst focused on identifying risks.",
-            user_message=prompt,
-        )
-        return response.text
-    except LLMProviderError as e:
-        return f"Error: {e}"
+    try:
+        batch = batches.create(requests=requests)
+        console.print(f"[dim]Submitted {len(requests)} baseline requests as batch {batch.id}[/dim]")
+        while batch.processing_status != "ended":
+            time.sleep(BATCH_POLL_SECONDS)
+            batch = batches.retrieve(batch.id)
+
+        outputs: dict[tuple[int, int], str] = {}
+        for entry in batches.results(batch.id):
+            if entry.custom_id not in targets:
+                continue
+            if entry.result.type == "succeeded":
+                text = entry.result.message.content[0].text
+            else:
+                text = f"Error: batch request {entry.result.type}"
+            outputs[targets[entry.custom_id]] = text
+        return outputs
     except Exception as e:
-        return f"Error: {e}"
+        console.print(f"[yellow]Batch run failed, running serially: {e}[/yellow]")
+        return {}
 
 
 def run_agent_eval(case: EvalCase, config: EvalConfig) -> str:
@@ -322,7 +531,7 @@ def run_agent_eval(case: EvalCase, config: EvalConfig) -> str:
     context = case.resolve_context() or ""
 
     # Build agent prompt with code-review patterns
-    patterns_yaml = yaml.dump(patterns, default_flow_style=False)
+    patterns_yaml = yaml.dump(patterns, Dumper=SafeDumper, default_flow_style=False)
 
     system_prompt = f"""You are Gremlin, a risk-focused code reviewer.
 
@@ -359,7 +568,7 @@ Apply the code-review patterns above. For each risk scenario:
 Focus on code-level implementation risks."""
 
     try:
-        provider = get_provider(provider=config.provider, model=config.model)
+        provider = _get_provider(config.provider, config.model)
         response = provider.complete(
             system_prompt=system_prompt,
             user_message=user_prompt,
@@ -371,6 +580,116 @@ Focus on code-level implementation risks."""
         return f"Error: {e}"
 
 
+@lru_cache(maxsize=1)
+def _source_fingerprint() -> str:
+    """Hash the gremlin package, its pattern/prompt files and this script.
+
+    Edits to the prompt builder, response parser, providers, patterns or the
+    eval prompts all invalidate cached runs.
+    """
+    digest = hashlib.sha256(__version__.encode())
+    paths = [Path(__file__)]
+    for directory in _FINGERPRINT_DIRS:
+        paths.extend(
+            path for path in sorted(directory.rglob("*")) if path.suffix in (".py", ".yaml", ".md")
+        )
+    for path in paths:
+        digest.update(str(path.relative_to(REPO_ROOT)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def cache_key(kind: str, case: EvalCase, config: EvalConfig, trial: int) -> str:
+    """Build a content-addressed cache key for one eval run.
+
+    The key covers the case input, the resolved context contents (so editing a
+    context_file invalidates it), the provider and resolved model name, the
+    gremlin version and source (see _source_fingerprint), and the trial index
+    so multi-trial runs keep sampling independent outputs.
+
+    Args:
+        kind: Which runner produced the output (gremlin, baseline, agent)
+        case: Eval case being run
+        config: Eval configuration with LLM provider settings
+        trial: Zero-based trial index
+
+    Returns:
+        Hex SHA256 digest
+    """
+    if kind == "baseline":
+        provider = config.baseline_provider or config.provider
+        model = config.baseline_model or config.model
+    else:
+        provider, model = config.provider, config.model
+
+    payload = {
+        "kind": kind,
+        "scope": case.scope,
+        "context": case.resolve_context(),
+        "depth": case.depth,
+        "threshold": case.threshold,
+        "provider": provider,
+        # None means "the default", which changes over time; key on the real name
+        "model": resolve_model(provider, model),
+        "trial": trial,
+        "source": _source_fingerprint(),
+    }
+
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def run_cached(
+    kind: str, case: EvalCase, config: EvalConfig, trial: int, run: Callable[[], str]
+) -> str:
+    """Return a cached output for this run, or execute it and store the result.
+
+    Empty and error outputs are never cached so a transient failure is retried.
+
+    Args:
+        kind: Which runner produced the output (gremlin, baseline, agent)
+        case: Eval case being run
+        config: Eval configuration (cache flags and provider settings)
+        trial: Zero-based trial index
+        run: Zero-argument callable that produces the output on a miss
+
+    Returns:
+        Output text
+    """
+    if not config.use_cache:
+        return run()
+
+    cache_file = CACHE_DIR / f"{cache_key(kind, case, config, trial)}.json"
+    if not config.refresh_cache and cache_file.exists():
+        try:
+            return json.loads(cache_file.read_text())["output"]
+        except (json.JSONDecodeError, KeyError):
+            pass  # Corrupt entry - fall through and regenerate
+
+    output = run()
+    if output and not output.startswith("Error"):
+        write_atomic(cache_file, json.dumps({"kind": kind, "output": output}).encode())
+    return output
+
+
+def run_concurrently(first: Callable[[], str], second: Callable[[], str]) -> tuple[str, str]:
+    """Run two independent eval branches at the same time.
+
+    Both branches are network/subprocess bound, so overlapping them makes a
+    trial take max(a, b) instead of a + b.
+
+    Args:
+        first: Zero-argument callable producing the first output
+        second: Zero-argument callable producing the second output
+
+    Returns:
+        Tuple of (first_output, second_output)
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first_future = executor.submit(first)
+        second_future = executor.submit(second)
+        return first_future.result(), second_future.result()
+
+
 def run_combined_eval(case: EvalCase, config: EvalConfig) -> tuple[str, str]:
     """Run combined CLI + Agent evaluation.
 
@@ -381,9 +700,10 @@ def run_combined_eval(case: EvalCase, config: EvalConfig) -> tuple[str, str]:
     Returns:
         Tuple of (cli_output, agent_output) which can be merged for analysis
     """
-    cli_output = run_gremlin(case)
-    agent_output = run_agent_eval(case, config)
-    return cli_output, agent_output
+    return run_concurrently(
+        lambda: run_gremlin(case, config),
+        lambda: run_agent_eval(case, config),
+    )
 
 
 def display_results(case: EvalCase, gremlin: EvalResult, claude: EvalResult) -> None:
@@ -489,7 +809,10 @@ def display_trial_metrics(metrics: dict[str, float], label: str = "Gremlin") ->
 
 
 def run_eval(
-    case_path: Path, config: EvalConfig | None = None, save: bool = True
+    case_path: Path,
+    config: EvalConfig | None = None,
+    save: bool = True,
+    baseline_outputs: dict[int, str] | None = None,
 ) -> dict:
     """Run a single eval case with mode support and multiple trials.
 
@@ -497,12 +820,20 @@ def run_eval(
         case_path: Path to the eval case YAML file
         config: Eval configuration (trials, threshold). Defaults to 3 trials.
         save: Whether to save results to disk
+        baseline_outputs: Precomputed baseline outputs by trial index (e.g. from
+            run_baseline_batch). Missing trials call the baseline LLM directly.
 
     Returns:
         Dict containing all trial results and aggregated metrics
     """
     config = config or EvalConfig()
     case = EvalCase.from_yaml(case_path)
+    baseline_outputs = baseline_outputs or {}
+
+    def run_baseline(trial: int) -> str:
+        if trial in baseline_outputs:
+            return baseline_outputs[trial]
+        return run_baseline_llm(case, config)
 
     console.print(f"\n[bold cyan]Running eval:[/bold cyan] {case.name}")
     console.print(f"[dim]{case.description}[/dim]")
@@ -518,11 +849,17 @@ def run_eval(
 
         if case.mode == EvalMode.AGENT:
             # Agent-only mode
-            console.print("[yellow]Running Agent (code-review patterns)...[/yellow]")
-            agent_output = run_agent_eval(case, config)
-
-            console.print("[yellow]Running baseline LLM...[/yellow]")
-            claude_output = run_baseline_llm(case, config)
+            console.print(
+                "[yellow]Running Agent (code-review patterns) + baseline LLM...[/yellow]"
+            )
+            agent_output, claude_output = run_concurrently(
+                lambda: run_cached(
+                    "agent", case, config, trial_num, lambda: run_agent_eval(case, config)
+                ),
+                lambda: run_cached(
+                    "baseline", case, config, trial_num, lambda: run_baseline(trial_num)
+                ),
+            )
 
             agent_eval = evaluate(agent_output, case.expected)
             claude_eval = evaluate(claude_output, case.expected)
@@ -543,11 +880,17 @@ def run_eval(
 
         elif case.mode == EvalMode.COMBINED:
             # Combined CLI + Agent mode
-            console.print("[yellow]Running Gremlin CLI (feature patterns)...[/yellow]")
-            cli_output = run_gremlin(case)
-
-            console.print("[yellow]Running Agent (code patterns)...[/yellow]")
-            agent_output = run_agent_eval(case, config)
+            console.print(
+                "[yellow]Running Gremlin CLI (feature patterns) + Agent (code patterns)...[/yellow]"
+            )
+            cli_output, agent_output = run_concurrently(
+                lambda: run_cached(
+                    "gremlin", case, config, trial_num, lambda: run_gremlin(case, config)
+                ),
+                lambda: run_cached(
+                    "agent", case, config, trial_num, lambda: run_agent_eval(case, config)
+                ),
+            )
 
             cli_eval = evaluate(cli_output, case.expected)
             agent_eval = evaluate(agent_output, case.expected)
@@ -599,11 +942,15 @@ def run_eval(
 
         else:
             # CLI mode (default/original behavior)
-            console.print("[yellow]Running Gremlin CLI...[/yellow]")
-            gremlin_output = run_gremlin(case)
-
-            console.print("[yellow]Running baseline LLM...[/yellow]")
-            claude_output = run_baseline_llm(case, config)
+            console.print("[yellow]Running Gremlin CLI + baseline LLM...[/yellow]")
+            gremlin_output, claude_output = run_concurrently(
+                lambda: run_cached(
+                    "gremlin", case, config, trial_num, lambda: run_gremlin(case, config)
+                ),
+                lambda: run_cached(
+                    "baseline", case, config, trial_num, lambda: run_baseline(trial_num)
+                ),
+            )
 
             gremlin_eval = evaluate(gremlin_output, case.expected)
             claude_eval = evaluate(claude_output, case.expected)
@@ -662,17 +1009,53 @@ def run_eval(
         results_dir.mkdir(exist_ok=True)
         ts = datetime.now().strftime("%Y%m%d-%H%M%S")
         result_file = results_dir / f"{case.name}-{ts}.json"
-        result_file.write_text(json.dumps(result, indent=2, default=str))
+        result_file.write_bytes(dump_result_json(result))
         console.print(f"\n[dim]Saved: {result_file}[/dim]")
+        result["result_file"] = str(result_file)
 
     return result
 
 
+def summarize_result(result: dict) -> dict:
+    """Drop per-trial outputs from a run_eval() result, keeping what summaries use.
+
+    The full result (including every LLM output) stays in ``result_file``.
+    """
+    return {
+        "case": result["case"],
+        "mode": result["mode"],
+        "timestamp": result["timestamp"],
+        "gremlin_metrics": result["gremlin_metrics"],
+        "claude_metrics": result["claude_metrics"],
+        "overall_winner": result["overall_winner"],
+        "result_file": result.get("result_file"),
+    }
+
+
+def find_case_files(cases_dir: Path) -> list[Path]:
+    """Recursively find eval case YAML files, sorted by path.
+
+    Uses os.scandir, whose directory entries carry the file type, so the
+    walk doesn't need a separate stat call per entry.
+    """
+    case_files: list[Path] = []
+    pending = [cases_dir]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    pending.append(Path(entry.path))
+                elif entry.name.endswith(".yaml") and entry.is_file():
+                    case_files.append(Path(entry.path))
+    return sorted(case_files)
+
+
 def run_all(
     cases_dir: Path | None = None,
     config: EvalConfig | None = None,
     parallel: bool = False,
     max_workers: int = 5,
+    batch: bool = False,
 ) -> list[dict]:
     """Run all eval cases with multiple trials.
 
@@ -681,20 +1064,39 @@ def run_all(
         config: Eval configuration (trials, threshold)
         parallel: If True, run cases in parallel
         max_workers: Max parallel workers (default: 5)
+        batch: If True, submit all baseline LLM calls up front as a single
+            Message Batches job instead of one request per trial
 
     Returns:
-        List of result dicts for each case
+        List of summary dicts for each case (see summarize_result); full
+        per-trial outputs are in each summary's ``result_file``
     """
     config = config or EvalConfig()
     cases_dir = cases_dir or Path(__file__).parent / "cases"
     # Search recursively to include subdirectories like real-world/
-    case_files = sorted(cases_dir.glob("**/*.yaml"))
+    case_files = find_case_files(cases_dir)
 
     console.print(f"[bold]Found {len(case_files)} eval cases[/bold]")
     threshold_pct = f"{config.pass_threshold:.0%}"
     mode = f"parallel (max {max_workers} workers)" if parallel else "sequential"
     console.print(f"[dim]Config: {config.trials} trials, {threshold_pct} threshold, {mode}[/dim]\n")
 
+    # Baseline outputs per case file, keyed by trial index
+    prefetched: dict[Path, dict[int, str]] = {}
+    if batch:
+        cases = {}
+        for case_file in case_files:
+            try:
+                case = EvalCase.from_yaml(case_file)
+            except Exception:
+                continue  # Reported when the case itself runs
+            if case.mode != EvalMode.COMBINED:  # Combined mode has no baseline call
+                cases[case_file] = case
+        batched_files = list(cases)
+        outputs = run_baseline_batch(list(cases.values()), config)
+        for (case_idx, trial), text in outputs.items():
+            prefetched.setdefault(batched_files[case_idx], {})[trial] = text
+
     results = []
 
     if parallel:
@@ -702,23 +1104,30 @@ def run_all(
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit all cases
             future_to_case = {
-                executor.submit(run_eval, case_file, config): case_file
+                executor.submit(
+                    run_eval, case_file, config, baseline_outputs=prefetched.get(case_file)
+                ): case_file
                 for case_file in case_files
             }
 
-            # Collect results as they complete
+            # Collect results as they complete, then restore case order so the
+            # summary and returned list don't depend on completion timing
+            completed: dict[Path, dict] = {}
             for future in as_completed(future_to_case):
                 case_file = future_to_case[future]
                 try:
-                    result = future.result()
-                    results.append(result)
+                    completed[case_file] = summarize_result(future.result())
                 except Exception as e:
                     console.print(f"[red]Error running {case_file.name}: {e}[/red]")
+            results = [completed[cf] for cf in case_files if cf in completed]
     else:
         # Sequential execution (original behavior)
         for case_file in case_files:
             try:
-                results.append(run_eval(case_file, config=config))
+                result = run_eval(
+                    case_file, config=config, baseline_outputs=prefetched.get(case_file)
+                )
+                results.append(summarize_result(result))
             except Exception as e:
                 console.print(f"[red]Error running {case_file.name}: {e}[/red]")
 
@@ -786,10 +1195,31 @@ def main():
     )
     parser.add_argument(
         "--workers",
+        "--jobs",
         type=int,
         default=5,
         help="Max parallel workers (default: 5)",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="With --all, send baseline LLM calls through the Message Batches API",
+    )
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="Run Gremlin via the CLI subprocess instead of the Python API",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse and store outputs in evals/.cache (off by default so trials sample fresh)",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-run every case and overwrite its cached outputs (implies --cache)",
+    )
 
     args = parser.parse_args()
 
@@ -800,6 +1230,9 @@ def main():
         model=args.model,
         baseline_provider=args.baseline_provider,
         baseline_model=args.baseline_model,
+        use_cache=args.cache or args.refresh,
+        refresh_cache=args.refresh,
+        subprocess=args.subprocess,
     )
 
     if args.case:
@@ -811,7 +1244,12 @@ def main():
             sys.exit(1)
         run_eval(path, config=config, save=not args.no_save)
     elif args.all:
-        run_all(config=config, parallel=args.parallel, max_workers=args.workers)
+        run_all(
+            config=config,
+            parallel=args.parallel,
+            max_workers=args.workers,
+            batch=args.batch,
+        )
     else:
         parser.print_help()
 
@@ -1,8 +1,23 @@
 """Gremlin - Pre-Ship Risk Critic."""
 
+from typing import TYPE_CHECKING
+
 __version__ = "0.3.0"
 
 # Export main API classes for library usage
-from gremlin.api import AnalysisResult, Gremlin, Risk
+if TYPE_CHECKING:
+    from gremlin.api import AnalysisResult, Gremlin, Risk
 
 __all__ = ["Gremlin", "Risk", "AnalysisResult", "__version__"]
+
+_API_EXPORTS = frozenset({"AnalysisResult", "Gremlin", "Risk"})
+
+
+def __getattr__(name: str):
+    # The API module is imported on first use, so CLI commands that never touch
+    # it (and the daemon client) don't pay for it at startup
+    if name in _API_EXPORTS:
+        from gremlin import api
+
+        return getattr(api, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,42 +5,103 @@ integration with agent frameworks, CI/CD pipelines, and custom tools.
 """
 
 import asyncio
-import json
+import os
 import re
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
+from xml.sax.saxutils import escape, quoteattr
 
-from gremlin.core.inference import infer_domains
+from gremlin.core import llm_cache
+from gremlin.core.inference import compact_keywords, infer_domains
 from gremlin.core.patterns import (
     get_domain_keywords,
     load_all_patterns,
     select_patterns,
 )
 from gremlin.core.prompts import build_prompt, load_system_prompt
+from gremlin.core.serialization import dumps, dumps_bytes
 from gremlin.core.stages import IdeationResult, JudgmentResult, RolloutResult, UnderstandingResult
 from gremlin.core.validator import VALIDATION_SYSTEM_PROMPT, build_validation_prompt
-from gremlin.llm.factory import get_provider
+from gremlin.llm.base import LLMProvider
+from gremlin.llm.factory import get_provider, resolve_model
+
+# Default cap on concurrent analyze_async() calls per Gremlin instance;
+# override with the GREMLIN_MAX_CONCURRENCY environment variable
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Max scopes whose inferred domains each Gremlin instance remembers
+_DOMAIN_CACHE_MAX = 1024
+
+# Severity levels, most to least severe
+SEVERITY_LEVELS = ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+_HIGH_SEVERITY_LEVELS = frozenset(SEVERITY_LEVELS[:2])
+
+# Fixed JUnit XML fragments, built once instead of per test case
+_JUNIT_PROLOG = '<?xml version="1.0" encoding="UTF-8"?>'
+_JUNIT_SUITE_OPEN = '<testsuite name="Gremlin QA Analysis"'
+_JUNIT_SUITE_CLOSE = '</testsuite>'
+_JUNIT_FAILURE_CLOSE = '    </failure>\n  </testcase>'
+_JUNIT_SYSTEM_OUT_OPEN = '    <system-out>\n'
+_JUNIT_SYSTEM_OUT_CLOSE = '    </system-out>\n  </testcase>'
 
 # Pre-compiled regex patterns for response parsing (avoid recompiling per call)
+# Risk section boundary: a ## or ### heading (LLM may use either level)
+_SECTION_PATTERN = re.compile(r'\n#{2,3}\s+')
 _HEADER_PATTERN = re.compile(
     r'^\s*(?:🔴|🟠|🟡|🟢)?\s*(?:\[)?(\w+)(?:\])?\s*\((\d+)%?\)',
     re.IGNORECASE
 )
-_IMPACT_PATTERN = re.compile(
-    r'-?\s*\*\*Impact:?\*\*\s*(.+)', re.IGNORECASE
-)
-_DOMAIN_PATTERN = re.compile(
-    r'-?\s*\*\*Domain:?\*\*\s*(.+)', re.IGNORECASE
+_TITLE_PATTERN = re.compile(r'\*\*(.+?)\*\*')
+# Impact and Domain fields, found in one scan of a section. The match itself
+# is just the opening "**" with the field captured in a lookahead, so fields
+# sharing a line are both found. [^\S\n] keeps a match on its own line.
+_FIELD_PATTERN = re.compile(
+    r'\*\*(?=(Impact|Domain):?\*\*[^\S\n]*(.+))', re.IGNORECASE
 )
 
 
-@dataclass
+@lru_cache(maxsize=16)
+def _get_shared_provider(provider: str, model: str) -> LLMProvider:
+    """Return a process-wide provider per (provider, model).
+
+    Gremlin instances created per request (e.g. in web handlers) then share one
+    SDK client and its HTTP connection pool instead of opening new ones. The
+    model must already be resolved (see resolve_model), so a changed
+    GREMLIN_MODEL gets its own provider instead of a stale cached one.
+    """
+    return get_provider(provider=provider, model=model)
+
+
+def _iter_sections(response_text: str) -> Iterator[str]:
+    """Yield the text after each ## / ### heading marker, one section at a time.
+
+    Same sections as re.split on _SECTION_PATTERN minus the preamble before
+    the first heading, without building the full list up front.
+    """
+    text = '\n' + response_text
+    start = None
+    for match in _SECTION_PATTERN.finditer(text):
+        if start is not None:
+            yield text[start:match.start()]
+        start = match.end()
+    if start is not None:
+        yield text[start:]
+
+
+@dataclass(slots=True)
 class Risk:
     """Structured risk finding.
 
     Attributes:
-        severity: Risk severity level (CRITICAL, HIGH, MEDIUM, LOW)
+        severity: Risk severity level (CRITICAL, HIGH, MEDIUM, LOW); upper-cased
+            on construction
         confidence: Confidence score 0-100
         scenario: The "What if..." description
         impact: Business/technical impact description
@@ -55,6 +116,11 @@ class Risk:
     domains: list[str] = field(default_factory=list)
     title: str = ""
 
+    def __post_init__(self) -> None:
+        # Normalize once so severity checks and counts compare directly
+        # instead of upper-casing on every access
+        self.severity = sys.intern(self.severity.upper())
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -69,15 +135,15 @@ class Risk:
     @property
     def is_critical(self) -> bool:
         """Check if this is a critical risk."""
-        return self.severity.upper() == "CRITICAL"
+        return self.severity == "CRITICAL"
 
     @property
     def is_high_severity(self) -> bool:
         """Check if this is high severity or above."""
-        return self.severity.upper() in ("CRITICAL", "HIGH")
+        return self.severity in _HIGH_SEVERITY_LEVELS
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Complete analysis response.
 
@@ -101,6 +167,7 @@ class AnalysisResult:
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize for JSON/API responses."""
+        counts = self.severity_counts()
         return {
             "scope": self.scope,
             "risks": [risk.to_dict() for risk in self.risks],
@@ -110,16 +177,20 @@ class AnalysisResult:
             "threshold": self.threshold,
             "summary": {
                 "total_risks": len(self.risks),
-                "critical": self.critical_count,
-                "high": self.high_count,
-                "medium": self.medium_count,
-                "low": self.low_count,
+                "critical": counts["CRITICAL"],
+                "high": counts["HIGH"],
+                "medium": counts["MEDIUM"],
+                "low": counts["LOW"],
             },
         }
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return dumps(self.to_dict())
+
+    def to_json_bytes(self) -> bytes:
+        """Convert to UTF-8 JSON bytes (skips the str decode for byte-oriented consumers)."""
+        return dumps_bytes(self.to_dict())
 
     def to_junit(self) -> str:
         """Format as JUnit XML for CI integration.
@@ -127,37 +198,44 @@ class AnalysisResult:
         Each risk becomes a test case. Critical/High risks are failures,
         Medium/Low risks are warnings (passed tests with system-out).
         """
-        test_count = len(self.risks)
-        failure_count = sum(1 for r in self.risks if r.is_high_severity)
+        counts = self.severity_counts()
+        failure_count = counts["CRITICAL"] + counts["HIGH"]
 
         xml_parts = [
-            '<?xml version="1.0" encoding="UTF-8"?>',
-            f'<testsuite name="Gremlin QA Analysis" '
-            f'tests="{test_count}" failures="{failure_count}">',
+            _JUNIT_PROLOG,
+            f'{_JUNIT_SUITE_OPEN} tests="{len(self.risks)}" failures="{failure_count}">',
         ]
 
-        for i, risk in enumerate(self.risks, 1):
-            classname = f"gremlin.{self.scope.replace(' ', '_')}"
-            testname = risk.title or f"risk_{i}"
+        # Scope, titles and LLM text can contain <, & or quotes - escape them all
+        classname = quoteattr(f"gremlin.{self.scope.replace(' ', '_')}")
 
-            xml_parts.append(f'  <testcase classname="{classname}" name="{testname}">')
+        for i, risk in enumerate(self.risks, 1):
+            testname = quoteattr(risk.title or f"risk_{i}")
+            severity = escape(risk.severity)
+            impact = escape(risk.impact)
 
+            # One string per test case; the fixed tags come from module constants
             if risk.is_high_severity:
-                xml_parts.append(f'    <failure message="{risk.severity}: {risk.scenario}">')
-                xml_parts.append(f'Severity: {risk.severity}')
-                xml_parts.append(f'Confidence: {risk.confidence}%')
-                xml_parts.append(f'Impact: {risk.impact}')
-                xml_parts.append(f'Domains: {", ".join(risk.domains)}')
-                xml_parts.append('    </failure>')
+                message = quoteattr(f"{risk.severity}: {risk.scenario}")
+                xml_parts.append(
+                    f'  <testcase classname={classname} name={testname}>\n'
+                    f'    <failure message={message}>\n'
+                    f'Severity: {severity}\n'
+                    f'Confidence: {risk.confidence}%\n'
+                    f'Impact: {impact}\n'
+                    f'Domains: {escape(", ".join(risk.domains))}\n'
+                    f'{_JUNIT_FAILURE_CLOSE}'
+                )
             else:
-                xml_parts.append('    <system-out>')
-                xml_parts.append(f'{risk.severity} ({risk.confidence}%): {risk.scenario}')
-                xml_parts.append(f'Impact: {risk.impact}')
-                xml_parts.append('    </system-out>')
-
-            xml_parts.append('  </testcase>')
+                xml_parts.append(
+                    f'  <testcase classname={classname} name={testname}>\n'
+                    f'{_JUNIT_SYSTEM_OUT_OPEN}'
+                    f'{severity} ({risk.confidence}%): {escape(risk.scenario)}\n'
+                    f'Impact: {impact}\n'
+                    f'{_JUNIT_SYSTEM_OUT_CLOSE}'
+                )
 
-        xml_parts.append('</testsuite>')
+        xml_parts.append(_JUNIT_SUITE_CLOSE)
         return '\n'.join(xml_parts)
 
     def format_for_llm(self) -> str:
@@ -169,49 +247,67 @@ class AnalysisResult:
         if not self.risks:
             return f"No significant risks found for: {self.scope}"
 
+        counts = self.severity_counts()
         parts = [
             f"Risk Analysis for: {self.scope}",
             f"Found {len(self.risks)} risks "
-            f"({self.critical_count} critical, {self.high_count} high)",
+            f"({counts['CRITICAL']} critical, {counts['HIGH']} high)",
             "",
         ]
 
         for risk in self.risks:
-            parts.append(f"[{risk.severity}] {risk.scenario}")
-            parts.append(f"  Impact: {risk.impact}")
             if risk.domains:
-                parts.append(f"  Domains: {', '.join(risk.domains)}")
-            parts.append("")
+                parts += (
+                    f"[{risk.severity}] {risk.scenario}\n"
+                    f"  Impact: {risk.impact}\n"
+                    f"  Domains: {', '.join(risk.domains)}",
+                    "",
+                )
+            else:
+                parts += (f"[{risk.severity}] {risk.scenario}\n  Impact: {risk.impact}", "")
 
         return "\n".join(parts)
 
     def has_critical_risks(self) -> bool:
         """Check if any critical risks were found."""
-        return any(risk.is_critical for risk in self.risks)
+        # Compare severities inline (no per-risk property call); any() stops at
+        # the first hit, which a full severity_counts() pass would not
+        return any(risk.severity == "CRITICAL" for risk in self.risks)
 
     def has_high_severity_risks(self) -> bool:
         """Check if any high severity (or above) risks were found."""
-        return any(risk.is_high_severity for risk in self.risks)
+        return any(risk.severity in _HIGH_SEVERITY_LEVELS for risk in self.risks)
+
+    def severity_counts(self) -> dict[str, int]:
+        """Count risks per severity level (CRITICAL, HIGH, MEDIUM, LOW) in one pass.
+
+        Unrecognized severities are not counted.
+        """
+        counts = dict.fromkeys(SEVERITY_LEVELS, 0)
+        for risk in self.risks:
+            if risk.severity in counts:
+                counts[risk.severity] += 1
+        return counts
 
     @property
     def critical_count(self) -> int:
         """Count of critical risks."""
-        return sum(1 for r in self.risks if r.severity.upper() == "CRITICAL")
+        return self.severity_counts()["CRITICAL"]
 
     @property
     def high_count(self) -> int:
         """Count of high severity risks."""
-        return sum(1 for r in self.risks if r.severity.upper() == "HIGH")
+        return self.severity_counts()["HIGH"]
 
     @property
     def medium_count(self) -> int:
         """Count of medium severity risks."""
-        return sum(1 for r in self.risks if r.severity.upper() == "MEDIUM")
+        return self.severity_counts()["MEDIUM"]
 
     @property
     def low_count(self) -> int:
         """Count of low severity risks."""
-        return sum(1 for r in self.risks if r.severity.upper() == "LOW")
+        return self.severity_counts()["LOW"]
 
 
 class Gremlin:
@@ -249,6 +345,9 @@ class Gremlin:
         threshold: int = 80,
         patterns_dir: Path | None = None,
         system_prompt_path: Path | None = None,
+        max_concurrency: int | None = None,
+        llm_provider: LLMProvider | None = None,
+        cache_ttl: int | None = None,
     ):
         """Initialize Gremlin analyzer.
 
@@ -258,10 +357,23 @@ class Gremlin:
             threshold: Confidence threshold 0-100 for filtering risks
             patterns_dir: Custom patterns directory (None uses built-in)
             system_prompt_path: Custom system prompt (None uses built-in)
+            max_concurrency: Max analyze_async() calls running at once (None
+                reads GREMLIN_MAX_CONCURRENCY, default 8)
+            llm_provider: Provider instance to use instead of creating one
+                from provider/model
+            cache_ttl: Reuse identical LLM responses from the on-disk response
+                cache up to this many seconds old (None calls the LLM every time)
         """
         self.provider_name = provider
         self.model_name = model
         self.threshold = threshold
+        self.max_concurrency = max_concurrency or int(
+            os.environ.get("GREMLIN_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)
+        )
+        # One semaphore per event loop (asyncio primitives are loop-bound)
+        self._limiters: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
 
         # Resolve paths to built-in resources (inside gremlin package)
         package_dir = Path(__file__).parent
@@ -273,10 +385,18 @@ class Gremlin:
         # Load patterns and system prompt once
         self._patterns = load_all_patterns(self.patterns_dir)
         self._system_prompt = load_system_prompt(self.system_prompt_path)
-        self._domain_keywords = get_domain_keywords(self._patterns)
+        self._domain_keywords = compact_keywords(get_domain_keywords(self._patterns))
 
         # Lazy-initialized LLM provider (created on first analyze() call)
-        self._provider = None
+        self._llm_provider = llm_provider
+        self.cache_ttl = cache_ttl
+        self._provider: LLMProvider | None = None
+
+        # Domains inferred per scope, so repeated scopes (CI matrix builds,
+        # agent retries) skip the keyword scan. An LRU dict rather than
+        # lru_cache over a closure, which would tie a reference cycle to self.
+        self._domains_by_scope: OrderedDict[str, tuple[str, ...]] = OrderedDict()
+        self._domains_lock = threading.Lock()
 
     def analyze(
         self,
@@ -317,8 +437,10 @@ class Gremlin:
         u = self._run_understanding(scope, context, depth)
         i = self._run_ideation(u)
         r = self._run_rollout(i)
-        j = self._run_judgment(r, validate=validate)
-        return self._build_result(j, raw_response=r.raw_response)
+        # Judge directly to Risk objects: JudgmentResult's dict form is only
+        # needed at stage boundaries (CLI stage commands, disk artifacts)
+        risks, _, _ = self._judge_risks(r, validate)
+        return self._result_from_risks(r, risks)
 
     async def analyze_async(
         self,
@@ -329,8 +451,9 @@ class Gremlin:
     ) -> AnalysisResult:
         """Analyze a scope for QA risks (asynchronous).
 
-        This method runs the analysis in a thread pool to avoid blocking
+        This method runs the analysis in a worker thread to avoid blocking
         the event loop, making it suitable for use in async agent frameworks.
+        At most ``max_concurrency`` analyses run at once; further calls wait.
 
         Args:
             scope: Feature or area to analyze
@@ -347,12 +470,73 @@ class Gremlin:
             >>> if result.has_critical_risks():
             ...     print("Critical issues found!")
         """
-        # Run synchronous analyze() in thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, lambda: self.analyze(scope, context, depth, validate)
+        async with self._limiter():
+            return await asyncio.to_thread(self.analyze, scope, context, depth, validate)
+
+    async def analyze_many_async(
+        self,
+        scopes: Iterable[str],
+        context: str | None = None,
+        depth: str = "quick",
+        validate: bool = False,
+    ) -> list[AnalysisResult]:
+        """Analyze several scopes concurrently (bounded by ``max_concurrency``).
+
+        Args:
+            scopes: Features or areas to analyze
+            context: Optional additional context shared by every scope
+            depth: Analysis depth - "quick" or "deep"
+            validate: Run a second LLM pass to filter hallucinations and duplicates
+
+        Returns:
+            AnalysisResult for each scope, in the same order as ``scopes``
+
+        Examples:
+            >>> gremlin = Gremlin()
+            >>> results = await gremlin.analyze_many_async(["checkout", "login"])
+        """
+        return list(
+            await asyncio.gather(
+                *(self.analyze_async(scope, context, depth, validate) for scope in scopes)
+            )
         )
 
+    def _limiter(self) -> asyncio.Semaphore:
+        """Return the concurrency semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        limiter = self._limiters.get(loop)
+        if limiter is None:
+            limiter = self._limiters[loop] = asyncio.Semaphore(self.max_concurrency)
+        return limiter
+
+    def _get_provider(self) -> LLMProvider:
+        """Return this instance's provider, creating the shared one on first use.
+
+        Wrapped in the response cache when cache_ttl is set.
+        """
+        if self._provider is None:
+            provider: LLMProvider = self._llm_provider or _get_shared_provider(
+                self.provider_name, resolve_model(self.provider_name, self.model_name)
+            )
+            if self.cache_ttl is not None:
+                provider = llm_cache.CachedProvider(provider, self.cache_ttl)
+            self._provider = provider
+        return self._provider
+
+    def _infer_domains(self, scope: str) -> tuple[str, ...]:
+        """Return the domains matched by scope, memoized per instance."""
+        with self._domains_lock:
+            domains = self._domains_by_scope.get(scope)
+            if domains is not None:
+                self._domains_by_scope.move_to_end(scope)
+                return domains
+        domains = tuple(infer_domains(scope, self._domain_keywords))
+        with self._domains_lock:
+            self._domains_by_scope[scope] = domains
+            if len(self._domains_by_scope) > _DOMAIN_CACHE_MAX:
+                self._domains_by_scope.popitem(last=False)
+        return domains
+
     # ------------------------------------------------------------------
     # Pipeline stage methods (internal)
     # Called sequentially by analyze(). Exposed as private to allow
@@ -364,7 +548,7 @@ class Gremlin:
     ) -> UnderstandingResult:
         """Stage 1 — Understanding: infer domains from scope keywords."""
         try:
-            matched_domains = infer_domains(scope, self._domain_keywords)
+            matched_domains = list(self._infer_domains(scope))
             return UnderstandingResult(
                 scope=scope,
                 matched_domains=matched_domains,
@@ -402,12 +586,7 @@ class Gremlin:
                 u.threshold,
                 u.context,
             )
-            if self._provider is None:
-                self._provider = get_provider(
-                    provider=self.provider_name,
-                    model=self.model_name,
-                )
-            response = self._provider.complete(full_system, user_message)
+            response = self._get_provider().complete(full_system, user_message)
             return RolloutResult(ideation=i, raw_response=response.text)
         except RuntimeError:
             raise  # Already tagged by a nested stage call
@@ -420,6 +599,18 @@ class Gremlin:
         When validate=True, a second LLM call filters hallucinations and
         duplicates. On any validation error, falls back to unvalidated risks.
         """
+        risks, validation_summary, validated = self._judge_risks(r, validate)
+        return JudgmentResult(
+            rollout=r,
+            risks=[risk.to_dict() for risk in risks],
+            validation_summary=validation_summary,
+            validated=validated,
+        )
+
+    def _judge_risks(
+        self, r: RolloutResult, validate: bool
+    ) -> tuple[list[Risk], str | None, bool]:
+        """Run the Judgment stage, returning (risks, validation_summary, validated)."""
         try:
             response_text = r.raw_response
             validation_summary: str | None = None
@@ -430,7 +621,7 @@ class Gremlin:
                     validation_prompt = build_validation_prompt(
                         r.ideation.understanding.scope, response_text
                     )
-                    validated_response = self._provider.complete(
+                    validated_response = self._get_provider().complete(
                         VALIDATION_SYSTEM_PROMPT, validation_prompt
                     )
                     response_text = validated_response.text
@@ -442,38 +633,23 @@ class Gremlin:
                     pass  # Graceful fallback to unvalidated
 
             risks = self._parse_risks(response_text, r.ideation.understanding.matched_domains)
-            return JudgmentResult(
-                rollout=r,
-                risks=[risk.to_dict() for risk in risks],
-                validation_summary=validation_summary,
-                validated=validated,
-            )
+            return risks, validation_summary, validated
         except RuntimeError:
             raise  # Already tagged
         except Exception as e:
             raise RuntimeError(f"[judgment stage] {e}") from e
 
-    def _build_result(self, j: JudgmentResult, raw_response: str) -> AnalysisResult:
-        """Construct the public AnalysisResult from a completed JudgmentResult."""
-        risks = [
-            Risk(
-                severity=d["severity"],
-                confidence=d["confidence"],
-                scenario=d["scenario"],
-                impact=d["impact"],
-                domains=d.get("domains", []),
-                title=d.get("title", ""),
-            )
-            for d in j.risks
-        ]
+    def _result_from_risks(self, r: RolloutResult, risks: list[Risk]) -> AnalysisResult:
+        """Construct the public AnalysisResult from Risk objects and their rollout."""
+        u = r.ideation.understanding
         return AnalysisResult(
-            scope=j.scope,
+            scope=u.scope,
             risks=risks,
-            matched_domains=j.matched_domains,
-            pattern_count=j.pattern_count,
-            raw_response=raw_response,
-            depth=j.depth,
-            threshold=j.threshold,
+            matched_domains=u.matched_domains,
+            pattern_count=r.ideation.pattern_count,
+            raw_response=r.raw_response,
+            depth=u.depth,
+            threshold=u.threshold,
         )
 
     def _parse_risks(self, response_text: str, domains: list[str]) -> list[Risk]:
@@ -495,12 +671,10 @@ class Gremlin:
         """
         risks = []
 
-        # Uses pre-compiled module-level _HEADER_PATTERN, _IMPACT_PATTERN, _DOMAIN_PATTERN
-
-        # Split by ## or ### headers (LLM may use either heading level)
-        sections = re.split(r'\n#{2,3}\s+', '\n' + response_text)
+        # Uses pre-compiled module-level _SECTION_PATTERN, _HEADER_PATTERN,
+        # _TITLE_PATTERN and _FIELD_PATTERN
 
-        for section in sections[1:]:  # Skip first empty section
+        for section in _iter_sections(response_text):
             section = section.strip()
             if not section:
                 continue
@@ -520,47 +694,49 @@ class Gremlin:
             except (ValueError, IndexError):
                 confidence = 50  # Default if parsing fails
 
-            # Extract title (usually in bold on line after header)
-            title = ""
-            for line in lines[1:5]:  # Check first few lines after header
-                line = line.strip()
-                if line.startswith('**') and line.endswith('**'):
-                    title = line.strip('*').strip()
-                    break
-                title_match = re.search(r'\*\*(.+?)\*\*', line)
-                if title_match:
-                    title = title_match.group(1).strip()
-                    break
-
-            # Extract scenario (starts with "What if" or in blockquote >)
-            scenario = ""
-            for line in lines:
-                line_stripped = line.strip()
-                # Check for blockquote
-                if line_stripped.startswith('>'):
-                    scenario = line_stripped[1:].strip()
+            # Extract title (usually in bold in the 4 lines after the header)
+            # and scenario (starts with "What if" or in blockquote >) in one
+            # pass, using cheap character checks before any string work
+            title: str | None = None
+            scenario: str | None = None
+            for idx, line in enumerate(lines):
+                if scenario is not None and (title is not None or idx >= 5):
                     break
-                # Check for "What if" in regular text
-                elif line_stripped.lower().startswith('what if'):
-                    scenario = line_stripped
-                    break
-
-            # Extract impact (line starting with - **Impact:**)
-            impact = ""
-            for line in lines:
-                impact_match = _IMPACT_PATTERN.search(line)
-                if impact_match:
-                    impact = impact_match.group(1).strip()
+                line = line.strip()
+                if title is None and 1 <= idx < 5 and '**' in line:
+                    if line.startswith('**') and line.endswith('**'):
+                        title = line.strip('*').strip()
+                    else:
+                        title_match = _TITLE_PATTERN.search(line)
+                        if title_match:
+                            title = title_match.group(1).strip()
+                if scenario is None:
+                    first = line[:1]
+                    if first == '>':
+                        scenario = line[1:].strip()
+                    elif first in ('w', 'W') and line[:7].lower() == 'what if':
+                        scenario = line
+            title = title or ""
+            scenario = scenario or ""
+
+            # Extract impact (- **Impact:** ...) and domains (- **Domain:** ...);
+            # the first occurrence of each field wins
+            impact: str | None = None
+            domain_text: str | None = None
+            for field_match in _FIELD_PATTERN.finditer(section):
+                if field_match.group(1)[0] in 'Ii':
+                    if impact is None:
+                        impact = field_match.group(2).strip()
+                elif domain_text is None:
+                    domain_text = field_match.group(2).strip()
+                if impact is not None and domain_text is not None:
                     break
+            impact = impact or ""
 
-            # Extract domains from text or use matched domains
+            # Use domains from text, falling back to matched domains
             risk_domains = []
-            for line in lines:
-                domain_match = _DOMAIN_PATTERN.search(line)
-                if domain_match:
-                    domain_text = domain_match.group(1).strip()
-                    risk_domains = [d.strip() for d in domain_text.split(',')]
-                    break
+            if domain_text is not None:
+                risk_domains = [d.strip() for d in domain_text.split(',')]
 
             if not risk_domains:
                 risk_domains = domains.copy()
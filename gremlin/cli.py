@@ -1,16 +1,25 @@
 """Gremlin CLI - Pre-Ship Risk Critic."""
 
+import hashlib
+import json
+import re
 import sys
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO, TypedDict
 
 import typer
 import yaml
-from rich.console import Console
-from rich.table import Table
 
 from gremlin import __version__
-from gremlin.core.inference import infer_domains
+from gremlin.core import llm_cache, serialization
+from gremlin.core.cache import write_atomic
+from gremlin.core.inference import compact_keywords, infer_domains
 from gremlin.core.patterns import (
+    YamlDumper,
     get_domain_keywords,
     load_all_patterns,
     load_patterns,
@@ -19,15 +28,68 @@ from gremlin.core.patterns import (
 )
 from gremlin.core.prompts import build_prompt, load_system_prompt
 from gremlin.core.validator import VALIDATION_SYSTEM_PROMPT, build_validation_prompt
+from gremlin.llm.base import LLMProvider, LLMResponse
 from gremlin.llm.factory import get_provider
-from gremlin.output.renderer import render_json, render_markdown, render_rich
 
-app = typer.Typer(
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+class _App(typer.Typer):
+    """The CLI app; routes commands to `gremlin daemon` when GREMLIN_DAEMON=1."""
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        # Only the console-script entry point (argv from sys.argv) is forwarded;
+        # the daemon itself runs commands via app(args=...)
+        if not args and "args" not in kwargs:
+            from gremlin import daemon as gremlin_daemon
+
+            if gremlin_daemon.enabled():
+                exit_code = gremlin_daemon.run_via_daemon(sys.argv[1:])
+                if exit_code is not None:
+                    sys.exit(exit_code)
+        return super().__call__(*args, **kwargs)
+
+
+class _ReviewOptions(TypedDict):
+    """Review settings shared by every scope of a --batch run."""
+
+    depth: str
+    threshold: int
+    validate: bool
+
+
+app = _App(
     name="gremlin",
     help="AI critic that surfaces breaking risk scenarios before they reach production",
     add_completion=False,
 )
-console = Console()
+
+
+class _LazyConsole:
+    """The CLI's rich Console, created (and rich imported) on first use.
+
+    Importing rich.console costs ~40 ms; `review -o md|json` and other
+    commands that print nothing through rich on success skip it.
+    """
+
+    def __init__(self, **options: Any) -> None:
+        self._options = options  # Passed to Console()
+        self._console: "Console | None" = None
+
+    def get(self) -> "Console":
+        """Return the real Console, for rich APIs that need one."""
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console(**self._options)
+        return self._console
+
+    def __getattr__(self, name: str):
+        return getattr(self.get(), name)
+
+
+console = _LazyConsole()
 
 # Paths to data files (inside gremlin package)
 PATTERNS_DIR = Path(__file__).parent / "patterns"
@@ -35,12 +97,25 @@ PATTERNS_PATH = PATTERNS_DIR / "breaking.yaml"
 PROMPTS_PATH = Path(__file__).parent / "prompts" / "system.md"
 INCIDENTS_DIR = PATTERNS_DIR / "incidents"
 
+# Default cap on --context read from stdin or a file (characters)
+MAX_CONTEXT_CHARS = 512_000
+_READ_CHUNK_CHARS = 64 * 1024
+
+# A run of "?" (plus one "." before it) collapses to a single "?"; one pass
+# equivalent to replacing "??+" and then ".?"
+_QUESTION_CLEANUP = re.compile(r"\.?\?+")
+
 
-def resolve_context(context: str | None) -> str | None:
+def resolve_context(context: str | None, max_chars: int = MAX_CONTEXT_CHARS) -> str | None:
     """Resolve context from string, file reference, or stdin.
 
+    Stdin and files are read incrementally; input longer than max_chars is cut
+    in the middle (keeping its head and tail) with a warning, so huge diffs
+    neither exhaust memory nor overflow the model's context window.
+
     Args:
         context: Context string, @filepath, or - for stdin
+        max_chars: Max characters of stdin/file context to keep (0 = no limit)
 
     Returns:
         Resolved context string or None
@@ -52,19 +127,46 @@ def resolve_context(context: str | None) -> str | None:
     if context == "-":
         if sys.stdin.isatty():
             return None  # No piped input
-        return sys.stdin.read().strip() or None
+        return _read_limited(sys.stdin, max_chars, "stdin").strip() or None
 
     # File reference mode
     if context.startswith("@"):
         filepath = Path(context[1:])
         if not filepath.exists():
             raise FileNotFoundError(f"Context file not found: {filepath}")
-        return filepath.read_text().strip() or None
+        with open(filepath) as f:
+            return _read_limited(f, max_chars, str(filepath)).strip() or None
 
     # Direct string mode
     return context.strip() or None
 
 
+def _read_limited(stream: TextIO, max_chars: int, source: str) -> str:
+    """Read a text stream, keeping at most max_chars (head + tail) in memory."""
+    if max_chars <= 0:
+        return stream.read()
+
+    text = stream.read(max_chars + 1)
+    if len(text) <= max_chars:
+        return text
+
+    head = text[: max_chars // 2]
+    tail_size = max_chars - len(head)
+    tail = text[len(head):][-tail_size:]
+    total = len(text)
+    while chunk := stream.read(_READ_CHUNK_CHARS):
+        total += len(chunk)
+        tail = (tail + chunk)[-tail_size:]
+
+    dropped = total - len(head) - len(tail)
+    typer.echo(
+        f"Warning: context from {source} is {total} characters; "
+        f"omitted {dropped} from the middle (limit {max_chars}, see --max-context)",
+        err=True,
+    )
+    return f"{head}\n\n[... {dropped} characters omitted ...]\n\n{tail}"
+
+
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
@@ -92,7 +194,7 @@ def main(
 
 @app.command()
 def review(
-    scope: str = typer.Argument(..., help="Feature or area to analyze"),
+    scope: str = typer.Argument(None, help="Feature or area to analyze"),
     context: str = typer.Option(
         None,
         "--context",
@@ -117,6 +219,47 @@ def review(
     validate: bool = typer.Option(
         False, "--validate", "-V", help="Run second pass to filter hallucinations"
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always call the LLM; skip the response cache"
+    ),
+    cache_ttl: int = typer.Option(
+        llm_cache.DEFAULT_TTL_SECONDS,
+        "--cache-ttl",
+        help="Max age in seconds of a reused cached response",
+    ),
+    debug: bool = typer.Option(
+        False, "--debug", help="Print token usage (including prompt-cache hits) to stderr"
+    ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help="Print the analysis as it is generated (rich and md output)",
+    ),
+    batch: Path = typer.Option(
+        None,
+        "--batch",
+        help="File of scopes to analyze, one per line (or JSONL with scope/context)",
+    ),
+    concurrency: int = typer.Option(
+        5, "--concurrency", help="Max concurrent LLM calls in --batch/--parallel mode"
+    ),
+    parallel: bool = typer.Option(
+        False,
+        "--parallel",
+        help="Analyze each matched domain (and the universal patterns) in its own "
+        "concurrent LLM request; the responses are concatenated, so overlapping risks "
+        "are only merged with --validate",
+    ),
+    output_jsonl: Path = typer.Option(
+        None,
+        "--output-jsonl",
+        help="Append --batch results here (default stdout); reruns skip finished scopes",
+    ),
+    max_context: int = typer.Option(
+        MAX_CONTEXT_CHARS,
+        "--max-context",
+        help="Max characters of stdin/@file context; longer input is cut in the middle",
+    ),
 ) -> None:
     """Analyze a feature/scope for QA risks.
 
@@ -128,10 +271,24 @@ def review(
         git diff | gremlin review "changes" --context -
         gremlin review "image upload" --patterns @my-patterns.yaml
         gremlin review "checkout" --validate  # Filter low-quality risks
+        gremlin review "checkout" --no-cache  # Force a fresh LLM call
+        gremlin review --batch scopes.txt --output-jsonl results.jsonl
     """
+    if (scope is None) == (batch is None):
+        console.print("[red]Error: Provide either a SCOPE argument or --batch FILE[/red]")
+        raise typer.Exit(1)
+    if batch is not None:
+        # Batch results are always JSON lines, one request per scope
+        for name, used in (
+            ("--stream", stream), ("--parallel", parallel), ("--output", output != "rich")
+        ):
+            if used:
+                raise typer.BadParameter("not supported with --batch", param_hint=name)
+    show_progress = output == "rich" and batch is None
+
     # Resolve context input
     try:
-        resolved_context = resolve_context(context)
+        resolved_context = resolve_context(context, max_context)
     except FileNotFoundError as e:
         console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
@@ -145,15 +302,17 @@ def review(
         raise typer.Exit(1)
 
     # Load project-level patterns (.gremlin/patterns.yaml)
+    # (EAFP: opening a missing file costs one failed stat, not exists() + load)
     project_patterns_path = Path.cwd() / ".gremlin" / "patterns.yaml"
-    if project_patterns_path.exists():
-        try:
-            project_patterns = load_patterns(project_patterns_path)
-            all_patterns = merge_patterns(all_patterns, project_patterns)
-            if output == "rich":
-                console.print("[dim]Loaded project patterns: .gremlin/patterns.yaml[/dim]")
-        except Exception as e:
-            console.print(f"[yellow]Warning: Failed to load project patterns: {e}[/yellow]")
+    try:
+        project_patterns = load_patterns(project_patterns_path)
+        all_patterns = merge_patterns(all_patterns, project_patterns)
+        if show_progress:
+            console.print("[dim]Loaded project patterns: .gremlin/patterns.yaml[/dim]")
+    except FileNotFoundError:
+        pass  # No project patterns
+    except Exception as e:
+        console.print(f"[yellow]Warning: Failed to load project patterns: {e}[/yellow]")
 
     # Load custom patterns from --patterns flag
     if patterns_file:
@@ -163,30 +322,49 @@ def review(
         else:
             patterns_path = Path(patterns_file)
 
-        if not patterns_path.exists():
-            console.print(f"[red]Error: Custom patterns file not found: {patterns_path}[/red]")
-            raise typer.Exit(1)
-
         try:
             custom_patterns = load_patterns(patterns_path)
             all_patterns = merge_patterns(all_patterns, custom_patterns)
-            if output == "rich":
+            if show_progress:
                 console.print(f"[dim]Loaded custom patterns: {patterns_path}[/dim]")
+        except FileNotFoundError:
+            console.print(f"[red]Error: Custom patterns file not found: {patterns_path}[/red]")
+            raise typer.Exit(1)
         except Exception as e:
             console.print(f"[red]Error loading custom patterns: {e}[/red]")
             raise typer.Exit(1)
 
-    # Infer domains from scope
-    domain_keywords = get_domain_keywords(all_patterns)
+    # Infer domains from scope (compacted keywords match the same domains
+    # with fewer checks; batch mode reuses them for every scope)
+    domain_keywords = compact_keywords(get_domain_keywords(all_patterns))
+
+    if batch is not None:
+        # Patterns and system prompt are loaded once and shared by every scope
+        options: _ReviewOptions = {"depth": depth, "threshold": threshold, "validate": validate}
+        analyze_one = partial(
+            _review_scope,
+            system_prompt=system_prompt,
+            all_patterns=all_patterns,
+            domain_keywords=domain_keywords,
+            use_cache=not no_cache,
+            cache_ttl=cache_ttl,
+            **options,
+        )
+        _review_batch(batch, resolved_context, options, analyze_one, concurrency, output_jsonl)
+        return
+
     matched_domains = infer_domains(scope, domain_keywords)
 
     # Select relevant patterns
     selected_patterns = select_patterns(scope, all_patterns, matched_domains)
 
-    # Build prompts
-    full_system, user_message = build_prompt(
-        system_prompt, selected_patterns, scope, depth, threshold, resolved_context
-    )
+    # Build prompts (--parallel: one per pattern group, so each pattern is
+    # still sent exactly once)
+    pattern_groups = _split_patterns(selected_patterns) if parallel else [selected_patterns]
+    prompts = [
+        build_prompt(system_prompt, group, scope, depth, threshold, resolved_context)
+        for group in pattern_groups
+    ]
 
     # Show what we're analyzing
     if output == "rich":
@@ -211,31 +389,63 @@ def review(
         console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
 
-    with console.status("[bold green]Thinking...[/bold green]", spinner="dots"):
+    # With --stream, the pass that produces the final output (validation, if
+    # enabled) is shown as it is generated instead of behind a spinner
+    streamed = stream and output in ("rich", "md")
+    stream_analysis = streamed and not validate and len(prompts) == 1
+
+    with _progress(
+        "[bold green]Thinking...[/bold green]", output, scope, stream_analysis
+    ) as on_text:
         try:
-            llm_response = provider.complete(full_system, user_message)
-            response = llm_response.text
+            llm_responses = _complete_all(
+                provider, prompts, not no_cache, cache_ttl, concurrency, on_text
+            )
+            # --parallel groups are concatenated as-is; the validation pass,
+            # if enabled, is what drops risks repeated across groups
+            response = "\n\n".join(llm_response.text for llm_response in llm_responses)
         except Exception as e:
             console.print(f"[red]Error calling LLM API: {e}[/red]")
             raise typer.Exit(1)
+    if debug:
+        for llm_response in llm_responses:
+            _print_usage("analysis", llm_response)
+    shown = stream_analysis
 
     # Optional validation pass
     if validate:
         if output == "rich":
             console.print("[dim]Running validation pass...[/dim]")
-        with console.status("[bold yellow]Validating risks...[/bold yellow]", spinner="dots"):
-            try:
+        try:
+            with _progress(
+                "[bold yellow]Validating risks...[/bold yellow]", output, scope, streamed
+            ) as on_text:
                 validation_prompt = build_validation_prompt(scope, response)
-                val_response = provider.complete(VALIDATION_SYSTEM_PROMPT, validation_prompt)
-                response = val_response.text
-            except Exception as e:
-                console.print(
-                    f"[yellow]Warning: Validation failed, using unvalidated results: {e}[/yellow]"
+                val_response = _complete_cached(
+                    provider,
+                    VALIDATION_SYSTEM_PROMPT,
+                    validation_prompt,
+                    not no_cache,
+                    cache_ttl,
+                    on_text,
                 )
+            response = val_response.text
+            shown = streamed
+            if debug:
+                _print_usage("validation", val_response)
+        except Exception as e:
+            console.print(
+                f"[yellow]Warning: Validation failed, using unvalidated results: {e}[/yellow]"
+            )
+
+    if shown:
+        return
+
+    # Render output (renderer pulls in rich.markdown; import only when needed)
+    from gremlin.output.renderer import render_json, render_markdown, render_rich
 
-    # Render output
     if output == "rich":
-        render_rich(response, scope, console)
+        render_rich(response, scope, console.get())
     elif output == "md":
         render_markdown(response)
     elif output == "json":
@@ -245,6 +455,246 @@ def review(
         raise typer.Exit(1)
 
 
+@contextmanager
+def _progress(
+    message: str, output: str, scope: str, stream: bool
+) -> Iterator[Callable[[str], None] | None]:
+    """Show progress for one LLM call.
+
+    Yields an on_text callback that renders the response as it arrives when
+    stream is set, else None while a spinner (rich output only) runs.
+    """
+    if not stream:
+        with _maybe_status(message, output == "rich"):
+            yield None
+        return
+
+    from gremlin.output.renderer import stream_markdown, stream_rich
+
+    renderer = stream_rich(scope, console.get()) if output == "rich" else stream_markdown()
+    with renderer as on_text:
+        yield on_text
+
+
+def _maybe_status(message: str, enabled: bool = True) -> AbstractContextManager:
+    """Return a spinner context, or a no-op one when it would not be seen.
+
+    The spinner repaints from a background thread; skip it when stdout is not
+    a terminal (pipes, CI logs) or when the output format is not rich.
+    """
+    if enabled and console.is_terminal:
+        return console.get().status(message, spinner="dots")
+    return nullcontext()
+
+
+def _complete_cached(
+    provider: LLMProvider,
+    system_prompt: str,
+    user_message: str,
+    use_cache: bool,
+    cache_ttl: int,
+    on_text: Callable[[str], None] | None = None,
+) -> LLMResponse:
+    """Call the LLM, reusing a cached response for identical requests.
+
+    Cache hits come back with usage=None since no tokens were spent. If
+    on_text is given, the response is streamed to it as it is generated (a
+    cached response arrives in one piece).
+    """
+    if use_cache:
+        provider = llm_cache.CachedProvider(provider, cache_ttl)
+    if on_text is None:
+        return provider.complete(system_prompt, user_message)
+    return provider.stream(system_prompt, user_message, on_text)
+
+
+def _complete_all(
+    provider: LLMProvider,
+    prompts: list[tuple[str, str]],
+    use_cache: bool,
+    cache_ttl: int,
+    concurrency: int,
+    on_text: Callable[[str], None] | None = None,
+) -> list[LLMResponse]:
+    """Complete (system, user) prompts concurrently; responses in prompt order.
+
+    A single prompt is completed on the calling thread and may be streamed to
+    on_text; with several, responses finish in any order and are not streamed.
+    """
+    if len(prompts) == 1:
+        system, user = prompts[0]
+        return [_complete_cached(provider, system, user, use_cache, cache_ttl, on_text)]
+
+    def complete(prompt: tuple[str, str]) -> LLMResponse:
+        system, user = prompt
+        return _complete_cached(provider, system, user, use_cache, cache_ttl)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(prompts)))) as pool:
+        return list(pool.map(complete, prompts))
+
+
+def _split_patterns(selected_patterns: dict) -> list[dict]:
+    """Split selected patterns into one group per domain plus one for universal ones.
+
+    Every pattern lands in exactly one group, so parallel requests don't repeat
+    the (large) universal catalog.
+    """
+    groups = []
+    if selected_patterns.get("universal"):
+        groups.append({"universal": selected_patterns["universal"], "domain": {}})
+    for domain, patterns in selected_patterns.get("domain", {}).items():
+        groups.append({"universal": [], "domain": {domain: patterns}})
+    return groups or [selected_patterns]
+
+
+def _review_scope(
+    provider: LLMProvider,
+    scope: str,
+    context: str | None,
+    *,
+    system_prompt: str,
+    all_patterns: dict,
+    domain_keywords: dict[str, list[str]],
+    depth: str,
+    threshold: int,
+    validate: bool,
+    use_cache: bool,
+    cache_ttl: int,
+) -> tuple[list[str], str]:
+    """Run the review pipeline for one scope without any console output.
+
+    Returns:
+        Tuple of (matched_domains, response_text)
+    """
+    matched_domains = infer_domains(scope, domain_keywords)
+    selected_patterns = select_patterns(scope, all_patterns, matched_domains)
+    full_system, user_message = build_prompt(
+        system_prompt, selected_patterns, scope, depth, threshold, context
+    )
+    response = _complete_cached(provider, full_system, user_message, use_cache, cache_ttl).text
+
+    if validate:
+        try:
+            validation_prompt = build_validation_prompt(scope, response)
+            response = _complete_cached(
+                provider, VALIDATION_SYSTEM_PROMPT, validation_prompt, use_cache, cache_ttl
+            ).text
+        except Exception:
+            pass  # Graceful fallback to unvalidated, as in single-scope review
+
+    return matched_domains, response
+
+
+def _read_batch_file(path: Path, default_context: str | None) -> list[tuple[str, str | None]]:
+    """Read (scope, context) pairs from a --batch file.
+
+    Each non-blank line is either a plain scope or a JSON object with
+    "scope" and optional "context". Lines starting with # are comments.
+    """
+    entries = []
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("{"):
+            item = json.loads(line)
+            entries.append((item["scope"], item.get("context", default_context)))
+        else:
+            entries.append((line, default_context))
+    return entries
+
+
+def _batch_id(scope: str, context: str | None, options: _ReviewOptions) -> str:
+    """Stable id of a batch entry, used to skip finished scopes on rerun."""
+    key = json.dumps([scope, context, options], sort_keys=True)
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+def _review_batch(
+    batch_path: Path,
+    default_context: str | None,
+    options: _ReviewOptions,
+    analyze_one: Callable[..., tuple[list[str], str]],
+    concurrency: int,
+    output_jsonl: Path | None,
+) -> None:
+    """Review every scope in a batch file concurrently, emitting one JSON line each.
+
+    Results are written as they complete. With --output-jsonl, entries whose
+    id already has a successful record in that file are skipped, so an
+    interrupted batch resumes where it stopped.
+    """
+    try:
+        entries = _read_batch_file(batch_path, default_context)
+    except (OSError, ValueError, KeyError) as e:
+        console.print(f"[red]Error reading batch file {batch_path}: {e}[/red]")
+        raise typer.Exit(1)
+
+    done: set[str] = set()
+    if output_jsonl is not None and output_jsonl.exists():
+        for line in output_jsonl.read_text().splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Partial line from an interrupted run
+            if "error" not in record:
+                done.add(record.get("id"))
+
+    pending = {}
+    for scope, context in entries:
+        entry_id = _batch_id(scope, context, options)
+        if entry_id not in done:
+            pending[entry_id] = (scope, context)
+
+    try:
+        provider = get_provider()
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    out = output_jsonl.open("a") if output_jsonl is not None else sys.stdout
+    failures = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            futures = {
+                executor.submit(analyze_one, provider, scope, context): entry_id
+                for entry_id, (scope, context) in pending.items()
+            }
+            for future in as_completed(futures):
+                entry_id = futures[future]
+                record = {"id": entry_id, "scope": pending[entry_id][0]}
+                try:
+                    matched_domains, response = future.result()
+                    record.update(matched_domains=matched_domains, response=response)
+                except Exception as e:
+                    failures += 1
+                    record["error"] = str(e)
+                out.write(json.dumps(record) + "\n")
+                out.flush()  # Checkpoint each result for resume
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if failures:
+        typer.echo(f"Error: {failures} of {len(pending)} scopes failed", err=True)
+        raise typer.Exit(1)
+
+
+def _print_usage(label: str, llm_response: LLMResponse) -> None:
+    """Print one token-usage line for --debug."""
+    usage = llm_response.usage
+    if usage is None:
+        message = f"{label}: served from response cache"
+    else:
+        message = (
+            f"{label}: input={usage.get('prompt_tokens', 0)} "
+            f"output={usage.get('completion_tokens', 0)} "
+            f"cache_read={usage.get('cache_read_input_tokens', 0)} "
+            f"cache_write={usage.get('cache_creation_input_tokens', 0)}"
+        )
+    typer.echo(f"[debug] {message}", err=True)
+
+
 @app.command()
 def patterns(
     action: str = typer.Argument("list", help="Action: list or show"),
@@ -274,6 +724,8 @@ def patterns(
 
 def _list_patterns(all_patterns: dict) -> None:
     """List all available pattern categories."""
+    from rich.table import Table
+
     # Universal categories
     console.print("\n[bold cyan]Universal Patterns[/bold cyan]")
     console.print("[dim]Applied to every analysis[/dim]\n")
@@ -294,7 +746,6 @@ def _list_patterns(all_patterns: dict) -> None:
     console.print("\n[bold green]Domain-Specific Patterns[/bold green]")
     console.print("[dim]Applied when domain is detected in scope[/dim]\n")
 
-    domain_keywords = get_domain_keywords(all_patterns)
     domain_specific = all_patterns.get("domain_specific", {})
 
     table = Table(show_header=True, header_style="bold")
@@ -304,8 +755,9 @@ def _list_patterns(all_patterns: dict) -> None:
 
     for domain, config in domain_specific.items():
         pattern_count = len(config.get("patterns", []))
-        keywords = ", ".join(domain_keywords.get(domain, [])[:4])
-        if len(domain_keywords.get(domain, [])) > 4:
+        domain_keywords = config.get("keywords", [])
+        keywords = ", ".join(domain_keywords[:4])
+        if len(domain_keywords) > 4:
             keywords += "..."
         table.add_row(domain, str(pattern_count), keywords)
 
@@ -319,15 +771,13 @@ def _show_domain_patterns(all_patterns: dict, domain: str) -> None:
     universal = all_patterns.get("universal", [])
 
     # Check if it's a universal category (case-insensitive match)
-    for item in universal:
+    categories = _universal_category_index(universal)
+    item = categories.get(domain.lower())
+    if item is not None:
         category = item.get("category", "")
-        # Match by category name (case-insensitive, handle spaces/underscores)
-        normalized = category.lower().replace(" ", "_").replace("&", "and")
-        if domain.lower() == normalized or domain.lower() == category.lower():
-            console.print(f"\n[bold cyan]Universal: {category}[/bold cyan]\n")
-            for i, pattern in enumerate(item.get("patterns", []), 1):
-                console.print(f"  {i}. {pattern}")
-            return
+        console.print(f"\n[bold cyan]Universal: {category}[/bold cyan]\n")
+        _print_numbered(item.get("patterns", []))
+        return
 
     # Check domain-specific
     if domain not in domain_specific:
@@ -345,39 +795,70 @@ def _show_domain_patterns(all_patterns: dict, domain: str) -> None:
 
     console.print(f"\n[bold green]{domain.upper()}[/bold green]")
     console.print(f"[dim]Keywords: {', '.join(keywords)}[/dim]\n")
+    _print_numbered(patterns_list)
 
-    for i, pattern in enumerate(patterns_list, 1):
-        console.print(f"  {i}. {pattern}")
+
+def _universal_category_index(universal: list[dict]) -> dict[str, dict]:
+    """Map lowercase and normalized category names to their universal entry.
+
+    Built in one pass so a lookup is a dict hit instead of re-normalizing every
+    category name. The first category claiming a name wins, as in a linear scan.
+    """
+    index: dict[str, dict] = {}
+    for item in universal:
+        category = item.get("category", "").lower()
+        # Match by category name (handle spaces/underscores and "&")
+        index.setdefault(category.replace(" ", "_").replace("&", "and"), item)
+        index.setdefault(category, item)
+    return index
+
+
+def _print_numbered(patterns_list: list[str]) -> None:
+    """Print a numbered pattern list in one write.
+
+    Pattern text is printed verbatim: markup parsing is off, so brackets in a
+    pattern are not mistaken for rich tags.
+    """
+    if patterns_list:
+        body = "\n".join(f"  {i}. {pattern}" for i, pattern in enumerate(patterns_list, 1))
+        console.print(body, markup=False, highlight=False)
 
 
 @app.command()
 def learn(
-    description: str = typer.Argument(..., help="Description of the incident/pattern"),
+    description: str = typer.Argument(None, help="Description of the incident/pattern"),
     domain: str = typer.Option(
         None, "--domain", "-d", help="Domain for this pattern (e.g., auth, files, payments)"
     ),
     source: str = typer.Option(
         None, "--source", "-s", help="Source project or incident ID"
     ),
+    from_file: Path = typer.Option(
+        None, "--from-file", "-f", help="Learn every incident in a file (one per line)"
+    ),
 ) -> None:
     """Learn a new pattern from an incident description.
 
     Examples:
         gremlin learn "Nav bar showed Login after successful auth" --domain auth --source chitram
         gremlin learn "Landscape image rotated to portrait" --domain files --source chitram
+        gremlin learn --from-file incidents.txt --source postmortems
     """
-    import re
+    if (description is None) == (from_file is None):
+        console.print("[red]Error: Provide either a DESCRIPTION or --from-file FILE[/red]")
+        raise typer.Exit(1)
 
-    # Convert description to "What if" pattern
-    desc_lower = description.lower()
-    if desc_lower.startswith("what if"):
-        pattern = description
+    if from_file is not None:
+        try:
+            lines = from_file.read_text().splitlines()
+        except OSError as e:
+            console.print(f"[red]Error reading {from_file}: {e}[/red]")
+            raise typer.Exit(1)
+        descriptions = [
+            line.strip() for line in lines if line.strip() and not line.startswith("#")
+        ]
     else:
-        # Convert statement to question form
-        pattern = f"What if {description[0].lower()}{description[1:]}?"
-        # Clean up double punctuation
-        pattern = re.sub(r"\?\?+", "?", pattern)
-        pattern = re.sub(r"\.\?", "?", pattern)
+        descriptions = [description]
 
     # Determine target file
     source_name = source or "custom"
@@ -388,19 +869,13 @@ def learn(
 
     # Load existing patterns or create new structure
     if target_file.exists():
-        with open(target_file) as f:
-            data = yaml.safe_load(f) or {}
+        # Cached per (path, mtime, size); returns a copy that is safe to mutate
+        data = load_patterns(target_file) or {}
     else:
-        data = {
-            "# Patterns learned from incidents": None,
-            "universal": [],
-            "domain_specific": {},
-        }
-        # Remove the comment key (YAML quirk)
-        data.pop("# Patterns learned from incidents", None)
         data = {"universal": [], "domain_specific": {}}
 
-    # Add pattern to appropriate section
+    # Every pattern of one invocation lands in the same list: the domain's
+    # patterns, or the universal "Incidents" category
     if domain:
         if "domain_specific" not in data:
             data["domain_specific"] = {}
@@ -409,12 +884,8 @@ def learn(
                 "keywords": [domain],
                 "patterns": [],
             }
-        patterns_list = data["domain_specific"][domain].get("patterns", [])
-        if pattern not in patterns_list:
-            patterns_list.append(pattern)
-            data["domain_specific"][domain]["patterns"] = patterns_list
+        patterns_list = data["domain_specific"][domain].setdefault("patterns", [])
     else:
-        # Add to universal patterns under "Incidents" category
         if "universal" not in data:
             data["universal"] = []
 
@@ -427,24 +898,94 @@ def learn(
         if incidents_cat is None:
             incidents_cat = {"category": "Incidents", "patterns": []}
             data["universal"].append(incidents_cat)
+        patterns_list = incidents_cat["patterns"]
+
+    # Set membership keeps bulk learning linear; the list keeps file order
+    seen = set(patterns_list)
+    added = []
+    for text in descriptions:
+        pattern = _to_what_if(text)
+        if pattern not in seen:
+            seen.add(pattern)
+            patterns_list.append(pattern)
+            added.append(pattern)
 
-        if pattern not in incidents_cat["patterns"]:
-            incidents_cat["patterns"].append(pattern)
+    rel_path = target_file.relative_to(PATTERNS_DIR.parent)
+    if not added:
+        # Nothing changed: skip re-serializing and rewriting the whole file
+        console.print(f"[dim]Pattern already in {rel_path}[/dim]")
+        return
 
     # Write back to file
     with open(target_file, "w") as f:
         # Add header comment
         f.write(f"# Patterns learned from {source_name} incidents\n")
         f.write("# Auto-generated by 'gremlin learn'\n\n")
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        yaml.dump(
+            data,
+            f,
+            Dumper=YamlDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        )
 
-    rel_path = target_file.relative_to(PATTERNS_DIR.parent)
-    console.print(f"[green]✓[/green] Added pattern to {rel_path}")
-    console.print(f"  [dim]{pattern}[/dim]")
+    if len(added) == 1:
+        console.print(f"[green]✓[/green] Added pattern to {rel_path}")
+    else:
+        console.print(f"[green]✓[/green] Added {len(added)} patterns to {rel_path}")
+    for pattern in added:
+        console.print(f"  [dim]{pattern}[/dim]")
     if domain:
         console.print(f"  [dim]Domain: {domain}[/dim]")
 
 
+def _to_what_if(description: str) -> str:
+    """Convert an incident description to "What if ...?" pattern form."""
+    if description.lower().startswith("what if"):
+        return description
+    # Convert statement to question form
+    pattern = f"What if {description[0].lower()}{description[1:]}?"
+    # Clean up double punctuation
+    return _QUESTION_CLEANUP.sub("?", pattern)
+
+
+@app.command()
+def daemon(
+    action: str = typer.Argument("status", help="Action: start, stop or status"),
+) -> None:
+    """Manage the background process that keeps Gremlin warm between commands.
+
+    With GREMLIN_DAEMON=1 set, `gremlin` commands are served by it, skipping
+    Python startup, imports, pattern loading and new HTTPS connections.
+    Commands run in-process instead when no daemon is running or when your API
+    keys or GREMLIN_* settings differ from the ones it was started with.
+
+    Examples:
+        gremlin daemon start
+        gremlin daemon status
+        gremlin daemon stop
+    """
+    from gremlin import daemon as gremlin_daemon
+
+    if action == "start":
+        if gremlin_daemon.start():
+            console.print(f"[green]✓[/green] Daemon starting on {gremlin_daemon.get_socket_path()}")
+        else:
+            console.print("[dim]Daemon already running[/dim]")
+    elif action == "stop":
+        if gremlin_daemon.stop():
+            console.print("[green]✓[/green] Daemon stopped")
+        else:
+            console.print("[dim]Daemon not running[/dim]")
+    elif action == "status":
+        state = "running" if gremlin_daemon.is_running() else "not running"
+        console.print(f"Daemon {state} ({gremlin_daemon.get_socket_path()})")
+    else:
+        console.print("[red]Usage: gremlin daemon start|stop|status[/red]")
+        raise typer.Exit(1)
+
+
 # ---------------------------------------------------------------------------
 # Pipeline stage commands (v0.3)
 # ---------------------------------------------------------------------------
@@ -472,25 +1013,20 @@ def _load_run_artifact(run_dir: Path, filename: str) -> dict:
             "[dim]Run the preceding stage first, or use a different --run-dir.[/dim]"
         )
         raise typer.Exit(1)
-    import json
-
-    return json.loads(path.read_text())
+    artifact: dict = serialization.loads(path.read_bytes())
+    return artifact
 
 
 def _write_run_artifact(run_dir: Path, filename: str, data: dict) -> None:
     """Write a JSON artifact to the run directory atomically.
 
-    Writes to a .tmp file first, then renames to the target path.
-    On POSIX systems rename() is atomic, so a partially-written artifact
-    is never visible to downstream stage commands.
-    """
-    import json
+    Writes to a per-process temp file first, then os.replace()s it onto the
+    target path, so a partially-written artifact is never visible to
+    downstream stage commands and concurrent writers never share a temp file.
 
-    run_dir.mkdir(parents=True, exist_ok=True)
-    target = run_dir / filename
-    tmp = target.with_suffix(".tmp")
-    tmp.write_text(json.dumps(data, indent=2))
-    tmp.rename(target)
+    Serialized with orjson when installed (gremlin-critic[fast]).
+    """
+    write_atomic(run_dir / filename, serialization.dumps_bytes(data))
 
 
 @app.command()
@@ -505,6 +1041,11 @@ def understand(
     run_dir: Path = typer.Option(
         _DEFAULT_RUN_DIR, "--run-dir", help="Directory for run artifacts"
     ),
+    max_context: int = typer.Option(
+        MAX_CONTEXT_CHARS,
+        "--max-context",
+        help="Max characters of stdin/@file context; longer input is cut in the middle",
+    ),
 ) -> None:
     """Stage 1 — Understand: infer domains from scope (no LLM call).
 
@@ -517,7 +1058,7 @@ def understand(
     from gremlin.api import Gremlin
 
     try:
-        resolved_context = resolve_context(context)
+        resolved_context = resolve_context(context, max_context)
     except FileNotFoundError as e:
         console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
@@ -568,6 +1109,14 @@ def rollout(
     run_dir: Path = typer.Option(
         _DEFAULT_RUN_DIR, "--run-dir", help="Directory for run artifacts"
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always call the LLM; skip the response cache"
+    ),
+    cache_ttl: int = typer.Option(
+        llm_cache.DEFAULT_TTL_SECONDS,
+        "--cache-ttl",
+        help="Max age in seconds of a reused cached response",
+    ),
 ) -> None:
     """Stage 3 — Rollout: call the LLM with the selected patterns.
 
@@ -585,8 +1134,10 @@ def rollout(
     i = IdeationResult.from_dict(d)
 
     try:
-        g = Gremlin(threshold=i.understanding.threshold)
-        with console.status("[bold green]Thinking...[/bold green]", spinner="dots"):
+        g = Gremlin(
+            threshold=i.understanding.threshold, cache_ttl=None if no_cache else cache_ttl
+        )
+        with _maybe_status("[bold green]Thinking...[/bold green]"):
             result = g._run_rollout(i)
     except Exception as e:
         console.print(f"[red]Error calling LLM API: {e}[/red]")
@@ -626,14 +1177,16 @@ def judge(
     d = _load_run_artifact(run_dir, "results.json")
     r = RolloutResult.from_dict(d)
 
-    g = Gremlin(threshold=r.ideation.understanding.threshold)
+    llm_provider = None
     if validate:
         try:
-            g._provider = get_provider()
+            llm_provider = get_provider()
         except ValueError as e:
             console.print(f"[red]Error: {e}[/red]")
             raise typer.Exit(1)
-        with console.status("[bold yellow]Validating...[/bold yellow]", spinner="dots"):
+    g = Gremlin(threshold=r.ideation.understanding.threshold, llm_provider=llm_provider)
+    if validate:
+        with _maybe_status("[bold yellow]Validating...[/bold yellow]"):
             result = g._run_judgment(r, validate=True)
     else:
         result = g._run_judgment(r, validate=False)
@@ -646,9 +1199,96 @@ def judge(
         console.print("  [dim]Validation pass applied[/dim]")
     console.print(f"  [dim]→ {run_dir}/scores.json[/dim]")
 
-    if risk_count and output in ("rich", "md"):
+    _print_risk_list(result.risks, output)
+
+
+@app.command()
+def pipeline(
+    scope: str = typer.Argument(..., help="Feature or area to analyze"),
+    context: str = typer.Option(
+        None, "--context", "-c",
+        help="Additional context: string, @filepath, or - for stdin",
+    ),
+    depth: str = typer.Option("quick", "--depth", "-d", help="Analysis depth: quick or deep"),
+    threshold: int = typer.Option(80, "--threshold", "-t", help="Confidence threshold (0-100)"),
+    validate: bool = typer.Option(
+        False, "--validate", "-V",
+        help="Run second LLM pass to filter hallucinations and duplicates",
+    ),
+    output: str = typer.Option(
+        "rich", "--output", "-o", help="Output format: rich, md, json"
+    ),
+    run_dir: Path = typer.Option(
+        _DEFAULT_RUN_DIR, "--run-dir", help="Directory for run artifacts"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always call the LLM; skip the response cache"
+    ),
+    cache_ttl: int = typer.Option(
+        llm_cache.DEFAULT_TTL_SECONDS,
+        "--cache-ttl",
+        help="Max age in seconds of a reused cached response",
+    ),
+    max_context: int = typer.Option(
+        MAX_CONTEXT_CHARS,
+        "--max-context",
+        help="Max characters of stdin/@file context; longer input is cut in the middle",
+    ),
+) -> None:
+    """Run all four stages in one process, writing every stage artifact.
+
+    Produces the same artifacts as understand, ideate, rollout and judge run
+    back to back, but one Gremlin instance (patterns, system prompt, provider)
+    serves every stage instead of each command setting them up again.
+
+    Writes: <run-dir>/understanding.json, scenarios.json, results.json, scores.json
+
+    Examples:
+        gremlin pipeline "checkout flow"
+        gremlin pipeline "auth system" --validate --run-dir /tmp/gremlin
+    """
+    from gremlin.api import Gremlin
+
+    try:
+        resolved_context = resolve_context(context, max_context)
+    except FileNotFoundError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    g = Gremlin(threshold=threshold, cache_ttl=None if no_cache else cache_ttl)
+    u = g._run_understanding(scope, resolved_context, depth)
+    _write_run_artifact(run_dir, "understanding.json", u.to_dict())
+    i = g._run_ideation(u)
+    _write_run_artifact(run_dir, "scenarios.json", i.to_dict())
+
+    try:
+        with _maybe_status("[bold green]Thinking...[/bold green]"):
+            r = g._run_rollout(i)
+    except Exception as e:
+        console.print(f"[red]Error calling LLM API: {e}[/red]")
+        raise typer.Exit(1)
+    _write_run_artifact(run_dir, "results.json", r.to_dict())
+
+    with _maybe_status("[bold yellow]Validating...[/bold yellow]", validate):
+        result = g._run_judgment(r, validate=validate)
+    _write_run_artifact(run_dir, "scores.json", result.to_dict())
+
+    risk_count = len(result.risks)
+    console.print(f"[green]✓[/green] Pipeline complete — {risk_count} risk(s)")
+    if u.matched_domains:
+        console.print(f"  Domains: {', '.join(u.matched_domains)}")
+    if result.validated:
+        console.print("  [dim]Validation pass applied[/dim]")
+    console.print(f"  [dim]→ {run_dir}/[/dim]")
+
+    _print_risk_list(result.risks, output)
+
+
+def _print_risk_list(risks: list[dict], output: str) -> None:
+    """Print one summary line per judged risk (rich and md output)."""
+    if risks and output in ("rich", "md"):
         console.print()
-        for r_dict in result.risks:
+        for r_dict in risks:
             sev = r_dict.get("severity", "RISK")
             conf = r_dict.get("confidence", 0)
             title = r_dict.get("title") or r_dict.get("scenario", "")[:60]
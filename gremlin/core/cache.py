@@ -0,0 +1,37 @@
+"""On-disk cache location and write helpers."""
+
+import os
+import threading
+from pathlib import Path
+
+
+def get_cache_dir() -> Path:
+    """Return the directory for Gremlin's on-disk caches.
+
+    Uses GREMLIN_CACHE_DIR when set, otherwise ``$XDG_CACHE_HOME/gremlin``
+    (``~/.cache/gremlin`` by default). The directory may not exist yet.
+    """
+    override = os.environ.get("GREMLIN_CACHE_DIR")
+    if override:
+        return Path(override)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    return (Path(xdg) if xdg else Path.home() / ".cache") / "gremlin"
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write bytes to path via a temp file + rename so readers never see partial data.
+
+    Args:
+        path: Destination file (parent directories are created)
+        data: Content to write
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique per thread, so concurrent writers of one path (batch/--parallel
+    # workers, eval jobs) never share a temp file
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
@@ -19,3 +19,29 @@ def infer_domains(scope: str, domain_keywords: dict[str, list[str]]) -> list[str
             matched.append(domain)
 
     return matched
+
+
+def compact_keywords(domain_keywords: dict[str, list[str]]) -> dict[str, list[str]]:
+    """Prepare domain keywords for repeated infer_domains() calls.
+
+    Lowercases and deduplicates each domain's keywords, then drops any keyword
+    that contains another keyword of the same domain: if "auth" matches a
+    scope, "authentication" adds nothing. Matching results are unchanged, but
+    each scope is checked against fewer keywords. Lowercasing also lets
+    mixed-case keywords from custom pattern files match at all, since scopes
+    are compared lowercased.
+
+    Args:
+        domain_keywords: Dict mapping domain names to keyword lists
+
+    Returns:
+        Dict mapping domain names to the reduced keyword lists
+    """
+    compacted = {}
+    for domain, keywords in domain_keywords.items():
+        unique = list(dict.fromkeys(kw.lower() for kw in keywords))
+        compacted[domain] = [
+            kw for kw in unique
+            if not any(other != kw and other in kw for other in unique)
+        ]
+    return compacted
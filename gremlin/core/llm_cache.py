@@ -0,0 +1,182 @@
+"""On-disk cache of LLM responses keyed by the exact request.
+
+Re-running an unchanged analysis (same prompts, provider and model settings)
+returns the stored response instead of paying for another API call.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from gremlin.core.cache import get_cache_dir, write_atomic
+from gremlin.llm.base import LLMConfig, LLMProvider, LLMResponse
+
+# Default lifetime of a cached response: one week
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Bounds on the response cache; put() removes the oldest entries beyond them
+MAX_ENTRIES = 500
+MAX_BYTES = 50 * 1024 * 1024
+
+
+def response_key(config: LLMConfig, system_prompt: str, user_message: str) -> str:
+    """Return the cache key for a completion request.
+
+    Covers everything that changes the response: provider, model, sampling
+    settings and both prompts.
+    """
+    parts = (
+        config.provider,
+        config.model,
+        config.max_tokens,
+        config.temperature,
+        system_prompt,
+        user_message,
+    )
+    return hashlib.sha256("\x00".join(map(str, parts)).encode()).hexdigest()
+
+
+def get(key: str, ttl: int = DEFAULT_TTL_SECONDS) -> str | None:
+    """Return the cached response text for key, or None if missing or expired.
+
+    Expired and corrupt entries are deleted.
+
+    Args:
+        key: Cache key from response_key()
+        ttl: Maximum age in seconds of a usable entry
+    """
+    path = _entry_path(key)
+    try:
+        entry = json.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        entry = {}  # Corrupt entry
+    if time.time() - entry.get("created", 0) > ttl:
+        with contextlib.suppress(OSError):
+            path.unlink()
+        return None
+    text: str | None = entry.get("text")
+    return text
+
+
+def put(key: str, text: str, model: str, ttl: int = DEFAULT_TTL_SECONDS) -> None:
+    """Store a response text under key, then prune the cache.
+
+    Write failures are ignored; the cache is an optimization only.
+
+    Args:
+        key: Cache key from response_key()
+        text: Response text
+        model: Model that produced it
+        ttl: Entries older than this are removed while pruning
+    """
+    entry = {"text": text, "model": model, "created": time.time()}
+    try:
+        write_atomic(_entry_path(key), json.dumps(entry).encode())
+    except OSError:
+        return
+    prune(ttl)
+
+
+def prune(
+    ttl: int = DEFAULT_TTL_SECONDS, max_entries: int = MAX_ENTRIES, max_bytes: int = MAX_BYTES
+) -> None:
+    """Delete expired entries, then the oldest ones beyond the count and size limits.
+
+    Cached responses are derived from diffs and source text, so the cache must
+    not grow without bound.
+    """
+    now = time.time()
+    entries = []
+    try:
+        with os.scandir(get_cache_dir() / "responses") as it:
+            for entry in it:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue  # Removed by a concurrent prune
+                if entry.name.endswith(".json"):
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                elif now - stat.st_mtime > ttl:  # Temp file left by a crashed writer
+                    with contextlib.suppress(OSError):
+                        os.unlink(entry.path)
+    except OSError:
+        return
+
+    kept = total = 0
+    for mtime, size, path in sorted(entries, reverse=True):  # Newest first
+        if now - mtime > ttl or kept >= max_entries or total + size > max_bytes:
+            with contextlib.suppress(OSError):
+                os.unlink(path)
+        else:
+            kept += 1
+            total += size
+
+
+class CachedProvider(LLMProvider):
+    """Provider wrapper that answers repeated identical requests from the cache.
+
+    Cache hits come back with usage=None since no tokens were spent. Calls with
+    per-call overrides (kwargs such as max_tokens) bypass the cache, as the
+    key covers only the provider's own config.
+    """
+
+    def __init__(self, provider: LLMProvider, ttl: int = DEFAULT_TTL_SECONDS):
+        """Wrap a provider.
+
+        Args:
+            provider: Provider that serves cache misses
+            ttl: Maximum age in seconds of a reused response
+        """
+        super().__init__(provider.config)
+        self.provider = provider
+        self.ttl = ttl
+
+    def complete(self, system_prompt: str, user_message: str, **kwargs: Any) -> LLMResponse:
+        """Return the cached response, or call the wrapped provider and store it."""
+        if kwargs:
+            return self.provider.complete(system_prompt, user_message, **kwargs)
+        return self._cached(system_prompt, user_message, None)
+
+    def stream(
+        self,
+        system_prompt: str,
+        user_message: str,
+        on_text: Callable[[str], None],
+        **kwargs: Any
+    ) -> LLMResponse:
+        """Like complete(), streaming misses; a hit reaches on_text in one piece."""
+        if kwargs:
+            return self.provider.stream(system_prompt, user_message, on_text, **kwargs)
+        return self._cached(system_prompt, user_message, on_text)
+
+    def validate_config(self) -> bool:
+        """Validate the wrapped provider's configuration."""
+        return self.provider.validate_config()
+
+    def _cached(
+        self, system_prompt: str, user_message: str, on_text: Callable[[str], None] | None
+    ) -> LLMResponse:
+        key = response_key(self.config, system_prompt, user_message)
+        text = get(key, ttl=self.ttl)
+        if text is not None:
+            if on_text is not None:
+                on_text(text)
+            return LLMResponse(text=text, model=self.config.model, provider=self.config.provider)
+
+        if on_text is None:
+            response = self.provider.complete(system_prompt, user_message)
+        else:
+            response = self.provider.stream(system_prompt, user_message, on_text)
+        put(key, response.text, response.model, self.ttl)
+        return response
+
+
+def _entry_path(key: str) -> Path:
+    return get_cache_dir() / "responses" / f"{key}.json"
@@ -1,21 +1,77 @@
 """Pattern loading and selection."""
 
+import hashlib
+import logging
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
 from pathlib import Path
 
 import yaml
 
+from gremlin.core.cache import get_cache_dir, write_atomic
+
+# libyaml's C loader/dumper when PyYAML was built with it; same output, ~7x faster
+try:
+    from yaml import CSafeDumper as YamlDumper  # noqa: F401 - used by cli.learn, prompts
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - PyYAML without libyaml
+    from yaml import SafeDumper as YamlDumper  # noqa: F401
+    from yaml import SafeLoader as YamlLoader
+
+    logging.getLogger(__name__).warning(
+        "PyYAML was built without libyaml; pattern loading and prompt building "
+        "fall back to the slower pure-Python YAML implementation"
+    )
+
+# Bump when the merged-patterns format or merge logic changes to invalidate
+# existing on-disk caches
+_PATTERNS_CACHE_VERSION = 1
+
+# Pattern files load_all_patterns doesn't merge as additional files
+_SKIPPED_PATTERN_FILES = frozenset({"breaking.yaml", "code-review.yaml"})
+
+# In-process LRU of parsed pattern files: path -> (mtime_ns, size, pickled data)
+_LOADED_PATTERNS: OrderedDict[str, tuple[int, int, bytes]] = OrderedDict()
+_LOADED_PATTERNS_MAX = 100
+_LOADED_PATTERNS_LOCK = threading.Lock()
+
 
 def load_patterns(patterns_path: Path) -> dict:
     """Load patterns from YAML file.
 
+    Parsed files are remembered per process, keyed by path, mtime and size, so
+    loading an unchanged file again skips YAML parsing. Every call returns a
+    fresh copy that callers may mutate (merge_patterns does).
+
     Args:
         patterns_path: Path to the breaking.yaml file
 
     Returns:
         Dict containing universal and domain_specific patterns
     """
+    key = os.fspath(patterns_path)
+    stat = os.stat(key)
+    with _LOADED_PATTERNS_LOCK:
+        entry = _LOADED_PATTERNS.get(key)
+        if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            _LOADED_PATTERNS.move_to_end(key)
+            # Unpickling a snapshot is a faster deep copy than copy.deepcopy
+            cached: dict = pickle.loads(entry[2])
+            return cached
+
     with open(patterns_path) as f:
-        return yaml.safe_load(f)
+        patterns: dict = yaml.load(f, Loader=YamlLoader)
+
+    snapshot = pickle.dumps(patterns, pickle.HIGHEST_PROTOCOL)
+    with _LOADED_PATTERNS_LOCK:
+        _LOADED_PATTERNS[key] = (stat.st_mtime_ns, stat.st_size, snapshot)
+        _LOADED_PATTERNS.move_to_end(key)
+        if len(_LOADED_PATTERNS) > _LOADED_PATTERNS_MAX:
+            _LOADED_PATTERNS.popitem(last=False)
+    return patterns
 
 
 def merge_patterns(base: dict, additional: dict) -> dict:
@@ -38,26 +94,28 @@ def merge_patterns(base: dict, additional: dict) -> dict:
         for p in cat.get("patterns", []):
             existing.add(p.lower().strip())
 
+    # Index categories by name once; the first of any duplicate names wins
+    base_cat_by_name: dict = {}
+    for bc in base_universal:
+        base_cat_by_name.setdefault(bc.get("category"), bc)
+
     for cat in add_universal:
         cat_name = cat.get("category", "Uncategorized")
         cat_patterns = cat.get("patterns", [])
 
         # Find or create matching category in base
-        base_cat = None
-        for bc in base_universal:
-            if bc.get("category") == cat_name:
-                base_cat = bc
-                break
-
+        base_cat = base_cat_by_name.get(cat_name)
         if base_cat is None:
             base_cat = {"category": cat_name, "patterns": []}
             base_universal.append(base_cat)
+            base_cat_by_name[cat_name] = base_cat
 
         # Add non-duplicate patterns
         for p in cat_patterns:
-            if p.lower().strip() not in existing:
+            normalized = p.lower().strip()
+            if normalized not in existing:
                 base_cat["patterns"].append(p)
-                existing.add(p.lower().strip())
+                existing.add(normalized)
 
     base["universal"] = base_universal
 
@@ -69,32 +127,39 @@ def merge_patterns(base: dict, additional: dict) -> dict:
         if domain not in base_domains:
             base_domains[domain] = {"keywords": [], "patterns": []}
 
-        # Merge keywords (deduplicate)
-        existing_kw = set(base_domains[domain].get("keywords", []))
+        # Merge keywords (deduplicate case-insensitively)
+        existing_kw = {k.lower() for k in base_domains[domain].get("keywords", [])}
         for kw in config.get("keywords", []):
-            if kw.lower() not in {k.lower() for k in existing_kw}:
+            kw_lower = kw.lower()
+            if kw_lower not in existing_kw:
                 base_domains[domain].setdefault("keywords", []).append(kw)
-                existing_kw.add(kw.lower())
+                existing_kw.add(kw_lower)
 
         # Merge patterns (deduplicate)
         existing_pat = {p.lower().strip() for p in base_domains[domain].get("patterns", [])}
         for p in config.get("patterns", []):
-            if p.lower().strip() not in existing_pat:
+            normalized = p.lower().strip()
+            if normalized not in existing_pat:
                 base_domains[domain].setdefault("patterns", []).append(p)
-                existing_pat.add(p.lower().strip())
+                existing_pat.add(normalized)
 
     base["domain_specific"] = base_domains
     return base
 
 
-def load_all_patterns(patterns_dir: Path) -> dict:
+def load_all_patterns(patterns_dir: Path, use_cache: bool = True) -> dict:
     """Load and merge patterns from all YAML files in directory.
 
     Loads breaking.yaml first as base, then merges any additional
     pattern files from the directory and subdirectories.
 
+    The merged result is cached as a pickle in the Gremlin cache directory
+    (see get_cache_dir), keyed by each file's path, mtime and size, so later
+    processes skip YAML parsing until a pattern file changes.
+
     Args:
         patterns_dir: Directory containing pattern YAML files
+        use_cache: Read/write the on-disk merged-patterns cache
 
     Returns:
         Merged patterns dict from all sources
@@ -103,14 +168,23 @@ def load_all_patterns(patterns_dir: Path) -> dict:
     if not base_file.exists():
         return {"universal": [], "domain_specific": {}}
 
-    patterns = load_patterns(base_file)
+    # Additional pattern files, skipping the base file and code-review
+    # patterns (agent-specific)
+    yaml_files = sorted(
+        Path(path) for path in _iter_yaml_files(patterns_dir, _SKIPPED_PATTERN_FILES)
+    )
 
-    # Find and merge additional pattern files
-    for yaml_file in sorted(patterns_dir.rglob("*.yaml")):
-        # Skip the base file and code-review patterns (agent-specific)
-        if yaml_file.name in ("breaking.yaml", "code-review.yaml"):
-            continue
+    cache_file = cache_key = None
+    if use_cache:
+        cache_file, cache_key = _patterns_cache_entry(patterns_dir, [base_file, *yaml_files])
+        cached = _read_patterns_cache(cache_file, cache_key)
+        if cached is not None:
+            return cached
 
+    patterns = load_patterns(base_file)
+
+    # Merge additional pattern files
+    for yaml_file in yaml_files:
         try:
             additional = load_patterns(yaml_file)
             if additional:
@@ -119,6 +193,51 @@ def load_all_patterns(patterns_dir: Path) -> dict:
             # Skip invalid files silently
             pass
 
+    if cache_file is not None:
+        try:
+            write_atomic(cache_file, pickle.dumps((cache_key, patterns)))
+        except OSError:
+            pass  # Cache is an optimization; an unwritable cache dir is fine
+
+    return patterns
+
+
+def _iter_yaml_files(directory: str | Path, skip_names: frozenset[str]) -> Iterator[str]:
+    """Yield paths of *.yaml files under directory, like rglob("*.yaml").
+
+    Uses os.scandir so no Path objects are built for entries that are skipped
+    or not YAML. Symlinked directories are not descended into (as with rglob).
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_yaml_files(entry.path, skip_names)
+            elif entry.name.endswith(".yaml") and entry.name not in skip_names:
+                yield entry.path
+
+
+def _patterns_cache_entry(patterns_dir: Path, files: list[Path]) -> tuple[Path, str]:
+    """Return (cache file, freshness key) for a patterns directory.
+
+    One cache file per directory; the key stored inside it changes whenever
+    any pattern file is added, removed, or modified.
+    """
+    dir_id = hashlib.sha256(str(patterns_dir.resolve()).encode()).hexdigest()[:16]
+    key = hashlib.sha256(f"v{_PATTERNS_CACHE_VERSION}".encode())
+    for path in files:
+        stat = path.stat()
+        key.update(f"\n{path}|{stat.st_mtime_ns}|{stat.st_size}".encode())
+    return get_cache_dir() / f"patterns-{dir_id}.pickle", key.hexdigest()
+
+
+def _read_patterns_cache(cache_file: Path, cache_key: str) -> dict | None:
+    """Return cached patterns if the cache file exists and matches the key."""
+    try:
+        stored_key, patterns = pickle.loads(cache_file.read_bytes())
+    except Exception:
+        return None  # Missing, unreadable or stale-format cache
+    if stored_key != cache_key or not isinstance(patterns, dict):
+        return None
     return patterns
 
 
@@ -1,9 +1,20 @@
 """Prompt building for Claude API."""
 
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
 from pathlib import Path
+from typing import Any
 
 import yaml
 
+from gremlin.core.patterns import YamlDumper
+
+# Recently dumped pattern selections: _selection_key(selection) -> YAML text
+_PATTERNS_YAML: OrderedDict[Hashable, str] = OrderedDict()
+_PATTERNS_YAML_MAX = 64
+_PATTERNS_YAML_LOCK = threading.Lock()
+
 
 def load_system_prompt(prompt_path: Path) -> str:
     """Load system prompt from file.
@@ -39,7 +50,7 @@ def build_prompt(
     Returns:
         Tuple of (full_system_prompt, user_message)
     """
-    patterns_yaml = yaml.dump(selected_patterns, default_flow_style=False)
+    patterns_yaml = _dump_patterns(selected_patterns)
 
     full_system = f"""{system_prompt}
 
@@ -76,3 +87,53 @@ Apply the breaking patterns above. For each risk scenario:
 Focus on non-obvious risks. Skip generic advice."""
 
     return full_system, user_msg
+
+
+def _dump_patterns(selected_patterns: dict) -> str:
+    """Dump selected patterns as YAML, reusing the text for a repeated selection.
+
+    Batch reviews and API callers analyze many scopes against the same
+    domains; building the cache key is several times cheaper than the
+    YAML dump it skips.
+    """
+    try:
+        key = _selection_key(selected_patterns)
+    except TypeError:  # Unhashable leaf value; don't cache
+        return _to_yaml(selected_patterns)
+
+    with _PATTERNS_YAML_LOCK:
+        patterns_yaml = _PATTERNS_YAML.get(key)
+        if patterns_yaml is not None:
+            _PATTERNS_YAML.move_to_end(key)
+            return patterns_yaml
+
+    patterns_yaml = _to_yaml(selected_patterns)
+    with _PATTERNS_YAML_LOCK:
+        _PATTERNS_YAML[key] = patterns_yaml
+        if len(_PATTERNS_YAML) > _PATTERNS_YAML_MAX:
+            _PATTERNS_YAML.popitem(last=False)
+    return patterns_yaml
+
+
+def _to_yaml(selected_patterns: dict) -> str:
+    text: str = yaml.dump(selected_patterns, Dumper=YamlDumper, default_flow_style=False)
+    return text
+
+
+def _selection_key(value: Any) -> Hashable:
+    """Return a hashable form of a pattern selection that keeps value types.
+
+    Mapping keys are sorted, as yaml.dump sorts them, so selections built in
+    a different order share a cache entry, while 1 and "1" (or 1 and True)
+    stay distinct.
+
+    Raises:
+        TypeError: If a leaf value is not hashable
+    """
+    if isinstance(value, dict):
+        items = [(_selection_key(k), _selection_key(v)) for k, v in value.items()]
+        return dict, tuple(sorted(items, key=lambda item: repr(item[0])))
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_selection_key(v) for v in value)
+    hash(value)
+    return type(value), value
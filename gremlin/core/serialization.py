@@ -0,0 +1,79 @@
+"""JSON serialization helpers.
+
+Uses orjson when it is installed (``pip install gremlin-critic[fast]``) and
+falls back to the standard library json module otherwise. Both paths produce
+the same document: 2-space indentation and UTF-8 text (no ASCII escaping).
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # Optional dependency
+    HAS_ORJSON = False
+
+
+def _default(obj: Any) -> Any:
+    """Serialize objects exposing to_dict() (Risk, AnalysisResult, stage results)."""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def dumps_bytes(obj: Any, indent: bool = True) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: Value to serialize. Objects with a to_dict() method are supported.
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        JSON document as bytes
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, default=_default, option=option)
+    return _stdlib_dumps(obj, indent).encode()
+
+
+def dumps(obj: Any, indent: bool = True) -> str:
+    """Serialize obj to a JSON string.
+
+    Args:
+        obj: Value to serialize. Objects with a to_dict() method are supported.
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        JSON document as str
+    """
+    if HAS_ORJSON:
+        return dumps_bytes(obj, indent).decode()
+    return _stdlib_dumps(obj, indent)
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON document as UTF-8 bytes or str
+
+    Returns:
+        The parsed value
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _stdlib_dumps(obj: Any, indent: bool) -> str:
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        ensure_ascii=False,
+        default=_default,
+    )
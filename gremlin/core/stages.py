@@ -22,7 +22,7 @@ from typing import Any
 _SCHEMA_VERSION = "1"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UnderstandingResult:
     """Output of the Understanding stage.
 
@@ -59,7 +59,7 @@ class UnderstandingResult:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IdeationResult:
     """Output of the Ideation stage.
 
@@ -90,7 +90,7 @@ class IdeationResult:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RolloutResult:
     """Output of the Rollout stage.
 
@@ -118,7 +118,7 @@ class RolloutResult:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JudgmentResult:
     """Output of the Judgment stage.
 
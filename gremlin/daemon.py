@@ -0,0 +1,374 @@
+"""Optional resident process that keeps Gremlin warm between CLI invocations.
+
+Every `gremlin` command normally pays for Python startup, the rich/typer/
+Anthropic SDK imports, pattern loading and a fresh HTTPS connection. With
+`gremlin daemon start`, a background process keeps all of that loaded and
+serves commands over a Unix socket that only its user can open. Clients opt
+in by setting GREMLIN_DAEMON=1: the `gremlin` entry point then forwards argv,
+stdin, cwd and terminal size to the daemon and relays its output as it is
+written, falling back to running in-process when no daemon is listening.
+
+The daemon only runs a command when the client's API keys and GREMLIN_*
+settings match its own (compared by fingerprint; secrets never cross the
+socket); otherwise it refuses and the client runs the command itself.
+Commands are served one at a time, since each one switches the process-wide
+cwd, stdin and stdout.
+
+This module imports only the standard library (plus the cache-dir helper) so
+the client path stays cheap.
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import shutil
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+from collections.abc import Callable
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO
+
+from gremlin.core.cache import get_cache_dir
+
+# Set to 1 on the client side to route `gremlin` commands through the daemon
+USE_DAEMON_ENV = "GREMLIN_DAEMON"
+
+# Commands that manage the daemon itself always run in-process
+_LOCAL_COMMANDS = frozenset({"daemon"})
+
+# Settings that change what a command does; client and daemon must agree on them
+_ENV_VARS = (
+    "ANTHROPIC_API_KEY",
+    "ANTHROPIC_AUTH_TOKEN",
+    "ANTHROPIC_BASE_URL",
+    "GREMLIN_PROVIDER",
+    "GREMLIN_MODEL",
+    "GREMLIN_MAX_CONCURRENCY",
+    "GREMLIN_CACHE_DIR",
+    "XDG_CACHE_HOME",
+)
+
+
+def get_socket_path() -> Path:
+    """Return the daemon socket path (GREMLIN_DAEMON_SOCKET overrides)."""
+    override = os.environ.get("GREMLIN_DAEMON_SOCKET")
+    return Path(override) if override else get_cache_dir() / "daemon.sock"
+
+
+def enabled() -> bool:
+    """Check whether this client opted in to using the daemon."""
+    return os.environ.get(USE_DAEMON_ENV) == "1"
+
+
+def run_via_daemon(argv: list[str]) -> int | None:
+    """Run a CLI command in the daemon, relaying its output as it arrives.
+
+    Returns:
+        The command's exit code, or None if it should run in-process (no
+        daemon listening, a daemon-management command, or the daemon refused)
+    """
+    if argv and argv[0] in _LOCAL_COMMANDS:
+        return None
+    # The CLI reads stdin only for `--context -`; don't block on it otherwise
+    stdin = None
+    if "-" in argv and sys.stdin is not None and not sys.stdin.isatty():
+        stdin = sys.stdin.read()
+    try:
+        exit_code = _run(argv, stdin, _terminal_info(), _write_std)
+    except BrokenPipeError:
+        # Whatever reads our output went away (e.g. `| head`): stop relaying
+        # quietly, sending any further writes to /dev/null
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    if exit_code is None and stdin is not None:
+        # Already consumed; hand it to the in-process fallback
+        sys.stdin = io.StringIO(stdin)
+    return exit_code
+
+
+def run_captured(
+    argv: list[str], stdin: str | None = None, timeout: float | None = None
+) -> dict | None:
+    """Run a CLI command in the daemon and return its output instead of printing it.
+
+    Args:
+        argv: CLI arguments (without the program name)
+        stdin: Text the command reads for `--context -`
+        timeout: Seconds to wait for the command; TimeoutError when exceeded
+
+    Returns:
+        Dict with stdout, stderr and exit_code, or None if no daemon is
+        listening or it refused the command
+    """
+    output: dict[str, list[str]] = {"stdout": [], "stderr": []}
+    exit_code = _run(
+        argv, stdin, {"isatty": False}, lambda stream, text: output[stream].append(text), timeout
+    )
+    if exit_code is None:
+        return None
+    return {
+        "stdout": "".join(output["stdout"]),
+        "stderr": "".join(output["stderr"]),
+        "exit_code": exit_code,
+    }
+
+
+def is_running() -> bool:
+    """Check whether a daemon answers on the socket."""
+    return _send({"command": "ping"}) is not None
+
+
+def start() -> bool:
+    """Start a daemon in the background.
+
+    Returns:
+        False if one was already running
+    """
+    if is_running():
+        return False
+    get_socket_path().parent.mkdir(parents=True, exist_ok=True)
+    subprocess.Popen(
+        [sys.executable, "-m", "gremlin.daemon"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    return True
+
+
+def stop() -> bool:
+    """Ask a running daemon to exit.
+
+    Returns:
+        False if no daemon was running
+    """
+    return _send({"command": "stop"}) is not None
+
+
+def _env_fingerprint() -> dict[str, str | None]:
+    """Hash the settings in _ENV_VARS so they can be compared without sending them."""
+    fingerprint: dict[str, str | None] = {}
+    for name in _ENV_VARS:
+        value = os.environ.get(name)
+        fingerprint[name] = hashlib.sha256(value.encode()).hexdigest() if value else value
+    return fingerprint
+
+
+def _terminal_info() -> dict:
+    """Describe the client's stdout so the daemon can render for it."""
+    isatty = sys.stdout is not None and sys.stdout.isatty()
+    info: dict = {"isatty": isatty, "no_color": "NO_COLOR" in os.environ}
+    if isatty:
+        info["columns"] = shutil.get_terminal_size().columns
+    return info
+
+
+def _write_std(stream: str, text: str) -> None:
+    out = sys.stdout if stream == "stdout" else sys.stderr
+    out.write(text)
+    out.flush()
+
+
+def _run(
+    argv: list[str],
+    stdin: str | None,
+    terminal: dict,
+    on_output: Callable[[str, str], None],
+    timeout: float | None = None,
+) -> int | None:
+    """Send one command and pass each output frame to on_output(stream, text).
+
+    Returns:
+        The exit code, or None if nothing is listening or the daemon refused
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None  # No Unix sockets (Windows): always run in-process
+    request = {
+        "command": "run",
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "stdin": stdin,
+        "env": _env_fingerprint(),
+        "terminal": terminal,
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(os.fspath(get_socket_path()))
+            sock.sendall(json.dumps(request).encode() + b"\n")
+        except OSError:
+            return None  # No socket file, stale socket, or daemon went away
+        with sock.makefile("rb") as reader:
+            while line := _read_frame(reader):
+                frame = json.loads(line)
+                if "exit_code" in frame:
+                    return int(frame["exit_code"])
+                if "refused" in frame:
+                    on_output("stderr", f"{frame['refused']}\n")
+                    return None
+                for stream in ("stdout", "stderr"):
+                    if stream in frame:
+                        on_output(stream, frame[stream])
+    # Output may already have been relayed, so running it again here could
+    # duplicate side effects; report the failure instead
+    on_output("stderr", "gremlin: lost connection to the daemon\n")
+    return 1
+
+
+def _read_frame(reader: BinaryIO) -> bytes:
+    """Read one frame line; b"" once the daemon has gone away."""
+    try:
+        return reader.readline()
+    except TimeoutError:
+        raise  # The daemon is there but the command is slow; don't run it twice
+    except OSError:
+        return b""
+
+
+def _send(request: dict) -> dict | None:
+    """Send one control request and read one response; None if nothing is listening."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(os.fspath(get_socket_path()))
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError:
+        return None
+    response: dict | None = json.loads(line) if line else None
+    return response
+
+
+class _FrameWriter(io.TextIOBase):
+    """Text stream that relays each write to the client as an output frame."""
+
+    def __init__(self, send: Callable[[dict], None], stream: str, isatty: bool) -> None:
+        self._send = send
+        self._stream = stream
+        self._isatty = isatty
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self._isatty
+
+    def write(self, text: str) -> int:
+        if text:
+            self._send({self._stream: text})
+        return len(text)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        # Spinners write from their own thread; the lock keeps frames whole
+        self._send_lock = threading.Lock()
+        request = json.loads(self.rfile.readline())
+        command = request.get("command", "run")
+        if command == "run":
+            _run_command(request, self._send)
+        else:
+            self._send({"ok": True})
+        if command == "stop":
+            # shutdown() waits for serve_forever() to return, which happens only
+            # after this handler finishes, so it must run on another thread
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+    def _send(self, frame: dict) -> None:
+        with self._send_lock:
+            try:
+                self.wfile.write(json.dumps(frame).encode() + b"\n")
+                self.wfile.flush()
+            except OSError:
+                pass  # Client went away; let the command finish quietly
+
+
+def _run_command(request: dict, send: Callable[[dict], None]) -> None:
+    """Run one CLI invocation, streaming its output and exit code as frames."""
+    mismatched = [
+        name
+        for name, fingerprint in _env_fingerprint().items()
+        if request.get("env", {}).get(name) != fingerprint
+    ]
+    if mismatched:
+        send({
+            "refused": "gremlin: the daemon was started with different "
+            f"{', '.join(mismatched)}; running in-process "
+            "(restart it with `gremlin daemon stop && gremlin daemon start`)"
+        })
+        return
+
+    from gremlin import cli
+
+    terminal = request.get("terminal", {})
+    isatty = bool(terminal.get("isatty"))
+    stdout = _FrameWriter(send, "stdout", isatty)
+    stderr = _FrameWriter(send, "stderr", isatty)
+    previous_cwd, previous_stdin, previous_console = os.getcwd(), sys.stdin, cli.console
+    exit_code = 0
+    try:
+        # Render for the client's terminal, not the daemon's (which has none)
+        cli.console = cli._LazyConsole(
+            width=terminal.get("columns"), no_color=terminal.get("no_color") or None
+        )
+        cwd = request.get("cwd")
+        if cwd:
+            os.chdir(cwd)
+        sys.stdin = io.StringIO(request.get("stdin") or "")
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                cli.app(args=request["argv"], prog_name="gremlin")
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except Exception as e:  # Keep the daemon alive on command bugs
+                stderr.write(f"Error: {e}\n")
+                exit_code = 1
+    finally:
+        cli.console = previous_console
+        sys.stdin = previous_stdin
+        os.chdir(previous_cwd)
+    send({"exit_code": exit_code})
+
+
+def serve() -> None:
+    """Run the daemon in the foreground until stopped."""
+    from gremlin import cli
+
+    # Warm the expensive state once: imports, merged patterns, system prompt
+    cli.load_all_patterns(cli.PATTERNS_DIR)
+    cli.load_system_prompt(cli.PROMPTS_PATH)
+    # Reuse one provider (and its HTTP keep-alive pool) across requests.
+    # Requests whose settings differ from the daemon's are refused, so
+    # get_provider() would always build the same one
+    cli.get_provider = lru_cache(maxsize=None)(cli.get_provider)
+
+    path = get_socket_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with contextlib.suppress(FileNotFoundError):
+        path.unlink()  # Stale socket from a crashed daemon
+    # Create the socket owner-only (0600) from the start: anyone who can
+    # connect can run commands with this process's API key
+    previous_umask = os.umask(0o177)
+    try:
+        server = socketserver.UnixStreamServer(os.fspath(path), _Handler)
+    finally:
+        os.umask(previous_umask)
+    with server:
+        try:
+            server.serve_forever()
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+
+
+if __name__ == "__main__":
+    serve()
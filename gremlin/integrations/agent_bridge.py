@@ -9,14 +9,21 @@ import json
 import logging
 import shutil
 import subprocess
+from functools import lru_cache
 from typing import Optional
 
+from gremlin import daemon
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
 def check_cli_available() -> bool:
     """Check if gremlin CLI is installed (cross-platform).
 
+    The PATH lookup runs once per process; call check_cli_available.cache_clear()
+    after changing PATH.
+
     Returns:
         True if gremlin command is available, False otherwise
 
@@ -78,26 +85,33 @@ def analyze_with_cli(
         ... else:
         ...     print("CLI not available - using agent patterns only")
     """
-    if not check_cli_available():
-        return None
-
-    cmd = [
-        "gremlin", "review", scope,
+    args = [
+        "review", scope,
         "--output", "json",
         "--threshold", str(threshold),
         "--depth", depth
     ]
 
     if context:
-        cmd.extend(["--context", context])
+        args.extend(["--context", context])
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
+        # With GREMLIN_DAEMON=1, a running `gremlin daemon` serves the command
+        # over its socket, skipping a new process and interpreter per analysis
+        response = daemon.run_captured(args, timeout=120) if daemon.enabled() else None
+        if response is not None:
+            result = subprocess.CompletedProcess(
+                args, response["exit_code"], response["stdout"], response["stderr"]
+            )
+        elif check_cli_available():
+            result = subprocess.run(
+                ["gremlin", *args],
+                capture_output=True,
+                text=True,
+                timeout=120
+            )
+        else:
+            return None
 
         if result.returncode != 0:
             logger.warning(f"Gremlin CLI failed with code {result.returncode}: {result.stderr}")
@@ -115,7 +129,7 @@ def analyze_with_cli(
             logger.warning(f"Gremlin CLI returned invalid JSON: {e}")
             return None
 
-    except subprocess.TimeoutExpired:
+    except (subprocess.TimeoutExpired, TimeoutError):
         logger.warning("Gremlin CLI timed out after 120 seconds")
         return None
     except Exception as e:
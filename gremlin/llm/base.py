@@ -5,6 +5,7 @@ multi-model support and avoiding tight coupling to any single provider.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -42,7 +43,8 @@ class LLMResponse:
         text: The generated text response
         model: Model that generated the response
         provider: Provider that served the request
-        usage: Token usage stats (prompt_tokens, completion_tokens, total_tokens)
+        usage: Token usage stats (prompt_tokens, completion_tokens, total_tokens;
+            providers may add more, e.g. cache_read_input_tokens)
         raw_response: Original provider-specific response object
     """
 
@@ -90,6 +92,34 @@ class LLMProvider(ABC):
         """
         pass
 
+    def stream(
+        self,
+        system_prompt: str,
+        user_message: str,
+        on_text: Callable[[str], None],
+        **kwargs: Any
+    ) -> LLMResponse:
+        """Generate a completion, reporting text as it is generated.
+
+        Providers without a streaming API inherit this default, which delivers
+        the whole text in one on_text call once complete() returns.
+
+        Args:
+            system_prompt: System instructions/context
+            user_message: User message to respond to
+            on_text: Called with each chunk of response text, in order
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            LLMResponse with the full generated text and metadata
+
+        Raises:
+            LLMProviderError: If the request fails
+        """
+        response = self.complete(system_prompt, user_message, **kwargs)
+        on_text(response.text)
+        return response
+
     @abstractmethod
     def validate_config(self) -> bool:
         """Validate that the provider is properly configured.
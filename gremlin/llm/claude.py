@@ -6,10 +6,13 @@ for multi-provider support.
 """
 
 import os
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 from anthropic import Anthropic
 
+from gremlin.llm.base import LLMProvider
 from gremlin.llm.factory import get_provider
 
 
@@ -18,6 +21,9 @@ def get_client() -> Anthropic:
 
     DEPRECATED: Use get_provider() for multi-provider support.
 
+    Clients are reused per API key, so repeated calls share one HTTP
+    connection pool.
+
     Returns:
         Configured Anthropic client
 
@@ -31,6 +37,11 @@ def get_client() -> Anthropic:
             "Get your API key from https://console.anthropic.com/\n"
             "Then run: export ANTHROPIC_API_KEY=sk-ant-..."
         )
+    return _client_for_key(api_key)
+
+
+@lru_cache(maxsize=4)
+def _client_for_key(api_key: str) -> Anthropic:
     return Anthropic(api_key=api_key)
 
 
@@ -40,6 +51,7 @@ def call_claude(
     user_message: str,
     model: str | None = None,
     max_tokens: int = 4096,
+    on_text: Callable[[str], None] | None = None,
     **kwargs: Any
 ) -> str:
     """Call Claude API with prompts.
@@ -55,6 +67,7 @@ def call_claude(
         user_message: User message
         model: Model to use (default from env or claude-sonnet-4-20250514)
         max_tokens: Maximum tokens in response
+        on_text: Called with each chunk of text as the response streams in
         **kwargs: Additional parameters passed to provider
 
     Returns:
@@ -64,6 +77,19 @@ def call_claude(
         model = os.environ.get("GREMLIN_MODEL", "claude-sonnet-4-20250514")
 
     # Use new provider abstraction
-    provider = get_provider(provider="anthropic", model=model, max_tokens=max_tokens)
-    response = provider.complete(system_prompt, user_message, **kwargs)
+    provider = _get_cached_provider(model, max_tokens)
+    if on_text is None:
+        response = provider.complete(system_prompt, user_message, **kwargs)
+    else:
+        response = provider.stream(system_prompt, user_message, on_text, **kwargs)
     return response.text
+
+
+@lru_cache(maxsize=8)
+def _get_cached_provider(model: str, max_tokens: int) -> LLMProvider:
+    """Return one provider per (model, max_tokens), reusing its HTTP connection pool.
+
+    The provider reads ANTHROPIC_API_KEY when first built; call
+    _get_cached_provider.cache_clear() after changing it.
+    """
+    return get_provider(provider="anthropic", model=model, max_tokens=max_tokens)
@@ -1,14 +1,19 @@
 """Factory for creating LLM providers."""
 
+import importlib
 import os
 from typing import Type
 
 from gremlin.llm.base import LLMConfig, LLMProvider
-from gremlin.llm.providers.anthropic import AnthropicProvider
 
 # Registry of available providers
-PROVIDER_REGISTRY: dict[str, Type[LLMProvider]] = {
-    "anthropic": AnthropicProvider,
+PROVIDER_REGISTRY: dict[str, Type[LLMProvider]] = {}
+
+# Built-in providers as "module:class", imported on first use and then added to
+# PROVIDER_REGISTRY. Provider SDKs are slow to import (the Anthropic SDK takes
+# about a second) and commands like `patterns list` never call an LLM.
+_BUILTIN_PROVIDERS: dict[str, str] = {
+    "anthropic": "gremlin.llm.providers.anthropic:AnthropicProvider",
 }
 
 
@@ -56,9 +61,7 @@ def get_provider(
         # Resolve provider from args or env
         provider_name = provider or os.environ.get("GREMLIN_PROVIDER", "anthropic")
 
-        # Resolve model from args or env
-        if model is None:
-            model = os.environ.get("GREMLIN_MODEL") or _get_default_model(provider_name)
+        model = resolve_model(provider_name, model)
 
         # Build config
         config = LLMConfig(
@@ -68,16 +71,15 @@ def get_provider(
         )
 
     # Validate provider exists
-    provider_name_lower = provider_name.lower()
-    if provider_name_lower not in PROVIDER_REGISTRY:
-        available = ", ".join(PROVIDER_REGISTRY.keys())
+    provider_class = _get_provider_class(provider_name.lower())
+    if provider_class is None:
+        available = ", ".join(list_providers())
         raise ValueError(
             f"Unsupported provider: {provider_name}. "
             f"Available providers: {available}"
         )
 
     # Instantiate and validate
-    provider_class = PROVIDER_REGISTRY[provider_name_lower]
     provider_instance = provider_class(config)
     provider_instance.validate_config()
 
@@ -110,7 +112,37 @@ def list_providers() -> list[str]:
     Returns:
         List of available provider identifiers
     """
-    return sorted(PROVIDER_REGISTRY.keys())
+    return sorted(PROVIDER_REGISTRY.keys() | _BUILTIN_PROVIDERS.keys())
+
+
+def _get_provider_class(name: str) -> Type[LLMProvider] | None:
+    """Look up a provider class, importing a built-in provider on first use.
+
+    Args:
+        name: Lowercase provider identifier
+
+    Returns:
+        The provider class, or None if no provider has that name
+    """
+    provider_class = PROVIDER_REGISTRY.get(name)
+    if provider_class is None and name in _BUILTIN_PROVIDERS:
+        module_name, class_name = _BUILTIN_PROVIDERS[name].split(":")
+        provider_class = getattr(importlib.import_module(module_name), class_name)
+        PROVIDER_REGISTRY.setdefault(name, provider_class)
+    return provider_class
+
+
+def resolve_model(provider: str, model: str | None = None) -> str:
+    """Return the model get_provider() would use.
+
+    Args:
+        provider: Provider name
+        model: Explicit model, if any
+
+    Returns:
+        model, else GREMLIN_MODEL, else the provider's default model
+    """
+    return model or os.environ.get("GREMLIN_MODEL") or _get_default_model(provider)
 
 
 def _get_default_model(provider: str) -> str:
@@ -1,6 +1,7 @@
 """Anthropic (Claude) LLM provider implementation."""
 
 import os
+from collections.abc import Callable
 from typing import Any
 
 from anthropic import Anthropic, APIError, APITimeoutError
@@ -79,6 +80,10 @@ class AnthropicProvider(LLMProvider):
             **kwargs: Additional parameters (overrides config values)
                 - max_tokens: Override config.max_tokens
                 - temperature: Override config.temperature
+                - cache_system: Mark the system prompt for Anthropic prompt
+                  caching (default True). Repeat calls with the same system
+                  prompt within the cache window read it at a fraction of
+                  the input-token price.
 
         Returns:
             LLMResponse with generated text and metadata
@@ -87,52 +92,96 @@ class AnthropicProvider(LLMProvider):
             LLMProviderError: If API call fails
         """
         try:
-            # Build request parameters
-            max_tokens = kwargs.get("max_tokens", self.config.max_tokens)
-            temperature = kwargs.get("temperature", self.config.temperature)
-
-            # Call Anthropic API
             response = self.client.messages.create(
-                model=self.config.model,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_message}],
+                **self._request_params(system_prompt, user_message, kwargs)
             )
+            return self._to_response(response)
+        except Exception as e:
+            raise self._provider_error(e) from e
 
-            # Extract response text
-            text = response.content[0].text
-
-            # Build usage stats
-            usage = {
-                "prompt_tokens": response.usage.input_tokens,
-                "completion_tokens": response.usage.output_tokens,
-                "total_tokens": response.usage.input_tokens + response.usage.output_tokens,
-            }
-
-            return LLMResponse(
-                text=text,
-                model=self.config.model,
-                provider="anthropic",
-                usage=usage,
-                raw_response=response,
-            )
+    def stream(
+        self,
+        system_prompt: str,
+        user_message: str,
+        on_text: Callable[[str], None],
+        **kwargs: Any
+    ) -> LLMResponse:
+        """Generate completion using the Anthropic streaming API.
 
-        except APITimeoutError as e:
-            raise LLMProviderError(
-                "anthropic",
-                f"Request timeout after {self.config.timeout}s",
-                original_error=e
-            )
-        except APIError as e:
-            raise LLMProviderError(
-                "anthropic",
-                f"API error: {str(e)}",
-                original_error=e
-            )
+        Args:
+            system_prompt: System instructions
+            user_message: User message
+            on_text: Called with each text delta as it arrives
+            **kwargs: Same as complete()
+
+        Returns:
+            LLMResponse with the full text and metadata
+
+        Raises:
+            LLMProviderError: If API call fails
+        """
+        try:
+            with self.client.messages.stream(
+                **self._request_params(system_prompt, user_message, kwargs)
+            ) as stream:
+                for text in stream.text_stream:
+                    on_text(text)
+                response = stream.get_final_message()
+            return self._to_response(response)
         except Exception as e:
-            raise LLMProviderError(
-                "anthropic",
-                f"Unexpected error: {str(e)}",
-                original_error=e
-            )
+            raise self._provider_error(e) from e
+
+    def _request_params(
+        self, system_prompt: str, user_message: str, kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Build messages API parameters shared by complete() and stream()."""
+        # The system prompt (instructions + pattern catalog) is the large,
+        # stable prefix; the scope-specific text lives in the user message
+        system: str | list[dict[str, Any]] = system_prompt
+        if kwargs.get("cache_system", True):
+            system = [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }]
+
+        return {
+            "model": self.config.model,
+            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
+            "temperature": kwargs.get("temperature", self.config.temperature),
+            "system": system,
+            "messages": [{"role": "user", "content": user_message}],
+        }
+
+    def _to_response(self, response: Any) -> LLMResponse:
+        """Convert an Anthropic message to an LLMResponse."""
+        # Build usage stats
+        usage = {
+            "prompt_tokens": response.usage.input_tokens,
+            "completion_tokens": response.usage.output_tokens,
+            "total_tokens": response.usage.input_tokens + response.usage.output_tokens,
+            "cache_creation_input_tokens": (
+                getattr(response.usage, "cache_creation_input_tokens", None) or 0
+            ),
+            "cache_read_input_tokens": (
+                getattr(response.usage, "cache_read_input_tokens", None) or 0
+            ),
+        }
+
+        return LLMResponse(
+            text=response.content[0].text,
+            model=self.config.model,
+            provider="anthropic",
+            usage=usage,
+            raw_response=response,
+        )
+
+    def _provider_error(self, error: Exception) -> LLMProviderError:
+        """Wrap an API error in LLMProviderError."""
+        if isinstance(error, APITimeoutError):
+            message = f"Request timeout after {self.config.timeout}s"
+        elif isinstance(error, APIError):
+            message = f"API error: {str(error)}"
+        else:
+            message = f"Unexpected error: {str(error)}"
+        return LLMProviderError("anthropic", message, original_error=error)
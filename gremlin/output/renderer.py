@@ -1,9 +1,18 @@
 """Output rendering for different formats."""
 
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 
+# Minimum seconds between re-renders of streamed Markdown
+STREAM_REFRESH_SECONDS = 0.1
+
 
 def render_rich(content: str, scope: str, console: Console) -> None:
     """Render output with Rich formatting.
@@ -13,9 +22,7 @@ def render_rich(content: str, scope: str, console: Console) -> None:
         scope: Original scope string
         console: Rich console instance
     """
-    console.print()
-    console.print(Panel(f"[bold]Risk Scenarios for:[/bold] {scope}", expand=False))
-    console.print()
+    _print_rich_header(scope, console)
     console.print(Markdown(content))
 
 
@@ -37,3 +44,61 @@ def render_json(content: str) -> None:
     # TODO: Parse Claude's response into structured JSON
     # For now, just output the raw text
     print(content)
+
+
+@contextmanager
+def stream_rich(scope: str, console: Console) -> Iterator[Callable[[str], None]]:
+    """Render Markdown with Rich formatting while it is being generated.
+
+    Yields a callback that takes each text chunk. The final screen matches
+    render_rich() for the full text.
+
+    Args:
+        scope: Original scope string
+        console: Rich console instance
+    """
+    _print_rich_header(scope, console)
+    chunks: list[str] = []
+    last_render = 0.0
+
+    if not console.is_terminal:
+        # Nothing to redraw on a pipe; print the finished Markdown once
+        yield chunks.append
+        console.print(Markdown("".join(chunks)))
+        return
+
+    with Live(console=console, refresh_per_second=10, vertical_overflow="visible") as live:
+
+        def on_text(text: str) -> None:
+            nonlocal last_render
+            chunks.append(text)
+            # Re-parsing Markdown per token would be quadratic; throttle it
+            now = time.monotonic()
+            if now - last_render >= STREAM_REFRESH_SECONDS:
+                live.update(Markdown("".join(chunks)))
+                last_render = now
+
+        yield on_text
+        live.update(Markdown("".join(chunks)))
+
+
+@contextmanager
+def stream_markdown() -> Iterator[Callable[[str], None]]:
+    """Write raw markdown to stdout while it is being generated.
+
+    Yields a callback that takes each text chunk. The complete output matches
+    render_markdown() for the full text.
+    """
+
+    def on_text(text: str) -> None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    yield on_text
+    print()
+
+
+def _print_rich_header(scope: str, console: Console) -> None:
+    console.print()
+    console.print(Panel(f"[bold]Risk Scenarios for:[/bold] {scope}", expand=False))
+    console.print()
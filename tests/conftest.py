@@ -0,0 +1,21 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from gremlin.api import _get_shared_provider
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Point Gremlin's on-disk caches at a per-test temp dir (never ~/.cache)."""
+    cache_dir = tmp_path / "gremlin-cache"
+    monkeypatch.setenv("GREMLIN_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def fresh_shared_provider():
+    """Drop providers cached by earlier tests so each test's mocks take effect."""
+    _get_shared_provider.cache_clear()
+    yield
+    _get_shared_provider.cache_clear()
@@ -0,0 +1,91 @@
+"""Tests for the Anthropic provider and its lazy registration."""
+
+import subprocess
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from gremlin.llm.base import LLMConfig
+from gremlin.llm.factory import get_provider, list_providers
+from gremlin.llm.providers.anthropic import AnthropicProvider
+
+CONFIG = LLMConfig(provider="anthropic", model="claude-sonnet-4-20250514", api_key="test-key")
+
+
+def _fake_message(cache_read: int = 0) -> SimpleNamespace:
+    usage = SimpleNamespace(
+        input_tokens=10,
+        output_tokens=5,
+        cache_creation_input_tokens=0,
+        cache_read_input_tokens=cache_read,
+    )
+    return SimpleNamespace(content=[SimpleNamespace(text="ok")], usage=usage)
+
+
+class TestPromptCaching:
+    """Tests for Anthropic prompt caching of the system prompt."""
+
+    @patch("gremlin.llm.providers.anthropic.Anthropic")
+    def test_system_prompt_marked_cacheable(self, mock_anthropic):
+        """The system prompt is sent as a cache_control text block."""
+        create = mock_anthropic.return_value.messages.create
+        create.return_value = _fake_message(cache_read=1200)
+
+        response = AnthropicProvider(CONFIG).complete("system text", "user text")
+
+        system = create.call_args.kwargs["system"]
+        assert system == [{
+            "type": "text",
+            "text": "system text",
+            "cache_control": {"type": "ephemeral"},
+        }]
+        assert response.usage["cache_read_input_tokens"] == 1200
+
+    @patch("gremlin.llm.providers.anthropic.Anthropic")
+    def test_prompt_caching_can_be_disabled(self, mock_anthropic):
+        """cache_system=False sends the system prompt as a plain string."""
+        create = mock_anthropic.return_value.messages.create
+        create.return_value = _fake_message()
+
+        AnthropicProvider(CONFIG).complete("system text", "user text", cache_system=False)
+
+        assert create.call_args.kwargs["system"] == "system text"
+
+
+class TestStreaming:
+    """Tests for streamed completions."""
+
+    @patch("gremlin.llm.providers.anthropic.Anthropic")
+    def test_stream_reports_deltas_and_returns_full_response(self, mock_anthropic):
+        """Text deltas reach on_text in order; the final message is returned."""
+        stream = mock_anthropic.return_value.messages.stream.return_value.__enter__.return_value
+        stream.text_stream = iter(["o", "k"])
+        stream.get_final_message.return_value = _fake_message(cache_read=7)
+        received = []
+
+        response = AnthropicProvider(CONFIG).stream("system text", "user text", received.append)
+
+        assert received == ["o", "k"]
+        assert response.text == "ok"
+        assert response.usage["cache_read_input_tokens"] == 7
+
+
+class TestLazyImport:
+    """Tests for deferring the Anthropic SDK import until a provider is built."""
+
+    def test_cli_import_does_not_load_sdk(self):
+        """Importing the CLI (or the package) leaves the SDK unimported."""
+        code = (
+            "import sys, gremlin.cli\n"
+            "assert 'anthropic' not in sys.modules\n"
+            "assert 'gremlin.api' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_factory_resolves_builtin_provider(self):
+        """The built-in provider is listed and built on demand."""
+        assert "anthropic" in list_providers()
+
+        provider = get_provider("anthropic", api_key="test-key")
+
+        assert isinstance(provider, AnthropicProvider)
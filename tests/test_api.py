@@ -7,7 +7,8 @@ from unittest.mock import Mock, patch
 import pytest
 
 from gremlin import AnalysisResult, Gremlin, Risk
-from gremlin.llm.base import LLMResponse
+from gremlin.core.inference import infer_domains
+from gremlin.llm.base import LLMConfig, LLMResponse
 
 
 class TestRisk:
@@ -29,6 +30,14 @@ class TestRisk:
         assert risk.is_critical
         assert risk.is_high_severity
 
+    def test_severity_normalized(self):
+        """Test severity is upper-cased on construction."""
+        risk = Risk("high", 80, "scenario", "impact")
+
+        assert risk.severity == "HIGH"
+        assert risk.is_high_severity
+        assert risk.to_dict()["severity"] == "HIGH"
+
     def test_risk_to_dict(self):
         """Test Risk serialization."""
         risk = Risk(
@@ -58,6 +67,16 @@ class TestRisk:
         assert not medium.is_high_severity
 
 
+    def test_risk_uses_slots(self):
+        """Test Risk has no per-instance __dict__ and still pickles."""
+        import pickle
+
+        risk = Risk("HIGH", 85, "scenario", "impact", ["auth"], "Title")
+
+        assert not hasattr(risk, "__dict__")
+        assert pickle.loads(pickle.dumps(risk)) == risk
+
+
 class TestAnalysisResult:
     """Test AnalysisResult dataclass."""
 
@@ -122,6 +141,15 @@ class TestAnalysisResult:
         assert data["summary"]["critical"] == 1
         assert data["summary"]["high"] == 1
 
+    def test_severity_counts(self, sample_risks):
+        """Test single-pass severity counting matches the count properties."""
+        result = AnalysisResult("test", sample_risks, [], 0)
+        counts = result.severity_counts()
+
+        assert counts == {"CRITICAL": 1, "HIGH": 1, "MEDIUM": 1, "LOW": 1}
+        assert counts["CRITICAL"] == result.critical_count
+        assert counts["LOW"] == result.low_count
+
     def test_to_json(self, sample_risks):
         """Test JSON serialization."""
         result = AnalysisResult("test", sample_risks[:1], [], 5)
@@ -132,6 +160,32 @@ class TestAnalysisResult:
         assert parsed["scope"] == "test"
         assert len(parsed["risks"]) == 1
 
+    def test_to_json_bytes(self, sample_risks):
+        """Test JSON bytes serialization matches to_json."""
+        result = AnalysisResult("test", sample_risks[:2], [], 5)
+        data = result.to_json_bytes()
+
+        assert isinstance(data, bytes)
+        assert json.loads(data) == json.loads(result.to_json())
+
+    def test_to_json_serializes_risk_objects(self, sample_risks):
+        """Risk objects nested in plain containers serialize via to_dict()."""
+        from gremlin.core.serialization import dumps
+
+        parsed = json.loads(dumps({"risks": sample_risks[:1]}))
+        assert parsed["risks"][0] == sample_risks[0].to_dict()
+
+    def test_loads_round_trip(self, sample_risks):
+        """loads() parses dumps_bytes() output, bytes or str, non-ASCII intact."""
+        from gremlin.core.serialization import dumps_bytes, loads
+
+        data = {"scope": "paiement — échec", "risks": sample_risks[:1]}
+        encoded = dumps_bytes(data)
+
+        assert loads(encoded) == loads(encoded.decode())
+        assert loads(encoded)["scope"] == "paiement — échec"
+        assert loads(encoded)["risks"][0] == sample_risks[0].to_dict()
+
     def test_to_junit(self, sample_risks):
         """Test JUnit XML formatting."""
         result = AnalysisResult("test", sample_risks, [], 0)
@@ -145,6 +199,24 @@ class TestAnalysisResult:
         assert '<failure' in xml  # For CRITICAL/HIGH
         assert '<system-out>' in xml  # For MEDIUM/LOW
 
+    def test_to_junit_escapes_xml(self):
+        """Test LLM text with XML special characters yields well-formed XML."""
+        import xml.etree.ElementTree as ET
+
+        risks = [
+            Risk("CRITICAL", 90, 'What if "a" < b & c?', "Data <lost>", ["db"], title='A "B" & C'),
+            Risk("LOW", 50, "What if x > y?", "Minor & cosmetic", ["ui"]),
+        ]
+        result = AnalysisResult("auth & <login>", risks, [], 0)
+        root = ET.fromstring(result.to_junit())
+
+        cases = root.findall("testcase")
+        assert cases[0].get("classname") == "gremlin.auth_&_<login>"
+        assert cases[0].get("name") == 'A "B" & C'
+        assert cases[0].find("failure").get("message") == 'CRITICAL: What if "a" < b & c?'
+        assert "Impact: Data <lost>" in cases[0].find("failure").text
+        assert "What if x > y?" in cases[1].find("system-out").text
+
     def test_format_for_llm(self, sample_risks):
         """Test LLM-friendly formatting."""
         result = AnalysisResult("checkout", sample_risks[:2], ["payments"], 10)
@@ -221,6 +293,19 @@ class TestGremlin:
             assert result.risks[0].confidence == 95
             assert result.risks[1].severity == "HIGH"
 
+    def test_gremlin_uses_given_provider_and_response_cache(self, mock_llm_response):
+        """A passed-in provider is used as-is, or behind the cache with cache_ttl."""
+        mock_provider = Mock()
+        mock_provider.config = LLMConfig(provider="anthropic", model="test-model")
+        mock_provider.complete.return_value = mock_llm_response
+
+        Gremlin(llm_provider=mock_provider).analyze("checkout flow")
+        Gremlin(llm_provider=mock_provider, cache_ttl=60).analyze("checkout flow")
+        result = Gremlin(llm_provider=mock_provider, cache_ttl=60).analyze("checkout flow")
+
+        assert mock_provider.complete.call_count == 2
+        assert len(result.risks) == 2
+
     def test_gremlin_analyze_with_context(self, mock_llm_response):
         """Test analyze with additional context."""
         with patch("gremlin.api.get_provider") as mock_get_provider:
@@ -269,6 +354,57 @@ class TestGremlin:
 
         anyio.run(run_test)
 
+    def test_gremlin_analyze_many_async(self, mock_llm_response):
+        """Test concurrent multi-scope analysis keeps input order."""
+        import anyio
+
+        async def run_test():
+            with patch("gremlin.api.get_provider") as mock_get_provider:
+                mock_provider = Mock()
+                mock_provider.complete.return_value = mock_llm_response
+                mock_get_provider.return_value = mock_provider
+
+                gremlin = Gremlin(max_concurrency=2)
+                scopes = ["checkout", "login", "upload"]
+                results = await gremlin.analyze_many_async(scopes)
+
+                assert [r.scope for r in results] == scopes
+                assert mock_provider.complete.call_count == 3
+
+        anyio.run(run_test)
+
+    def test_max_concurrency_from_env(self):
+        """Test GREMLIN_MAX_CONCURRENCY sets the async concurrency cap."""
+        with patch.dict(os.environ, {"GREMLIN_MAX_CONCURRENCY": "3"}):
+            assert Gremlin().max_concurrency == 3
+        assert Gremlin(max_concurrency=5).max_concurrency == 5
+
+    def test_provider_shared_across_instances(self, mock_llm_response):
+        """Gremlin instances with the same provider/model reuse one provider."""
+        with patch("gremlin.api.get_provider") as mock_get_provider:
+            mock_provider = Mock()
+            mock_provider.complete.return_value = mock_llm_response
+            mock_get_provider.return_value = mock_provider
+
+            Gremlin().analyze("checkout")
+            Gremlin().analyze("login")
+
+            assert mock_get_provider.call_count == 1
+            assert mock_provider.complete.call_count == 2
+
+    def test_shared_provider_follows_model_env(self, mock_llm_response, monkeypatch):
+        """A changed GREMLIN_MODEL gets its own shared provider."""
+        with patch("gremlin.api.get_provider") as mock_get_provider:
+            mock_get_provider.return_value.complete.return_value = mock_llm_response
+
+            monkeypatch.setenv("GREMLIN_MODEL", "model-a")
+            Gremlin().analyze("checkout")
+            monkeypatch.setenv("GREMLIN_MODEL", "model-b")
+            Gremlin().analyze("checkout")
+
+            models = [call.kwargs["model"] for call in mock_get_provider.call_args_list]
+            assert models == ["model-a", "model-b"]
+
     def test_parse_risks_various_formats(self):
         """Test risk parsing with different markdown formats."""
         gremlin = Gremlin()
@@ -481,7 +617,7 @@ class TestGremlinStageMethods:
         assert callable(g._run_ideation)
         assert callable(g._run_rollout)
         assert callable(g._run_judgment)
-        assert callable(g._build_result)
+        assert callable(g._result_from_risks)
 
     def test_run_understanding_returns_correct_domains(self):
         """_run_understanding infers domains without an LLM call."""
@@ -501,6 +637,27 @@ class TestGremlinStageMethods:
         assert result.context == "Using JWT"
         assert result.depth == "deep"
 
+    def test_run_understanding_memoizes_repeat_scopes(self):
+        """Repeated scopes reuse the cached domain inference result."""
+        g = Gremlin()
+        with patch("gremlin.api.infer_domains", wraps=infer_domains) as mock_infer:
+            first = g._run_understanding("checkout flow", None, "quick")
+            first.matched_domains.append("mutated")
+            second = g._run_understanding("checkout flow", None, "quick")
+
+        assert mock_infer.call_count == 1
+        assert "mutated" not in second.matched_domains
+
+    def test_run_ideation_returns_unshared_selection(self):
+        """Each ideation result gets its own selected_patterns dict."""
+        g = Gremlin()
+        u = g._run_understanding("checkout flow", None, "quick")
+        first = g._run_ideation(u)
+        first.selected_patterns["domain"]["mutated"] = []
+        second = g._run_ideation(u)
+
+        assert "mutated" not in second.selected_patterns["domain"]
+
     def test_run_ideation_selects_patterns(self):
         """_run_ideation returns a non-zero pattern count without an LLM call."""
         from gremlin.core.stages import UnderstandingResult
@@ -551,29 +708,42 @@ class TestGremlinStageMethods:
         assert result.risks[0]["confidence"] == 95
         assert result.validated is False
 
-    def test_build_result_produces_analysis_result(self, mock_rollout_response):
-        """_build_result converts JudgmentResult → AnalysisResult correctly."""
-        from gremlin.core.stages import (
-            IdeationResult,
-            JudgmentResult,
-            RolloutResult,
-            UnderstandingResult,
-        )
+    def test_judge_risks_returns_risk_objects(self, mock_rollout_response):
+        """_judge_risks yields Risk objects matching _run_judgment's dicts."""
+        from gremlin.core.stages import IdeationResult, RolloutResult, UnderstandingResult
+
+        g = Gremlin()
+        u = UnderstandingResult("checkout", ["payments"], "quick", 80)
+        i = IdeationResult(u, {"universal": []}, 0)
+        r = RolloutResult(i, mock_rollout_response.text)
+
+        risks, summary, validated = g._judge_risks(r, validate=False)
+
+        assert all(isinstance(risk, Risk) for risk in risks)
+        assert [risk.to_dict() for risk in risks] == g._run_judgment(r).risks
+        assert summary is None
+        assert validated is False
+
+    def test_result_from_risks_produces_analysis_result(self, mock_rollout_response):
+        """_result_from_risks builds the AnalysisResult from Risk objects."""
+        from gremlin.core.stages import IdeationResult, RolloutResult, UnderstandingResult
 
         g = Gremlin()
         u = UnderstandingResult("checkout", ["payments"], "quick", 80)
         i = IdeationResult(u, {"universal": []}, 5)
         r = RolloutResult(i, mock_rollout_response.text)
-        j = JudgmentResult(
-            rollout=r,
-            risks=[{
-                "severity": "CRITICAL", "confidence": 95,
-                "scenario": "What if payment fails?", "impact": "Order lost",
-                "domains": ["payments"], "title": "Payment Failure",
-            }],
-        )
+        risks = [
+            Risk(
+                severity="CRITICAL",
+                confidence=95,
+                scenario="What if payment fails?",
+                impact="Order lost",
+                domains=["payments"],
+                title="Payment Failure",
+            )
+        ]
 
-        result = g._build_result(j, raw_response=mock_rollout_response.text)
+        result = g._result_from_risks(r, risks)
 
         assert result.scope == "checkout"
         assert len(result.risks) == 1
@@ -581,6 +751,7 @@ class TestGremlinStageMethods:
         assert result.risks[0].title == "Payment Failure"
         assert result.pattern_count == 5
         assert result.matched_domains == ["payments"]
+        assert result.raw_response == mock_rollout_response.text
 
 
 class TestImportAPI:
@@ -714,8 +885,9 @@ class TestPipelineStagesIntegration:
         assert all(d["severity"] in ("CRITICAL", "HIGH", "MEDIUM", "LOW") for d in j.risks)
         assert all(d["scenario"] for d in j.risks)
 
-        # _build_result converts JudgmentResult → public AnalysisResult
-        result = g._build_result(j, raw_response=r.raw_response)
+        # _result_from_risks builds the public AnalysisResult from the risks
+        risks, _, _ = g._judge_risks(r, validate=False)
+        result = g._result_from_risks(r, risks)
         assert isinstance(result, AnalysisResult)
         assert result.scope == "user login with password"
         assert result.matched_domains == u.matched_domains
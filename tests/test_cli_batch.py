@@ -0,0 +1,82 @@
+"""Tests for `gremlin review --batch`."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from gremlin.cli import app
+from gremlin.llm.base import LLMResponse
+
+runner = CliRunner()
+
+
+def _mock_provider() -> MagicMock:
+    provider = MagicMock()
+    provider.complete.side_effect = lambda system, user: LLMResponse(
+        text=f"What if it fails? ({user.splitlines()[0]})", model="test", provider="test"
+    )
+    return provider
+
+
+class TestReviewBatch:
+    """Tests for batch review mode."""
+
+    @patch("gremlin.cli.get_provider")
+    def test_batch_writes_one_record_per_scope(self, mock_get_provider, tmp_path):
+        """Plain and JSONL lines each produce a JSON result record."""
+        mock_get_provider.return_value = _mock_provider()
+        batch = tmp_path / "scopes.txt"
+        batch.write_text(
+            "checkout flow\n"
+            "# comment\n"
+            "\n"
+            '{"scope": "login", "context": "OAuth via Google"}\n'
+        )
+        results = tmp_path / "results.jsonl"
+
+        result = runner.invoke(
+            app, ["review", "--batch", str(batch), "--output-jsonl", str(results)]
+        )
+
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in results.read_text().splitlines()]
+        assert sorted(r["scope"] for r in records) == ["checkout flow", "login"]
+        assert all("What if" in r["response"] for r in records)
+
+    @patch("gremlin.cli.get_provider")
+    def test_batch_resume_skips_finished_scopes(self, mock_get_provider, tmp_path):
+        """A rerun against the same output file only analyzes new scopes."""
+        provider = _mock_provider()
+        mock_get_provider.return_value = provider
+        batch = tmp_path / "scopes.txt"
+        results = tmp_path / "results.jsonl"
+        args = ["review", "--batch", str(batch), "--output-jsonl", str(results), "--no-cache"]
+
+        batch.write_text("checkout flow\n")
+        runner.invoke(app, args)
+        batch.write_text("checkout flow\nfile upload\n")
+        runner.invoke(app, args)
+
+        assert provider.complete.call_count == 2
+        assert len(results.read_text().splitlines()) == 2
+
+    def test_scope_and_batch_are_exclusive(self, tmp_path):
+        """Passing both a scope and --batch is an error."""
+        batch = tmp_path / "scopes.txt"
+        batch.write_text("checkout\n")
+
+        result = runner.invoke(app, ["review", "login", "--batch", str(batch)])
+
+        assert result.exit_code == 1
+
+    def test_batch_rejects_single_scope_output_options(self, tmp_path):
+        """Options that only affect single-scope output are refused with --batch."""
+        batch = tmp_path / "scopes.txt"
+        batch.write_text("checkout\n")
+
+        for extra in (["--stream"], ["--parallel"], ["--output", "md"]):
+            result = runner.invoke(app, ["review", "--batch", str(batch), *extra])
+
+            assert result.exit_code == 2, extra
+            assert "not supported with --batch" in result.output
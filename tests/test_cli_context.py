@@ -0,0 +1,45 @@
+"""Tests for CLI --context resolution."""
+
+import io
+
+from gremlin.cli import resolve_context
+
+
+class TestResolveContext:
+    """Tests for resolve_context."""
+
+    def test_file_under_limit_is_unchanged(self, tmp_path):
+        """Small context files are returned whole (stripped)."""
+        path = tmp_path / "ctx.txt"
+        path.write_text("  def checkout(): ...\n")
+
+        assert resolve_context(f"@{path}", max_chars=100) == "def checkout(): ..."
+
+    def test_file_over_limit_keeps_head_and_tail(self, tmp_path, capsys):
+        """Oversized files are cut in the middle with a marker and a warning."""
+        path = tmp_path / "big.diff"
+        path.write_text("HEAD" + "x" * 1000 + "TAIL")
+
+        context = resolve_context(f"@{path}", max_chars=100)
+
+        assert context.startswith("HEAD")
+        assert context.endswith("TAIL")
+        assert "[... 908 characters omitted ...]" in context
+        assert "omitted 908" in capsys.readouterr().err
+
+    def test_stdin_over_limit(self, monkeypatch, capsys):
+        """Piped stdin is read incrementally and truncated the same way."""
+        monkeypatch.setattr("sys.stdin", io.StringIO("a" * 50 + "b" * 200_000 + "c" * 50))
+
+        context = resolve_context("-", max_chars=100)
+
+        assert context.startswith("a" * 50)
+        assert context.endswith("c" * 50)
+        assert "b" * 51 not in context
+
+    def test_limit_disabled(self, tmp_path):
+        """max_chars=0 keeps everything."""
+        path = tmp_path / "big.diff"
+        path.write_text("y" * 5000)
+
+        assert resolve_context(f"@{path}", max_chars=0) == "y" * 5000
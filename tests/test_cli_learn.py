@@ -0,0 +1,85 @@
+"""Tests for `gremlin learn`."""
+
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+from gremlin.cli import _to_what_if, app
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def incidents_dir(tmp_path, monkeypatch):
+    """Point learn at a temporary patterns tree instead of the package's."""
+    patterns_dir = tmp_path / "patterns"
+    incidents = patterns_dir / "incidents"
+    monkeypatch.setattr("gremlin.cli.PATTERNS_DIR", patterns_dir)
+    monkeypatch.setattr("gremlin.cli.INCIDENTS_DIR", incidents)
+    return incidents
+
+
+class TestLearn:
+    """Tests for the learn command."""
+
+    def test_learn_adds_domain_pattern(self, incidents_dir):
+        """A new pattern is written under its domain."""
+        result = runner.invoke(
+            app, ["learn", "Token refresh raced with logout", "--domain", "auth", "-s", "acme"]
+        )
+
+        assert result.exit_code == 0
+        data = yaml.safe_load((incidents_dir / "acme.yaml").read_text())
+        assert data["domain_specific"]["auth"]["patterns"] == [
+            "What if token refresh raced with logout?"
+        ]
+
+    def test_duplicate_pattern_skips_rewrite(self, incidents_dir):
+        """Learning the same pattern again leaves the file untouched."""
+        args = ["learn", "Upload retried twice", "-s", "acme"]
+        runner.invoke(app, args)
+        target = incidents_dir / "acme.yaml"
+        before = target.stat().st_mtime_ns
+
+        result = runner.invoke(app, args)
+
+        assert result.exit_code == 0
+        assert "already" in result.output
+        assert target.stat().st_mtime_ns == before
+
+    def test_learn_from_file(self, incidents_dir, tmp_path):
+        """--from-file adds each new incident once, keeping file order."""
+        incidents_file = tmp_path / "incidents.txt"
+        incidents_file.write_text(
+            "# postmortems\nCache served stale prices\n\nQueue drained twice\n"
+            "Cache served stale prices\n"
+        )
+
+        result = runner.invoke(
+            app, ["learn", "--from-file", str(incidents_file), "-s", "acme"]
+        )
+
+        assert result.exit_code == 0
+        assert "Added 2 patterns" in result.output
+        data = yaml.safe_load((incidents_dir / "acme.yaml").read_text())
+        assert data["universal"][0]["patterns"] == [
+            "What if cache served stale prices?",
+            "What if queue drained twice?",
+        ]
+
+    def test_learn_requires_description_or_file(self, incidents_dir):
+        """learn without input fails with a usage error."""
+        result = runner.invoke(app, ["learn"])
+
+        assert result.exit_code == 1
+        assert "--from-file" in result.output
+
+
+class TestToWhatIf:
+    """Tests for converting incident descriptions to patterns."""
+
+    def test_trailing_punctuation_collapses(self):
+        """Repeated "?" and a "." before "?" collapse to one "?"."""
+        assert _to_what_if("Upload failed.") == "What if upload failed?"
+        assert _to_what_if("Who retried?? Nobody?") == "What if who retried? Nobody?"
+        assert _to_what_if("What if the queue stalls?") == "What if the queue stalls?"
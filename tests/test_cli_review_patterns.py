@@ -0,0 +1,108 @@
+"""Tests for project and custom pattern files in `gremlin review`."""
+
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from gremlin import cli
+from gremlin.cli import app
+from gremlin.llm.base import LLMConfig, LLMResponse
+
+runner = CliRunner()
+
+PROJECT_PATTERNS = """\
+universal:
+  - category: Project Rules
+    patterns:
+      - "What if the ledger export runs twice?"
+"""
+
+
+def _provider() -> MagicMock:
+    provider = MagicMock()
+    provider.config = LLMConfig(provider="test", model="test-model")
+    provider.complete.return_value = LLMResponse(text="ok", model="test", provider="test")
+    return provider
+
+
+class TestReviewPatternFiles:
+    """Tests for --patterns and .gremlin/patterns.yaml."""
+
+    def test_missing_custom_patterns_file(self, tmp_path):
+        """A --patterns path that does not exist is an error."""
+        missing = tmp_path / "nope.yaml"
+
+        result = runner.invoke(app, ["review", "checkout", "--patterns", str(missing)])
+
+        assert result.exit_code == 1
+        assert "Custom patterns file not found" in result.output
+
+    @patch("gremlin.cli.get_provider")
+    def test_project_patterns_are_merged(self, mock_get_provider, tmp_path, monkeypatch):
+        """.gremlin/patterns.yaml in the working directory reaches the prompt."""
+        provider = _provider()
+        mock_get_provider.return_value = provider
+        (tmp_path / ".gremlin").mkdir()
+        (tmp_path / ".gremlin" / "patterns.yaml").write_text(PROJECT_PATTERNS)
+        monkeypatch.chdir(tmp_path)
+
+        result = runner.invoke(app, ["review", "checkout", "-o", "md", "--no-cache"])
+
+        assert result.exit_code == 0
+        system_prompt = provider.complete.call_args[0][0]
+        assert "ledger export runs twice" in system_prompt
+
+    @patch("gremlin.cli.get_provider")
+    def test_without_project_patterns(self, mock_get_provider, tmp_path, monkeypatch):
+        """No .gremlin/patterns.yaml is not an error."""
+        mock_get_provider.return_value = _provider()
+        monkeypatch.chdir(tmp_path)
+
+        result = runner.invoke(app, ["review", "checkout", "-o", "md", "--no-cache"])
+
+        assert result.exit_code == 0
+        assert "Warning" not in result.output
+
+
+class TestParallelReview:
+    """Tests for review --parallel."""
+
+    @patch("gremlin.cli.get_provider")
+    def test_one_request_per_pattern_group(self, mock_get_provider):
+        """Each matched domain and the universal patterns get their own request."""
+        provider = _provider()
+        provider.complete.side_effect = lambda system, user: LLMResponse(
+            text=f"part {len(system)}", model="test", provider="test"
+        )
+        mock_get_provider.return_value = provider
+
+        result = runner.invoke(
+            app,
+            ["review", "checkout payment with login session", "-o", "md", "--parallel",
+             "--no-cache"],
+        )
+
+        assert result.exit_code == 0
+        systems = [call.args[0] for call in provider.complete.call_args_list]
+        assert len(systems) == 3  # universal + auth + payments
+        assert sum("payments:" in system for system in systems) == 1
+        assert sum("auth:" in system for system in systems) == 1
+        for system in systems:
+            assert f"part {len(system)}" in result.output
+
+
+class TestLazyConsole:
+    """Tests for creating the rich Console only when something is printed."""
+
+    @patch("gremlin.cli.get_provider")
+    def test_md_review_never_creates_console(self, mock_get_provider, monkeypatch):
+        """A successful `-o md` review prints without rich."""
+        mock_get_provider.return_value = _provider()
+        lazy_console = cli._LazyConsole()
+        monkeypatch.setattr(cli, "console", lazy_console)
+
+        result = runner.invoke(app, ["review", "checkout", "-o", "md", "--no-cache"])
+
+        assert result.exit_code == 0
+        assert "ok" in result.output
+        assert lazy_console._console is None
@@ -7,7 +7,7 @@ import pytest
 from typer.testing import CliRunner
 
 from gremlin.cli import app
-from gremlin.llm.base import LLMResponse
+from gremlin.llm.base import LLMConfig, LLMResponse
 
 runner = CliRunner()
 
@@ -47,6 +47,15 @@ class TestUnderstandCommand:
         assert "matched_domains" in data
         assert "version" in data
 
+    def test_understand_overwrites_artifact_cleanly(self, tmp_run_dir):
+        """Re-running a stage replaces its artifact and leaves no temp files."""
+        runner.invoke(app, ["understand", "checkout", "--run-dir", str(tmp_run_dir)])
+        runner.invoke(app, ["understand", "auth", "--run-dir", str(tmp_run_dir)])
+
+        data = json.loads((tmp_run_dir / "understanding.json").read_text())
+        assert data["scope"] == "auth"
+        assert [p.name for p in tmp_run_dir.iterdir()] == ["understanding.json"]
+
     def test_understand_detects_payments_domain(self, tmp_run_dir):
         runner.invoke(
             app, ["understand", "stripe checkout", "--run-dir", str(tmp_run_dir)]
@@ -68,6 +77,19 @@ class TestUnderstandCommand:
         data = json.loads((tmp_run_dir / "understanding.json").read_text())
         assert data["threshold"] == 70
 
+    def test_understand_limits_file_context(self, tmp_run_dir, tmp_path):
+        context_file = tmp_path / "diff.txt"
+        context_file.write_text("HEAD" + "x" * 1000 + "TAIL")
+        runner.invoke(
+            app,
+            ["understand", "auth", "--context", f"@{context_file}", "--max-context", "100",
+             "--run-dir", str(tmp_run_dir)],
+        )
+        data = json.loads((tmp_run_dir / "understanding.json").read_text())
+        assert data["context"].startswith("HEAD")
+        assert data["context"].endswith("TAIL")
+        assert len(data["context"]) < 200
+
     def test_understand_no_llm_call(self, tmp_run_dir):
         """understand stage must not make any LLM calls."""
         with patch("gremlin.api.get_provider") as mock_get_provider:
@@ -132,6 +154,26 @@ class TestRolloutCommand:
 
         assert mock_provider.complete.call_count == 1
 
+    @patch("gremlin.api.get_provider")
+    def test_rollout_reuses_cached_response(self, mock_get_provider, tmp_run_dir):
+        mock_provider = Mock()
+        mock_provider.config = LLMConfig(provider="anthropic", model="claude-sonnet-4-20250514")
+        mock_provider.complete.return_value = _make_llm_response(SAMPLE_LLM_RESPONSE)
+        mock_get_provider.return_value = mock_provider
+
+        runner.invoke(app, ["understand", "checkout", "--run-dir", str(tmp_run_dir)])
+        runner.invoke(app, ["ideate", "--run-dir", str(tmp_run_dir)])
+        runner.invoke(app, ["rollout", "--run-dir", str(tmp_run_dir)])
+        result = runner.invoke(app, ["rollout", "--run-dir", str(tmp_run_dir)])
+
+        assert result.exit_code == 0
+        assert mock_provider.complete.call_count == 1
+        data = json.loads((tmp_run_dir / "results.json").read_text())
+        assert data["raw_response"] == SAMPLE_LLM_RESPONSE
+
+        runner.invoke(app, ["rollout", "--run-dir", str(tmp_run_dir), "--no-cache"])
+        assert mock_provider.complete.call_count == 2
+
     def test_rollout_fails_without_scenarios(self, tmp_run_dir):
         result = runner.invoke(app, ["rollout", "--run-dir", str(tmp_run_dir)])
         assert result.exit_code == 1
@@ -171,7 +213,7 @@ class TestJudgeCommand:
         assert data["risks"][0]["confidence"] == 95
 
     def test_judge_validate_makes_second_llm_call(self, tmp_run_dir):
-        # judge --validate sets g._provider via gremlin.cli.get_provider
+        # judge --validate gets its provider from gremlin.cli.get_provider
         self._setup_results(tmp_run_dir)
         with patch("gremlin.cli.get_provider") as mock_get_provider:
             mock_provider = Mock()
@@ -188,6 +230,31 @@ class TestJudgeCommand:
         assert result.exit_code == 1
 
 
+class TestPipelineCommand:
+    @patch("gremlin.api.get_provider")
+    def test_pipeline_matches_staged_run(self, mock_get_provider, tmp_path):
+        mock_provider = Mock()
+        mock_provider.complete.return_value = _make_llm_response(SAMPLE_LLM_RESPONSE)
+        mock_get_provider.return_value = mock_provider
+        staged, piped = tmp_path / "staged", tmp_path / "piped"
+
+        runner.invoke(app, ["understand", "checkout", "--run-dir", str(staged)])
+        runner.invoke(app, ["ideate", "--run-dir", str(staged)])
+        runner.invoke(app, ["rollout", "--run-dir", str(staged), "--no-cache"])
+        runner.invoke(app, ["judge", "--run-dir", str(staged)])
+        result = runner.invoke(
+            app, ["pipeline", "checkout", "--run-dir", str(piped), "--no-cache"]
+        )
+
+        assert result.exit_code == 0
+        assert "1 risk(s)" in result.output
+        assert mock_provider.complete.call_count == 2  # One per run
+        for name in ("understanding.json", "scenarios.json", "results.json", "scores.json"):
+            assert json.loads((piped / name).read_text()) == json.loads(
+                (staged / name).read_text()
+            )
+
+
 class TestReviewCommandUnchanged:
     """Verify gremlin review behaviour is unchanged after v0.3 additions."""
 
@@ -0,0 +1,62 @@
+"""Tests for CLI --stream output."""
+
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from gremlin.cli import app
+from gremlin.llm.base import LLMConfig, LLMProvider, LLMResponse
+
+runner = CliRunner()
+
+RESPONSE = "### 🔴 CRITICAL (95%)\n\nWhat if payment fails after order created?"
+
+
+class ChunkedProvider(LLMProvider):
+    """Provider that streams its response in small chunks."""
+
+    def __init__(self):
+        super().__init__(LLMConfig(provider="test", model="test-model"))
+        self.chunks: list[str] = []
+
+    def complete(self, system_prompt, user_message, **kwargs):
+        return LLMResponse(text=RESPONSE, model="test-model", provider="test")
+
+    def stream(self, system_prompt, user_message, on_text, **kwargs):
+        for start in range(0, len(RESPONSE), 8):
+            chunk = RESPONSE[start:start + 8]
+            self.chunks.append(chunk)
+            on_text(chunk)
+        return self.complete(system_prompt, user_message)
+
+    def validate_config(self):
+        return True
+
+
+class TestStreamFlag:
+    """Tests for the --stream CLI flag."""
+
+    @patch("gremlin.cli.get_provider")
+    def test_stream_md_matches_blocking_output(self, mock_get_provider):
+        """Streamed markdown output equals the non-streamed output."""
+        provider = ChunkedProvider()
+        mock_get_provider.return_value = provider
+
+        streamed = runner.invoke(app, ["review", "checkout", "-o", "md", "--stream"])
+        blocking = runner.invoke(app, ["review", "checkout", "-o", "md", "--no-cache"])
+
+        assert streamed.exit_code == 0
+        assert len(provider.chunks) > 1
+        assert streamed.output == blocking.output == RESPONSE + "\n"
+
+    @patch("gremlin.cli.get_provider")
+    def test_stream_replays_cached_response(self, mock_get_provider):
+        """A cached response is printed whole without calling the provider."""
+        provider = ChunkedProvider()
+        mock_get_provider.return_value = provider
+        runner.invoke(app, ["review", "checkout", "-o", "md"])
+
+        result = runner.invoke(app, ["review", "checkout", "-o", "md", "--stream"])
+
+        assert provider.chunks == []
+        assert result.output == RESPONSE + "\n"
@@ -0,0 +1,140 @@
+"""Tests for the optional CLI daemon."""
+
+import os
+import shutil
+import socketserver
+import stat
+import sys
+import tempfile
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gremlin import __version__, cli, daemon
+from gremlin.integrations.agent_bridge import analyze_with_cli
+from gremlin.llm.base import LLMConfig, LLMResponse
+
+
+@pytest.fixture
+def socket_path(monkeypatch):
+    """Short socket path (AF_UNIX paths are limited to ~100 bytes)."""
+    directory = tempfile.mkdtemp(prefix="gd-")
+    path = os.path.join(directory, "d.sock")
+    monkeypatch.setenv("GREMLIN_DAEMON_SOCKET", path)
+    yield path
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def running_daemon(socket_path):
+    """Serve daemon requests from a background thread."""
+    server = socketserver.UnixStreamServer(socket_path, daemon._Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestDaemon:
+    """Tests for daemon client/server round trips."""
+
+    def test_no_daemon_falls_back(self, socket_path):
+        """Without a listening daemon the client reports None (run in-process)."""
+        assert daemon.run_via_daemon(["--version"]) is None
+        assert not daemon.is_running()
+
+    def test_command_runs_in_daemon(self, running_daemon):
+        """Output and exit code of a forwarded command are relayed."""
+        # The daemon runs on a thread of this process and redirects sys.stdout
+        # while serving, so collect output with run_captured, not capsys
+        assert daemon.is_running()
+
+        result = daemon.run_captured(["--version"])
+        assert result["exit_code"] == 0
+        assert f"gremlin version {__version__}" in result["stdout"]
+
+        result = daemon.run_captured(["patterns", "bogus"])
+        assert result["exit_code"] == 1
+        assert "Usage: gremlin patterns" in result["stdout"]
+
+    def test_agent_bridge_uses_daemon(self, running_daemon, monkeypatch):
+        """With GREMLIN_DAEMON=1, analyze_with_cli runs without spawning a process."""
+        monkeypatch.setenv("GREMLIN_DAEMON", "1")
+        provider = MagicMock()
+        provider.config = LLMConfig(provider="test", model="test-model")
+        provider.complete.return_value = LLMResponse(
+            text='{"risks": []}', model="test", provider="test"
+        )
+
+        with (
+            patch("gremlin.cli.get_provider", return_value=provider),
+            patch("subprocess.run", side_effect=AssertionError("spawned a process")),
+        ):
+            result = analyze_with_cli("checkout flow")
+
+        assert result == {"risks": []}
+
+    def test_output_is_streamed_as_frames(self, running_daemon):
+        """stdout and stderr arrive as separate frames, in the order written."""
+        frames = []
+
+        exit_code = daemon._run(
+            ["patterns", "bogus"], None, {"isatty": False},
+            lambda stream, text: frames.append((stream, text)),
+        )
+
+        assert exit_code == 1
+        stdout = "".join(text for stream, text in frames if stream == "stdout")
+        assert "Usage: gremlin patterns" in stdout
+
+    def test_entry_point_forwards_only_when_enabled(self, running_daemon, monkeypatch):
+        """The console script uses the daemon only with GREMLIN_DAEMON=1."""
+        monkeypatch.setattr(sys, "argv", ["gremlin", "--version"])
+        forwarded = MagicMock(wraps=daemon._run_command)
+        monkeypatch.setattr(daemon, "_run_command", forwarded)
+        relayed = []
+        monkeypatch.setattr(daemon, "_write_std", lambda stream, text: relayed.append(text))
+
+        with pytest.raises(SystemExit):
+            cli.app()
+        assert not forwarded.called
+
+        monkeypatch.setenv("GREMLIN_DAEMON", "1")
+        with pytest.raises(SystemExit) as exc_info:
+            cli.app()
+        assert forwarded.called
+        assert exc_info.value.code == 0
+        assert f"gremlin version {__version__}" in "".join(relayed)
+
+    def test_refuses_different_environment(self, monkeypatch):
+        """A client whose API key or settings differ is told to run in-process."""
+        monkeypatch.setenv("GREMLIN_MODEL", "claude-daemon-model")
+        client_env = {**daemon._env_fingerprint(), "GREMLIN_MODEL": "other"}
+        frames = []
+
+        daemon._run_command({"argv": ["--version"], "env": client_env}, frames.append)
+
+        assert len(frames) == 1
+        assert "GREMLIN_MODEL" in frames[0]["refused"]
+        assert "claude-daemon-model" not in frames[0]["refused"]
+
+    def test_socket_is_owner_only(self, socket_path, monkeypatch):
+        """serve() creates the socket with mode 0600."""
+        # serve() memoizes cli.get_provider; restore it afterwards
+        monkeypatch.setattr(cli, "get_provider", cli.get_provider)
+        thread = threading.Thread(target=daemon.serve, daemon=True)
+        thread.start()
+        try:
+            for _ in range(100):
+                if daemon.is_running():
+                    break
+                time.sleep(0.05)
+            mode = stat.S_IMODE(os.stat(socket_path).st_mode)
+        finally:
+            daemon.stop()
+            thread.join(5)
+
+        assert mode == 0o600
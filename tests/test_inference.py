@@ -1,7 +1,7 @@
 """Tests for domain inference."""
 
 
-from gremlin.core.inference import infer_domains
+from gremlin.core.inference import compact_keywords, infer_domains
 
 # Sample domain keywords for testing
 DOMAIN_KEYWORDS = {
@@ -52,3 +52,24 @@ class TestInferDomains:
         """Test that partial matches work (keyword in larger word)."""
         # "checkout" contains "checkout"
         assert "payments" in infer_domains("checkout-flow", DOMAIN_KEYWORDS)
+
+
+class TestCompactKeywords:
+    """Tests for compact_keywords function."""
+
+    def test_drops_keywords_containing_shorter_ones(self):
+        """Keywords that contain another keyword of the same domain are redundant."""
+        compacted = compact_keywords({"auth": ["auth", "authentication", "oauth", "login"]})
+        assert compacted == {"auth": ["auth", "login"]}
+
+    def test_lowercases_and_dedupes(self):
+        """Mixed-case keywords are lowercased so they can match lowered scopes."""
+        compacted = compact_keywords({"api": ["GraphQL", "graphql", "REST"]})
+        assert compacted == {"api": ["graphql", "rest"]}
+        assert infer_domains("graphql resolver", compacted) == ["api"]
+
+    def test_matching_unchanged(self):
+        """Compacted keywords infer the same domains as the originals."""
+        compacted = compact_keywords(DOMAIN_KEYWORDS)
+        for scope in ["checkout flow", "OAuth login", "s3 upload", "sql migration", "misc"]:
+            assert infer_domains(scope, compacted) == infer_domains(scope, DOMAIN_KEYWORDS)
@@ -0,0 +1,161 @@
+"""Tests for the on-disk LLM response cache."""
+
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from gremlin.cli import app
+from gremlin.core import llm_cache
+from gremlin.core.cache import get_cache_dir, write_atomic
+from gremlin.llm.base import LLMConfig, LLMResponse
+
+runner = CliRunner()
+
+CONFIG = LLMConfig(provider="anthropic", model="claude-sonnet-4-20250514")
+
+
+class TestResponseKey:
+    """Tests for cache key construction."""
+
+    def test_same_request_same_key(self):
+        """Identical requests map to the same key."""
+        assert llm_cache.response_key(CONFIG, "sys", "user") == llm_cache.response_key(
+            CONFIG, "sys", "user"
+        )
+
+    def test_key_covers_prompts_and_model(self):
+        """Changing a prompt or the model changes the key."""
+        base = llm_cache.response_key(CONFIG, "sys", "user")
+        other_model = LLMConfig(provider="anthropic", model="claude-opus-4-5-20251101")
+
+        assert llm_cache.response_key(CONFIG, "sys", "other") != base
+        assert llm_cache.response_key(CONFIG, "other", "user") != base
+        assert llm_cache.response_key(other_model, "sys", "user") != base
+
+
+class TestGetPut:
+    """Tests for reading and writing cache entries."""
+
+    def test_round_trip(self):
+        """A stored response is returned for its key."""
+        llm_cache.put("abc", "### [HIGH] (90%)", "test-model")
+        assert llm_cache.get("abc") == "### [HIGH] (90%)"
+
+    def test_missing_key(self):
+        """Unknown keys are a miss."""
+        assert llm_cache.get("missing") is None
+
+    def test_expired_entry(self):
+        """Entries older than the TTL are a miss and are deleted."""
+        with patch("gremlin.core.llm_cache.time.time", return_value=time.time() - 120):
+            llm_cache.put("old", "text", "test-model")
+
+        assert llm_cache.get("old", ttl=3600) == "text"
+        assert llm_cache.get("old", ttl=60) is None
+        assert llm_cache.get("old", ttl=3600) is None
+        assert not list((get_cache_dir() / "responses").iterdir())
+
+    def test_put_prunes_expired_and_oldest_entries(self):
+        """put() removes expired entries; past the count limit the oldest go first."""
+        responses = get_cache_dir() / "responses"
+        for age, key in ((300, "oldest"), (200, "older")):
+            llm_cache.put(key, "text", "test-model")
+            os.utime(responses / f"{key}.json", (time.time() - age,) * 2)
+
+        llm_cache.put("newest", "text", "test-model", ttl=250)
+
+        assert sorted(p.name for p in responses.iterdir()) == ["newest.json", "older.json"]
+
+        llm_cache.prune(max_entries=1)
+        assert [p.name for p in responses.iterdir()] == ["newest.json"]
+
+    def test_concurrent_writers_of_one_key(self):
+        """Threads storing the same key don't collide on the temp file."""
+        errors = []
+
+        def write() -> None:
+            try:
+                for _ in range(20):
+                    write_atomic(get_cache_dir() / "responses" / "same.json", b"{}")
+            except OSError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert [p.name for p in (get_cache_dir() / "responses").iterdir()] == ["same.json"]
+
+
+class TestReviewCache:
+    """Tests for response caching in the review command."""
+
+    @patch("gremlin.cli.get_provider")
+    def test_repeat_review_served_from_cache(self, mock_get_provider):
+        """A second identical review does not call the LLM; --no-cache does."""
+        mock_provider = MagicMock()
+        mock_provider.config = CONFIG
+        mock_provider.complete.return_value = LLMResponse(
+            text="What if payment fails?", model="test", provider="test"
+        )
+        mock_get_provider.return_value = mock_provider
+
+        first = runner.invoke(app, ["review", "checkout", "-o", "md"])
+        second = runner.invoke(app, ["review", "checkout", "-o", "md"])
+        assert mock_provider.complete.call_count == 1
+        assert second.output == first.output
+
+        runner.invoke(app, ["review", "checkout", "-o", "md", "--no-cache"])
+        assert mock_provider.complete.call_count == 2
+
+
+class TestCachedProvider:
+    """Tests for the caching provider wrapper."""
+
+    def _provider(self) -> MagicMock:
+        provider = MagicMock()
+        provider.config = CONFIG
+        provider.complete.return_value = LLMResponse(
+            text="cached text", model=CONFIG.model, provider="anthropic"
+        )
+        return provider
+
+    def test_second_call_is_a_hit(self):
+        """An identical request is answered without calling the provider."""
+        inner = self._provider()
+        cached = llm_cache.CachedProvider(inner)
+
+        cached.complete("sys", "user")
+        response = cached.complete("sys", "user")
+
+        assert inner.complete.call_count == 1
+        assert response.text == "cached text"
+        assert response.usage is None
+
+    def test_overrides_bypass_cache(self):
+        """Per-call overrides are not part of the key, so they skip the cache."""
+        inner = self._provider()
+        cached = llm_cache.CachedProvider(inner)
+
+        cached.complete("sys", "user", max_tokens=10)
+        cached.complete("sys", "user", max_tokens=10)
+
+        assert inner.complete.call_count == 2
+
+    def test_stream_hit_delivers_whole_text(self):
+        """A cached response reaches on_text in one piece."""
+        inner = self._provider()
+        cached = llm_cache.CachedProvider(inner)
+        cached.complete("sys", "user")
+        received = []
+
+        cached.stream("sys", "user", received.append)
+
+        assert received == ["cached text"]
+        inner.stream.assert_not_called()
@@ -4,7 +4,9 @@ from pathlib import Path
 
 from gremlin.core.patterns import (
     get_domain_keywords,
+    load_all_patterns,
     load_patterns,
+    merge_patterns,
     select_patterns,
 )
 
@@ -37,6 +39,25 @@ class TestLoadPatterns:
         assert "payments" in domains
         assert "file_upload" in domains
 
+    def test_load_patterns_returns_independent_copies(self, tmp_path):
+        """Repeat loads of an unchanged file can be mutated independently."""
+        path = tmp_path / "patterns.yaml"
+        path.write_text("universal: []\ndomain_specific: {}\n")
+
+        first = load_patterns(path)
+        first["universal"].append({"category": "Mutated"})
+
+        assert load_patterns(path) == {"universal": [], "domain_specific": {}}
+
+    def test_load_patterns_picks_up_file_changes(self, tmp_path):
+        """A modified file is re-parsed instead of served from memory."""
+        path = tmp_path / "patterns.yaml"
+        path.write_text("universal: []\n")
+        load_patterns(path)
+
+        path.write_text("universal: []\ndomain_specific: {auth: {}}\n")
+        assert load_patterns(path)["domain_specific"] == {"auth": {}}
+
 
 class TestGetDomainKeywords:
     """Tests for keyword extraction."""
@@ -78,3 +99,106 @@ class TestSelectPatterns:
         selected = select_patterns("checkout login", patterns, ["payments", "auth"])
         assert "payments" in selected["domain"]
         assert "auth" in selected["domain"]
+
+
+class TestMergePatterns:
+    """Tests for merging pattern dicts."""
+
+    def test_merge_deduplicates_case_insensitively(self):
+        """Keywords and patterns already present (ignoring case) are not re-added."""
+        base = {
+            "universal": [{"category": "Timing", "patterns": ["What if it runs twice?"]}],
+            "domain_specific": {"auth": {"keywords": ["Login"], "patterns": ["What if a?"]}},
+        }
+        additional = {
+            "universal": [
+                {"category": "Timing", "patterns": ["what if it runs twice? ", "What if late?"]},
+                {"category": "Data", "patterns": ["What if empty?"]},
+            ],
+            "domain_specific": {
+                "auth": {"keywords": ["login", "SSO", "sso"], "patterns": ["WHAT IF A?"]},
+            },
+        }
+
+        merged = merge_patterns(base, additional)
+
+        assert merged["universal"] == [
+            {"category": "Timing", "patterns": ["What if it runs twice?", "What if late?"]},
+            {"category": "Data", "patterns": ["What if empty?"]},
+        ]
+        assert merged["domain_specific"]["auth"] == {
+            "keywords": ["Login", "SSO"],
+            "patterns": ["What if a?"],
+        }
+
+
+class TestLoadAllPatternsCache:
+    """Tests for the on-disk merged-patterns cache."""
+
+    def _write_patterns(self, patterns_dir: Path, extra_pattern: str) -> None:
+        patterns_dir.mkdir(exist_ok=True)
+        (patterns_dir / "breaking.yaml").write_text(
+            "universal:\n"
+            "  - category: Input Validation\n"
+            "    patterns: ['What if input is empty?']\n"
+            "domain_specific: {}\n"
+        )
+        (patterns_dir / "extra.yaml").write_text(
+            "domain_specific:\n"
+            "  search:\n"
+            "    keywords: [search]\n"
+            f"    patterns: ['{extra_pattern}']\n"
+        )
+
+    def test_cache_written_and_reused(self, tmp_path, isolated_cache_dir):
+        """Second load is served from the cache with identical content."""
+        patterns_dir = tmp_path / "patterns"
+        self._write_patterns(patterns_dir, "What if index is stale?")
+
+        first = load_all_patterns(patterns_dir)
+        assert list(isolated_cache_dir.glob("patterns-*.pickle"))
+
+        second = load_all_patterns(patterns_dir)
+        assert second == first
+        assert second is not first
+
+    def test_cache_invalidated_on_file_change(self, tmp_path):
+        """Editing a pattern file is picked up on the next load."""
+        patterns_dir = tmp_path / "patterns"
+        self._write_patterns(patterns_dir, "What if index is stale?")
+        load_all_patterns(patterns_dir)
+
+        self._write_patterns(patterns_dir, "What if query times out?")
+        patterns = load_all_patterns(patterns_dir)
+        assert patterns["domain_specific"]["search"]["patterns"] == ["What if query times out?"]
+
+    def test_cache_disabled(self, tmp_path, isolated_cache_dir):
+        """use_cache=False neither reads nor writes the cache."""
+        patterns_dir = tmp_path / "patterns"
+        self._write_patterns(patterns_dir, "What if index is stale?")
+
+        load_all_patterns(patterns_dir, use_cache=False)
+        assert not isolated_cache_dir.exists()
+
+    def test_nested_files_merged_and_reserved_names_skipped(self, tmp_path):
+        """YAML files in subdirectories are merged; code-review.yaml and non-YAML are not."""
+        patterns_dir = tmp_path / "patterns"
+        self._write_patterns(patterns_dir, "What if index is stale?")
+        (patterns_dir / "incidents").mkdir()
+        (patterns_dir / "incidents" / "outage.yaml").write_text(
+            "universal:\n"
+            "  - category: Incidents\n"
+            "    patterns: ['What if the cache stampedes?']\n"
+        )
+        (patterns_dir / "code-review.yaml").write_text(
+            "universal:\n"
+            "  - category: Code\n"
+            "    patterns: ['What if the lock leaks?']\n"
+        )
+        (patterns_dir / "notes.txt").write_text("not patterns")
+
+        patterns = load_all_patterns(patterns_dir, use_cache=False)
+
+        categories = [cat["category"] for cat in patterns["universal"]]
+        assert categories == ["Input Validation", "Incidents"]
+        assert "search" in patterns["domain_specific"]
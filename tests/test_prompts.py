@@ -0,0 +1,43 @@
+"""Tests for prompt building."""
+
+from gremlin.core.prompts import build_prompt
+
+SELECTED = {
+    "universal": [{"category": "Timing", "patterns": ["What if it runs twice?"]}],
+    "domain": {"payments": ["What if the webhook arrives first?"]},
+}
+
+
+class TestBuildPrompt:
+    """Tests for build_prompt."""
+
+    def test_patterns_rendered_as_yaml(self):
+        """Selected patterns appear as YAML under the patterns heading."""
+        system, user = build_prompt("BASE", SELECTED, "checkout", "quick", 80)
+
+        assert system.startswith("BASE\n\n## Available Breaking Patterns\n")
+        assert "payments:\n  - What if the webhook arrives first?" in system
+        assert "**checkout**" in user
+
+    def test_repeated_selection_reuses_dump_and_tracks_changes(self):
+        """A repeated selection gives the same prompt; a changed one is re-dumped."""
+        first, _ = build_prompt("BASE", SELECTED, "checkout", "quick", 80)
+        again, _ = build_prompt("BASE", SELECTED, "refunds", "deep", 60)
+        changed = {**SELECTED, "domain": {"auth": ["What if the token expires?"]}}
+        other, _ = build_prompt("BASE", changed, "checkout", "quick", 80)
+
+        assert again == first
+        assert "What if the token expires?" in other
+        assert "webhook" not in other
+
+    def test_selection_key_keeps_types_and_ignores_key_order(self):
+        """Equal-looking selections with different key types get their own dump."""
+        reordered = {"domain": SELECTED["domain"], "universal": SELECTED["universal"]}
+        by_int = {"universal": [], "domain": {1: ["What if it is one?"]}}
+        by_str = {"universal": [], "domain": {"1": ["What if it is one?"]}}
+
+        assert build_prompt("BASE", reordered, "checkout", "quick", 80) == build_prompt(
+            "BASE", SELECTED, "checkout", "quick", 80
+        )
+        assert "1:" in build_prompt("BASE", by_int, "x", "quick", 80)[0]
+        assert "'1':" in build_prompt("BASE", by_str, "x", "quick", 80)[0]